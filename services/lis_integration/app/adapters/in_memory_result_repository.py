@@ -59,6 +59,31 @@ class InMemoryResultRepository(IResultRepository):
         results.sort(key=lambda r: r.created_at, reverse=True)
         return [copy.deepcopy(r) for r in results]
 
+    def list_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, statuses: list[ResultStatus]
+    ) -> list[Result]:
+        """List a sample's results in any of the given verification statuses."""
+        return [
+            r for r in self.list_by_sample(sample_id, tenant_id)
+            if r.verification_status in statuses
+        ]
+
+    def count_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, status: ResultStatus
+    ) -> int:
+        """Count a sample's results in a given verification status."""
+        return sum(
+            1 for r in self._results.values()
+            if r.sample_id == sample_id
+            and r.tenant_id == tenant_id
+            and r.verification_status == status
+        )
+
+    def exists_in_sample(self, result_id: str, sample_id: str, tenant_id: str) -> bool:
+        """Check that a result exists and belongs to a sample."""
+        result = self._results.get(result_id)
+        return result is not None and result.sample_id == sample_id and result.tenant_id == tenant_id
+
     def list_by_tenant(
         self,
         tenant_id: str,
@@ -163,6 +188,29 @@ class InMemoryResultRepository(IResultRepository):
         self._results[result_id] = copy.deepcopy(result)
         return copy.deepcopy(result)
 
+    def update_verification_status_bulk(
+        self,
+        result_ids: list[str],
+        tenant_id: str,
+        status: ResultStatus,
+        method: Optional[str] = None
+    ) -> int:
+        """Update the verification status of several results at once."""
+        now = datetime.utcnow()
+        updated = 0
+        for result_id in set(result_ids):
+            result = self._results.get(result_id)
+            if not result or result.tenant_id != tenant_id:
+                continue
+
+            result.verification_status = status
+            result.verification_method = method
+            if status in (ResultStatus.VERIFIED, ResultStatus.REJECTED):
+                result.verified_at = now
+            result.updated_at = now
+            updated += 1
+        return updated
+
     def update_upload_status(
         self,
         result_id: str,
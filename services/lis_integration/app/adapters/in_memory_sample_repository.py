@@ -99,6 +99,16 @@ class InMemorySampleRepository(ISampleRepository):
         self._samples[sample.id] = copy.deepcopy(sample)
         return copy.deepcopy(sample)
 
+    def update_status(self, sample_id: str, tenant_id: str, status: SampleStatus) -> bool:
+        """Set a sample's status in place."""
+        sample = self._samples.get(sample_id)
+        if not sample or sample.tenant_id != tenant_id:
+            return False
+
+        sample.status = status
+        sample.update_timestamp()
+        return True
+
     def delete(self, sample_id: str, tenant_id: str) -> bool:
         """Delete a sample, ensuring it belongs to the tenant."""
         sample = self._samples.get(sample_id)
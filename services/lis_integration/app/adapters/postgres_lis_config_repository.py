@@ -4,6 +4,7 @@ from sqlmodel import Session, select
 from typing import Optional
 import uuid
 
+from app.adapters.unit_of_work import commit
 from app.ports import ILISConfigRepository
 from app.models import LISConfig, IntegrationModel
 from app.exceptions import LISConfigNotFoundError
@@ -40,7 +41,7 @@ class PostgresLISConfigRepository(ILISConfigRepository):
             config.id = str(uuid.uuid4())
 
         self._session.add(config)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(config)
         return config
 
@@ -107,7 +108,7 @@ class PostgresLISConfigRepository(ILISConfigRepository):
             existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
@@ -118,5 +119,5 @@ class PostgresLISConfigRepository(ILISConfigRepository):
             return False
 
         self._session.delete(config)
-        self._session.commit()
+        commit(self._session)
         return True
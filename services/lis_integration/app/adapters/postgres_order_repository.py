@@ -4,6 +4,7 @@ from sqlmodel import Session, select
 from typing import Optional
 import uuid
 
+from app.adapters.unit_of_work import commit
 from app.ports import IOrderRepository
 from app.models import Order, OrderStatus, OrderPriority
 from app.exceptions import OrderNotFoundError
@@ -34,7 +35,7 @@ class PostgresOrderRepository(IOrderRepository):
             order.id = str(uuid.uuid4())
 
         self._session.add(order)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(order)
         return order
 
@@ -108,7 +109,7 @@ class PostgresOrderRepository(IOrderRepository):
             existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
@@ -122,7 +123,7 @@ class PostgresOrderRepository(IOrderRepository):
         order.update_timestamp()
 
         self._session.add(order)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(order)
         return order
 
@@ -133,5 +134,5 @@ class PostgresOrderRepository(IOrderRepository):
             return False
 
         self._session.delete(order)
-        self._session.commit()
+        commit(self._session)
         return True
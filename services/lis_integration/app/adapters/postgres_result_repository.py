@@ -1,10 +1,12 @@
 """PostgreSQL implementation of result repository."""
 
+from sqlalchemy import exists, func, update
 from sqlmodel import Session, select
 from typing import Optional
 from datetime import datetime
 import uuid
 
+from app.adapters.unit_of_work import commit
 from app.ports import IResultRepository
 from app.models import Result, ResultStatus, UploadStatus
 from app.exceptions import DuplicateResultError, ResultNotFoundError, ResultImmutableError
@@ -48,7 +50,7 @@ class PostgresResultRepository(IResultRepository):
             result.id = str(uuid.uuid4())
 
         self._session.add(result)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(result)
         return result
 
@@ -76,6 +78,37 @@ class PostgresResultRepository(IResultRepository):
         ).order_by(Result.created_at.desc())
         return list(self._session.exec(statement).all())
 
+    def list_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, statuses: list[ResultStatus]
+    ) -> list[Result]:
+        """List a sample's results in any of the given verification statuses."""
+        statement = select(Result).where(
+            Result.sample_id == sample_id,
+            Result.verification_status.in_(statuses),
+            Result.tenant_id == tenant_id
+        ).order_by(Result.created_at.desc())
+        return list(self._session.exec(statement).all())
+
+    def count_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, status: ResultStatus
+    ) -> int:
+        """Count a sample's results in a given verification status."""
+        statement = select(func.count()).select_from(Result).where(
+            Result.sample_id == sample_id,
+            Result.verification_status == status,
+            Result.tenant_id == tenant_id
+        )
+        return self._session.exec(statement).one()
+
+    def exists_in_sample(self, result_id: str, sample_id: str, tenant_id: str) -> bool:
+        """Check that a result exists and belongs to a sample, without loading it."""
+        statement = select(exists().where(
+            Result.id == result_id,
+            Result.sample_id == sample_id,
+            Result.tenant_id == tenant_id
+        ))
+        return self._session.exec(statement).one()
+
     def list_by_tenant(
         self,
         tenant_id: str,
@@ -183,7 +216,7 @@ class PostgresResultRepository(IResultRepository):
             existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
@@ -206,10 +239,38 @@ class PostgresResultRepository(IResultRepository):
         result.update_timestamp()
 
         self._session.add(result)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(result)
         return result
 
+    def update_verification_status_bulk(
+        self,
+        result_ids: list[str],
+        tenant_id: str,
+        status: ResultStatus,
+        method: Optional[str] = None
+    ) -> int:
+        """Update the verification status of several results with one UPDATE."""
+        if not result_ids:
+            return 0
+
+        now = datetime.utcnow()
+        values = {
+            "verification_status": status,
+            "verification_method": method,
+            "updated_at": now,
+        }
+        if status in (ResultStatus.VERIFIED, ResultStatus.REJECTED):
+            values["verified_at"] = now
+
+        updated = self._session.exec(
+            update(Result)
+            .where(Result.tenant_id == tenant_id, Result.id.in_(set(result_ids)))
+            .values(**values)
+        )
+        commit(self._session)
+        return updated.rowcount
+
     def update_upload_status(
         self,
         result_id: str,
@@ -236,7 +297,7 @@ class PostgresResultRepository(IResultRepository):
         result.update_timestamp()
 
         self._session.add(result)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(result)
         return result
 
@@ -247,5 +308,5 @@ class PostgresResultRepository(IResultRepository):
             return False
 
         self._session.delete(result)
-        self._session.commit()
+        commit(self._session)
         return True
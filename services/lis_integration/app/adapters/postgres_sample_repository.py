@@ -1,10 +1,12 @@
 """PostgreSQL implementation of sample repository."""
 
+from sqlalchemy import update
 from sqlmodel import Session, select
 from typing import Optional
 from datetime import datetime
 import uuid
 
+from app.adapters.unit_of_work import commit
 from app.ports import ISampleRepository
 from app.models import Sample, SampleStatus
 from app.exceptions import DuplicateSampleError, SampleNotFoundError
@@ -46,7 +48,7 @@ class PostgresSampleRepository(ISampleRepository):
             sample.id = str(uuid.uuid4())
 
         self._session.add(sample)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(sample)
         return sample
 
@@ -130,10 +132,20 @@ class PostgresSampleRepository(ISampleRepository):
             existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
+    def update_status(self, sample_id: str, tenant_id: str, status: SampleStatus) -> bool:
+        """Set a sample's status with a single UPDATE (no read first)."""
+        updated = self._session.exec(
+            update(Sample)
+            .where(Sample.id == sample_id, Sample.tenant_id == tenant_id)
+            .values(status=status, updated_at=datetime.utcnow())
+        )
+        commit(self._session)
+        return updated.rowcount > 0
+
     def delete(self, sample_id: str, tenant_id: str) -> bool:
         """Delete a sample, ensuring it belongs to the tenant."""
         sample = self.get_by_id(sample_id, tenant_id)
@@ -141,5 +153,5 @@ class PostgresSampleRepository(ISampleRepository):
             return False
 
         self._session.delete(sample)
-        self._session.commit()
+        commit(self._session)
         return True
@@ -0,0 +1,19 @@
+"""Committing repository writes, unless a unit of work groups them."""
+
+from sqlmodel import Session
+
+# session.info key set while a unit of work is open on the session, e.g. the
+# verification service's single_commit while it records a review decision
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def commit(session: Session) -> None:
+    """
+    Commit a repository write, or only flush it inside a unit of work.
+
+    The unit of work commits or rolls back all of its writes when it ends.
+    """
+    if session.info.get(UNIT_OF_WORK_KEY):
+        session.flush()
+    else:
+        session.commit()
@@ -55,7 +55,8 @@ class Result(SQLModel, table=True):
     __tablename__ = "results"
     __table_args__ = (
         Index('ix_results_tenant_external_lis_result_id', 'tenant_id', 'external_lis_result_id', unique=True),
-        Index('ix_results_sample_id', 'sample_id'),
+        # Serves per-sample lookups as well as counts by verification status
+        Index('ix_results_sample_status', 'sample_id', 'verification_status'),
         Index('ix_results_tenant_status', 'tenant_id', 'verification_status'),
         Index('ix_results_upload_status', 'upload_status'),
     )
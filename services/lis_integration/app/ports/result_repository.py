@@ -73,6 +73,55 @@ class IResultRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def list_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, statuses: list[ResultStatus]
+    ) -> list[Result]:
+        """
+        List a sample's results in any of the given verification statuses.
+
+        Args:
+            sample_id: Sample identifier
+            tenant_id: Tenant identifier for isolation
+            statuses: Verification statuses to include
+
+        Returns:
+            List of matching results for the sample
+        """
+        pass
+
+    @abc.abstractmethod
+    def count_by_sample_and_status(
+        self, sample_id: str, tenant_id: str, status: ResultStatus
+    ) -> int:
+        """
+        Count a sample's results in a given verification status.
+
+        Args:
+            sample_id: Sample identifier
+            tenant_id: Tenant identifier for isolation
+            status: Verification status to count
+
+        Returns:
+            Number of matching results
+        """
+        pass
+
+    @abc.abstractmethod
+    def exists_in_sample(self, result_id: str, sample_id: str, tenant_id: str) -> bool:
+        """
+        Check that a result exists and belongs to a sample, without loading it.
+
+        Args:
+            result_id: Result identifier
+            sample_id: Sample identifier
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            True if the result exists in the sample
+        """
+        pass
+
     @abc.abstractmethod
     def list_by_tenant(
         self,
@@ -185,6 +234,28 @@ class IResultRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def update_verification_status_bulk(
+        self,
+        result_ids: list[str],
+        tenant_id: str,
+        status: ResultStatus,
+        method: Optional[str] = None
+    ) -> int:
+        """
+        Update the verification status of several results in one statement.
+
+        Args:
+            result_ids: Result identifiers
+            tenant_id: Tenant identifier
+            status: New verification status
+            method: Optional verification method ("auto" or "manual")
+
+        Returns:
+            Number of results updated (results not found in the tenant are skipped)
+        """
+        pass
+
     @abc.abstractmethod
     def update_upload_status(
         self,
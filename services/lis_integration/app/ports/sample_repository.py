@@ -104,6 +104,21 @@ class ISampleRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def update_status(self, sample_id: str, tenant_id: str, status: SampleStatus) -> bool:
+        """
+        Set a sample's status without loading it first.
+
+        Args:
+            sample_id: Sample identifier
+            tenant_id: Tenant identifier for isolation
+            status: New sample status
+
+        Returns:
+            True if updated, False if not found
+        """
+        pass
+
     @abc.abstractmethod
     def delete(self, sample_id: str, tenant_id: str) -> bool:
         """
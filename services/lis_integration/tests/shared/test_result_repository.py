@@ -0,0 +1,130 @@
+"""Shared contract tests for IResultRepository (run against in-memory and PostgreSQL)."""
+
+import uuid
+
+from app.models import Result, ResultStatus
+
+
+TEST_TENANT_ID = "test-tenant-123"
+OTHER_TENANT_ID = "other-tenant-456"
+
+
+def _create_result(repo, sample_id, status=ResultStatus.NEEDS_REVIEW, tenant_id=TEST_TENANT_ID):
+    """Create a result in a sample with the given verification status."""
+    return repo.create(Result(
+        tenant_id=tenant_id,
+        sample_id=sample_id,
+        external_lis_result_id=f"LIS-{uuid.uuid4()}",
+        test_code="GLU",
+        test_name="Glucose",
+        value="95",
+        verification_status=status,
+    ))
+
+
+class TestResultRepositorySampleQueries:
+    """Tests for the per-sample status queries used by manual review."""
+
+    def test_list_by_sample_and_status(self, result_repository):
+        """Test that only the sample's results in the given statuses are listed."""
+        sample_id = str(uuid.uuid4())
+        pending = _create_result(result_repository, sample_id)
+        rejected = _create_result(result_repository, sample_id, ResultStatus.REJECTED)
+        _create_result(result_repository, sample_id, ResultStatus.VERIFIED)
+        _create_result(result_repository, str(uuid.uuid4()))
+
+        listed = result_repository.list_by_sample_and_status(
+            sample_id, TEST_TENANT_ID, [ResultStatus.NEEDS_REVIEW, ResultStatus.REJECTED]
+        )
+
+        assert {r.id for r in listed} == {pending.id, rejected.id}
+
+    def test_list_by_sample_and_status_is_tenant_scoped(self, result_repository):
+        """Test that another tenant's results in the same sample are not listed."""
+        sample_id = str(uuid.uuid4())
+        _create_result(result_repository, sample_id, tenant_id=OTHER_TENANT_ID)
+
+        assert result_repository.list_by_sample_and_status(
+            sample_id, TEST_TENANT_ID, [ResultStatus.NEEDS_REVIEW]
+        ) == []
+
+    def test_count_by_sample_and_status(self, result_repository):
+        """Test counting a sample's results in one status, within the tenant."""
+        sample_id = str(uuid.uuid4())
+        _create_result(result_repository, sample_id)
+        _create_result(result_repository, sample_id)
+        _create_result(result_repository, sample_id, ResultStatus.VERIFIED)
+        _create_result(result_repository, sample_id, tenant_id=OTHER_TENANT_ID)
+
+        assert result_repository.count_by_sample_and_status(
+            sample_id, TEST_TENANT_ID, ResultStatus.NEEDS_REVIEW
+        ) == 2
+        assert result_repository.count_by_sample_and_status(
+            sample_id, TEST_TENANT_ID, ResultStatus.REJECTED
+        ) == 0
+
+    def test_exists_in_sample(self, result_repository):
+        """Test that a result only exists in its own sample and tenant."""
+        sample_id = str(uuid.uuid4())
+        result = _create_result(result_repository, sample_id)
+
+        assert result_repository.exists_in_sample(result.id, sample_id, TEST_TENANT_ID)
+        assert not result_repository.exists_in_sample(result.id, str(uuid.uuid4()), TEST_TENANT_ID)
+        assert not result_repository.exists_in_sample(result.id, sample_id, OTHER_TENANT_ID)
+        assert not result_repository.exists_in_sample("missing", sample_id, TEST_TENANT_ID)
+
+
+class TestResultRepositoryBulkStatusUpdate:
+    """Tests for update_verification_status_bulk."""
+
+    def test_updates_results_and_returns_affected_count(self, result_repository):
+        """Test that every listed result is updated and counted once."""
+        sample_id = str(uuid.uuid4())
+        first = _create_result(result_repository, sample_id)
+        second = _create_result(result_repository, sample_id)
+        untouched = _create_result(result_repository, sample_id)
+
+        updated = result_repository.update_verification_status_bulk(
+            [first.id, second.id, first.id], TEST_TENANT_ID, ResultStatus.VERIFIED, method="manual"
+        )
+
+        assert updated == 2
+        for result_id in (first.id, second.id):
+            stored = result_repository.get_by_id(result_id, TEST_TENANT_ID)
+            assert stored.verification_status == ResultStatus.VERIFIED
+            assert stored.verification_method == "manual"
+            assert stored.verified_at is not None
+        stored = result_repository.get_by_id(untouched.id, TEST_TENANT_ID)
+        assert stored.verification_status == ResultStatus.NEEDS_REVIEW
+
+    def test_skips_missing_and_other_tenants_results(self, result_repository):
+        """Test that results outside the tenant are neither updated nor counted."""
+        sample_id = str(uuid.uuid4())
+        own = _create_result(result_repository, sample_id)
+        foreign = _create_result(result_repository, sample_id, tenant_id=OTHER_TENANT_ID)
+
+        updated = result_repository.update_verification_status_bulk(
+            [own.id, foreign.id, "missing"], TEST_TENANT_ID, ResultStatus.REJECTED
+        )
+
+        assert updated == 1
+        stored = result_repository.get_by_id(foreign.id, OTHER_TENANT_ID)
+        assert stored.verification_status == ResultStatus.NEEDS_REVIEW
+
+    def test_empty_id_list_updates_nothing(self, result_repository):
+        """Test that an empty list of ids is a no-op."""
+        assert result_repository.update_verification_status_bulk(
+            [], TEST_TENANT_ID, ResultStatus.VERIFIED
+        ) == 0
+
+    def test_non_final_status_leaves_verified_at_unset(self, result_repository):
+        """Test that verified_at is only stamped for VERIFIED and REJECTED."""
+        result = _create_result(result_repository, str(uuid.uuid4()), ResultStatus.PENDING)
+
+        result_repository.update_verification_status_bulk(
+            [result.id], TEST_TENANT_ID, ResultStatus.NEEDS_REVIEW, method="auto"
+        )
+
+        stored = result_repository.get_by_id(result.id, TEST_TENANT_ID)
+        assert stored.verification_status == ResultStatus.NEEDS_REVIEW
+        assert stored.verified_at is None
@@ -0,0 +1,49 @@
+"""Shared contract tests for ISampleRepository (run against in-memory and PostgreSQL)."""
+
+from datetime import datetime, timedelta
+
+from app.models import Sample, SampleStatus
+
+
+TEST_TENANT_ID = "test-tenant-123"
+OTHER_TENANT_ID = "other-tenant-456"
+
+
+def _create_sample(repo, tenant_id=TEST_TENANT_ID):
+    """Create a pending sample."""
+    now = datetime.utcnow()
+    return repo.create(Sample(
+        tenant_id=tenant_id,
+        external_lis_id="LIS-SAMPLE-001",
+        patient_id="PAT-001",
+        specimen_type="blood",
+        collection_date=now - timedelta(hours=1),
+        received_date=now,
+    ))
+
+
+class TestSampleRepositoryUpdateStatus:
+    """Tests for update_status."""
+
+    def test_update_status(self, sample_repository):
+        """Test that the status is set and the sample reported as updated."""
+        sample = _create_sample(sample_repository)
+
+        assert sample_repository.update_status(sample.id, TEST_TENANT_ID, SampleStatus.VERIFIED)
+
+        stored = sample_repository.get_by_id(sample.id, TEST_TENANT_ID)
+        assert stored.status == SampleStatus.VERIFIED
+        assert stored.updated_at >= sample.updated_at
+
+    def test_update_status_of_missing_sample(self, sample_repository):
+        """Test that an unknown sample is reported as not updated."""
+        assert not sample_repository.update_status("missing", TEST_TENANT_ID, SampleStatus.VERIFIED)
+
+    def test_update_status_is_tenant_scoped(self, sample_repository):
+        """Test that another tenant's sample is neither updated nor reported as updated."""
+        sample = _create_sample(sample_repository, tenant_id=OTHER_TENANT_ID)
+
+        assert not sample_repository.update_status(sample.id, TEST_TENANT_ID, SampleStatus.REJECTED)
+
+        stored = sample_repository.get_by_id(sample.id, OTHER_TENANT_ID)
+        assert stored.status == SampleStatus.PENDING
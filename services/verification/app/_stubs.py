@@ -0,0 +1,106 @@
+"""Stand-ins for LIS integration types when that service is not importable."""
+
+import importlib.util
+from enum import Enum
+from typing import Optional, Protocol
+
+
+def module_available(name: str) -> bool:
+    """Check whether a module can be found without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # A parent package is missing
+        return False
+
+
+class ResultStatus(str, Enum):
+    """Result verification status."""
+
+    PENDING = "pending"
+    VERIFIED = "verified"
+    NEEDS_REVIEW = "needs_review"
+    REJECTED = "rejected"
+
+
+class SampleStatus(str, Enum):
+    """Sample status."""
+
+    PENDING = "pending"
+    VERIFIED = "verified"
+    NEEDS_REVIEW = "needs_review"
+    REJECTED = "rejected"
+
+
+class IResultRepository(Protocol):
+    """Protocol for result repository when LIS service is not available."""
+
+    def get_by_id(self, result_id: str, tenant_id: str):
+        """Get result by ID."""
+        ...
+
+    def list_by_sample(self, sample_id: str, tenant_id: str):
+        """List results by sample."""
+        ...
+
+    def list_by_sample_and_status(self, sample_id: str, tenant_id: str, statuses):
+        """List a sample's results in the given verification statuses."""
+        ...
+
+    def count_by_sample_and_status(self, sample_id: str, tenant_id: str, status) -> int:
+        """Count a sample's results in a verification status."""
+        ...
+
+    def exists_in_sample(self, result_id: str, sample_id: str, tenant_id: str) -> bool:
+        """Check that a result belongs to a sample."""
+        ...
+
+    def update_verification_status(
+        self, result_id: str, tenant_id: str, status, method: Optional[str] = None
+    ):
+        """Update verification status."""
+        ...
+
+    def update_verification_status_bulk(
+        self, result_ids: list[str], tenant_id: str, status, method: Optional[str] = None
+    ) -> int:
+        """Update verification status of several results."""
+        ...
+
+
+class ISampleRepository(Protocol):
+    """Protocol for sample repository when LIS service is not available."""
+
+    def get_by_id(self, sample_id: str, tenant_id: str):
+        """Get sample by ID."""
+        ...
+
+    def update(self, sample):
+        """Update sample."""
+        ...
+
+    def update_status(self, sample_id: str, tenant_id: str, status) -> bool:
+        """Set sample status."""
+        ...
+
+
+class PostgresResultRepository:
+    """Mock for result repository."""
+    def __init__(self, session):
+        self.session = session
+
+
+class PostgresSampleRepository:
+    """Mock for sample repository."""
+    def __init__(self, session):
+        self.session = session
+
+
+class InMemoryResultRepository:
+    """Mock for in-memory result repository."""
+    pass
+
+
+class InMemorySampleRepository:
+    """Mock for in-memory sample repository."""
+    pass
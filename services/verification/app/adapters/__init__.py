@@ -8,6 +8,10 @@ from .postgres_auto_verification_settings_repository import PostgresAutoVerifica
 from .postgres_review_repository import PostgresReviewRepository
 from .postgres_result_decision_repository import PostgresResultDecisionRepository
 from .postgres_verification_rule_repository import PostgresVerificationRuleRepository
+from .tenant_compiled_cache import TenantCompiledCaches
+from .tenant_connection_leases import TenantConnectionLeases, TenantPoolStats
+from .tenant_isolation import bind_session_tenant, enable_row_level_security
+from .unit_of_work import single_commit
 
 __all__ = [
     # In-memory adapters
@@ -20,4 +24,14 @@ __all__ = [
     "PostgresReviewRepository",
     "PostgresResultDecisionRepository",
     "PostgresVerificationRuleRepository",
+    # Compiled statement caching
+    "TenantCompiledCaches",
+    # Per-tenant connection limits
+    "TenantConnectionLeases",
+    "TenantPoolStats",
+    # Row-level tenant isolation
+    "bind_session_tenant",
+    "enable_row_level_security",
+    # Transactions spanning several repositories
+    "single_commit",
 ]
@@ -1,11 +1,12 @@
 """In-memory implementation of auto-verification settings repository for testing."""
 
+from datetime import datetime, timezone
 from typing import Optional
-import uuid
 import copy
 
 from app.ports import IAutoVerificationSettingsRepository
 from app.models import AutoVerificationSettings
+from app.models.ids import uuid7
 from app.exceptions import SettingsAlreadyExistsError, SettingsNotFoundError
 
 
@@ -33,12 +34,57 @@ class InMemoryAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
 
         # Generate ID if not provided
         if not settings.id:
-            settings.id = str(uuid.uuid4())
+            settings.id = uuid7()
+        self._set_server_timestamps(settings)
 
         # Store copy to avoid external mutations
         self._settings[settings.id] = copy.deepcopy(settings)
         return copy.deepcopy(self._settings[settings.id])
 
+    def create_if_absent(
+        self, settings: AutoVerificationSettings
+    ) -> Optional[AutoVerificationSettings]:
+        """Create settings in memory unless the test code already has settings."""
+        try:
+            return self.create(settings)
+        except SettingsAlreadyExistsError:
+            return None
+
+    def create_many(
+        self, settings_list: list[AutoVerificationSettings]
+    ) -> list[AutoVerificationSettings]:
+        """Create several settings in memory, skipping existing test codes."""
+        existing_keys = {(s.tenant_id, s.test_code) for s in self._settings.values()}
+
+        to_create = []
+        for settings in settings_list:
+            if not settings.tenant_id:
+                raise ValueError("Settings must have a tenant_id")
+            if not settings.test_code:
+                raise ValueError("Settings must have a test_code")
+
+            key = (settings.tenant_id, settings.test_code)
+            if key in existing_keys:
+                continue
+            existing_keys.add(key)
+
+            if not settings.id:
+                settings.id = uuid7()
+            self._set_server_timestamps(settings)
+            to_create.append(settings)
+
+        # Store copies to avoid external mutations
+        for settings in to_create:
+            self._settings[settings.id] = copy.deepcopy(settings)
+        return [copy.deepcopy(self._settings[s.id]) for s in to_create]
+
+    @staticmethod
+    def _set_server_timestamps(settings: AutoVerificationSettings) -> None:
+        """Fill in the timestamps the database sets through server defaults."""
+        now = datetime.now(timezone.utc)
+        settings.created_at = settings.created_at or now
+        settings.updated_at = settings.updated_at or now
+
     def get_by_id(self, settings_id: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
         """Retrieve settings by ID, ensuring it belongs to tenant."""
         settings = self._settings.get(settings_id)
@@ -56,13 +102,27 @@ class InMemoryAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
         settings_list.sort(key=lambda s: s.test_code)
         return settings_list
 
-    def get_by_test_code(self, test_code: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
-        """Retrieve settings for a specific test code within a tenant."""
+    def get_by_test_code(
+        self, test_code: str, tenant_id: str, for_update: bool = False
+    ) -> Optional[AutoVerificationSettings]:
+        """Retrieve settings for a specific test code within a tenant (no locking needed in memory)."""
         for settings in self._settings.values():
             if settings.tenant_id == tenant_id and settings.test_code == test_code:
                 return copy.deepcopy(settings)
         return None
 
+    def get_by_test_codes(
+        self, test_codes: list[str], tenant_id: str
+    ) -> list[AutoVerificationSettings]:
+        """Retrieve settings for several test codes within a tenant."""
+        wanted = set(test_codes)
+        settings_list = [
+            copy.deepcopy(s) for s in self._settings.values()
+            if s.tenant_id == tenant_id and s.test_code in wanted
+        ]
+        settings_list.sort(key=lambda s: s.test_code)
+        return settings_list
+
     def update(self, settings: AutoVerificationSettings) -> AutoVerificationSettings:
         """Update existing auto-verification settings."""
         if not settings.id or settings.id not in self._settings:
@@ -82,10 +142,23 @@ class InMemoryAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
                         f"Settings for test code '{settings.test_code}' already exist in tenant"
                     )
 
-        settings.update_timestamp()
+        settings.created_at = existing.created_at
+        settings.updated_at = datetime.now(timezone.utc)
         self._settings[settings.id] = copy.deepcopy(settings)
         return copy.deepcopy(settings)
 
+    def update_by_test_code(
+        self, test_code: str, tenant_id: str, patch: dict
+    ) -> Optional[AutoVerificationSettings]:
+        """Apply a partial update to the settings for a test code within a tenant."""
+        for settings in self._settings.values():
+            if settings.tenant_id == tenant_id and settings.test_code == test_code:
+                for field, value in patch.items():
+                    setattr(settings, field, copy.deepcopy(value))
+                settings.updated_at = datetime.now(timezone.utc)
+                return copy.deepcopy(settings)
+        return None
+
     def delete(self, settings_id: str, tenant_id: str) -> bool:
         """Delete auto-verification settings, ensuring it belongs to the tenant."""
         settings = self._settings.get(settings_id)
@@ -94,6 +167,14 @@ class InMemoryAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
             return True
         return False
 
+    def delete_by_test_code(self, test_code: str, tenant_id: str) -> bool:
+        """Delete the settings for a test code within a tenant."""
+        for settings_id, settings in self._settings.items():
+            if settings.tenant_id == tenant_id and settings.test_code == test_code:
+                del self._settings[settings_id]
+                return True
+        return False
+
     def list_all(
         self,
         tenant_id: str,
@@ -114,3 +195,13 @@ class InMemoryAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
         paginated = settings_list[skip:skip + limit]
 
         return [copy.deepcopy(s) for s in paginated], total
+
+    def list_all_projected(
+        self,
+        tenant_id: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[list[dict], int]:
+        """List a tenant's settings as dicts keyed by column name, with pagination."""
+        settings_list, total = self.list_all(tenant_id, skip=skip, limit=limit)
+        return [s.model_dump() for s in settings_list], total
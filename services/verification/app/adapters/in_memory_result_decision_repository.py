@@ -1,11 +1,13 @@
 """In-memory implementation of result decision repository for testing."""
 
+from collections import Counter
 from typing import Optional
-import uuid
+from datetime import datetime, timezone
 import copy
 
 from app.ports import IResultDecisionRepository
 from app.models import ResultDecision
+from app.models.ids import uuid7
 
 
 class InMemoryResultDecisionRepository(IResultDecisionRepository):
@@ -28,7 +30,9 @@ class InMemoryResultDecisionRepository(IResultDecisionRepository):
 
         # Generate ID if not provided
         if not decision.id:
-            decision.id = str(uuid.uuid4())
+            decision.id = uuid7()
+        # Filled in by a server default in the database
+        decision.decided_at = decision.decided_at or datetime.now(timezone.utc)
 
         # Store copy to avoid external mutations
         self._decisions[decision.id] = copy.deepcopy(decision)
@@ -40,6 +44,20 @@ class InMemoryResultDecisionRepository(IResultDecisionRepository):
 
         return copy.deepcopy(self._decisions[decision.id])
 
+    def create_many(
+        self, decisions: list[ResultDecision], tenant_id: str
+    ) -> list[ResultDecision]:
+        """Create several result decisions in memory."""
+        for decision in decisions:
+            if decision.tenant_id != tenant_id:
+                raise ValueError("Decision must belong to the given tenant")
+            if not decision.review_id:
+                raise ValueError("Decision must have a review_id")
+            if not decision.result_id:
+                raise ValueError("Decision must have a result_id")
+
+        return [self.create(decision) for decision in decisions]
+
     def get_by_id(self, decision_id: str, tenant_id: str) -> Optional[ResultDecision]:
         """Retrieve a decision by ID, ensuring it belongs to the tenant."""
         decision = self._decisions.get(decision_id)
@@ -47,6 +65,15 @@ class InMemoryResultDecisionRepository(IResultDecisionRepository):
             return copy.deepcopy(decision)
         return None
 
+    def get_by_ids(self, decision_ids: list[str], tenant_id: str) -> list[ResultDecision]:
+        """Retrieve several decisions by ID, ensuring they belong to the tenant."""
+        decisions = []
+        for decision_id in dict.fromkeys(decision_ids):
+            decision = self._decisions.get(decision_id)
+            if decision and decision.tenant_id == tenant_id:
+                decisions.append(copy.deepcopy(decision))
+        return decisions
+
     def get_by_review(self, review_id: str, tenant_id: str) -> list[ResultDecision]:
         """List all decisions for a specific review."""
         decision_ids = self._by_review.get(review_id, [])
@@ -60,6 +87,13 @@ class InMemoryResultDecisionRepository(IResultDecisionRepository):
         decisions.sort(key=lambda d: d.decided_at)
         return decisions
 
+    def count_by_review_grouped(self, review_id: str, tenant_id: str) -> dict[str, int]:
+        """Count a review's decisions by decision value."""
+        decisions = (
+            self._decisions.get(decision_id) for decision_id in self._by_review.get(review_id, [])
+        )
+        return dict(Counter(d.decision for d in decisions if d and d.tenant_id == tenant_id))
+
     def list_by_review(
         self,
         review_id: str,
@@ -1,15 +1,24 @@
 """In-memory implementation of review repository for testing."""
 
 from typing import Optional
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
 import copy
 
 from app.ports import IReviewRepository
 from app.models import Review, ReviewState
+from app.models.ids import uuid7
 from app.exceptions import ReviewAlreadyExistsError, ReviewNotFoundError
 
 
+# States of reviews whose results are still being decided by a reviewer
+_AWAITING_DECISION_STATES = (ReviewState.PENDING, ReviewState.IN_PROGRESS)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, as the database does, so they compare with aware ones."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
 class InMemoryReviewRepository(IReviewRepository):
     """In-memory implementation of review repository for testing."""
 
@@ -34,7 +43,12 @@ class InMemoryReviewRepository(IReviewRepository):
 
         # Generate ID if not provided
         if not review.id:
-            review.id = str(uuid.uuid4())
+            review.id = uuid7()
+
+        # Fill in the timestamps the database sets through server defaults
+        now = datetime.now(timezone.utc)
+        review.created_at = review.created_at or now
+        review.updated_at = review.updated_at or now
 
         # Store copy to avoid external mutations
         self._reviews[review.id] = copy.deepcopy(review)
@@ -63,10 +77,52 @@ class InMemoryReviewRepository(IReviewRepository):
         if existing.tenant_id != review.tenant_id:
             raise ReviewNotFoundError(f"Review with id '{review.id}' not found")
 
-        review.update_timestamp()
+        review.created_at = existing.created_at
+        # Like the PostgreSQL adapter, the counter only moves through
+        # decrement_pending_results and set_pending_results
+        review.pending_results_count = existing.pending_results_count
+        review.updated_at = datetime.now(timezone.utc)
         self._reviews[review.id] = copy.deepcopy(review)
         return copy.deepcopy(review)
 
+    def update_if_state(self, review: Review, expected_state: ReviewState) -> Optional[Review]:
+        """Update a review only if its stored state is still expected_state."""
+        existing = self._reviews.get(review.id)
+        if existing is None or existing.tenant_id != review.tenant_id or existing.state != expected_state:
+            return None
+        return self.update(review)
+
+    def decrement_pending_results(self, review_id: str, tenant_id: str) -> Optional[int]:
+        """Atomically count one more of a review's results as decided."""
+        existing = self._reviews.get(review_id)
+        if existing is None or existing.tenant_id != tenant_id:
+            return None
+        existing.pending_results_count = max(existing.pending_results_count - 1, 0)
+        return existing.pending_results_count
+
+    def set_pending_results(self, review_id: str, tenant_id: str, count: int) -> bool:
+        """Overwrite a review's count of results still awaiting a decision."""
+        existing = self._reviews.get(review_id)
+        if existing is None or existing.tenant_id != tenant_id:
+            return False
+        existing.pending_results_count = count
+        return True
+
+    def list_awaiting_decisions(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 100
+    ) -> list[Review]:
+        """List reviews of every tenant that are pending or in progress."""
+        reviews = sorted(
+            (
+                r for r in self._reviews.values()
+                if r.state in _AWAITING_DECISION_STATES and (after_id is None or r.id > after_id)
+            ),
+            key=lambda r: r.id,
+        )
+        return [copy.deepcopy(r) for r in reviews[:limit]]
+
     def list_by_tenant(
         self,
         tenant_id: str,
@@ -75,9 +131,40 @@ class InMemoryReviewRepository(IReviewRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> tuple[list[Review], int]:
+        limit: int = 100,
+        include_total: bool = True
+    ) -> tuple[list[Review], Optional[int]]:
         """List reviews for a tenant with optional filtering."""
+        reviews = self._filter_tenant_reviews(tenant_id, state, reviewer_user_id, start_date, end_date)
+
+        # Sort by created_at (newest first)
+        reviews.sort(key=lambda r: _as_utc(r.created_at), reverse=True)
+
+        total = len(reviews) if include_total else None
+        paginated = reviews[skip:skip + limit]
+
+        return [copy.deepcopy(r) for r in paginated], total
+
+    def count_by_tenant(
+        self,
+        tenant_id: str,
+        state: Optional[ReviewState] = None,
+        reviewer_user_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """Count a tenant's reviews matching list_by_tenant's filters."""
+        return len(self._filter_tenant_reviews(tenant_id, state, reviewer_user_id, start_date, end_date))
+
+    def _filter_tenant_reviews(
+        self,
+        tenant_id: str,
+        state: Optional[ReviewState],
+        reviewer_user_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> list[Review]:
+        """A tenant's stored reviews matching list_by_tenant's filters."""
         # Filter by tenant
         reviews = [r for r in self._reviews.values() if r.tenant_id == tenant_id]
 
@@ -87,17 +174,11 @@ class InMemoryReviewRepository(IReviewRepository):
         if reviewer_user_id:
             reviews = [r for r in reviews if r.reviewer_user_id == reviewer_user_id]
         if start_date:
-            reviews = [r for r in reviews if r.created_at >= start_date]
+            reviews = [r for r in reviews if _as_utc(r.created_at) >= _as_utc(start_date)]
         if end_date:
-            reviews = [r for r in reviews if r.created_at <= end_date]
-
-        # Sort by created_at (newest first)
-        reviews.sort(key=lambda r: r.created_at, reverse=True)
+            reviews = [r for r in reviews if _as_utc(r.created_at) <= _as_utc(end_date)]
 
-        total = len(reviews)
-        paginated = reviews[skip:skip + limit]
-
-        return [copy.deepcopy(r) for r in paginated], total
+        return reviews
 
     def search(
         self,
@@ -118,7 +199,7 @@ class InMemoryReviewRepository(IReviewRepository):
             reviews = [r for r in reviews if r.state == state]
 
         # Sort by created_at (newest first)
-        reviews.sort(key=lambda r: r.created_at, reverse=True)
+        reviews.sort(key=lambda r: _as_utc(r.created_at), reverse=True)
 
         total = len(reviews)
         paginated = reviews[skip:skip + limit]
@@ -1,10 +1,12 @@
 """In-memory implementation of verification rule repository for testing."""
 
-import uuid
+from datetime import datetime, timezone
+from typing import Optional
 import copy
 
 from app.ports import IVerificationRuleRepository
-from app.models import VerificationRule
+from app.models import RuleType, VerificationRule
+from app.models.ids import uuid7
 from app.exceptions import RuleNotFoundError
 
 
@@ -25,6 +27,25 @@ class InMemoryVerificationRuleRepository(IVerificationRuleRepository):
         rules.sort(key=lambda r: r.priority)
         return rules
 
+    def create_many(
+        self, rules: list[VerificationRule], tenant_id: str
+    ) -> list[VerificationRule]:
+        """Create several verification rules in memory."""
+        for rule in rules:
+            if rule.tenant_id != tenant_id:
+                raise ValueError("Rule must belong to the given tenant")
+
+        return [self.create(rule) for rule in rules]
+
+    def get_by_tenant_and_type(
+        self, tenant_id: str, rule_type: RuleType
+    ) -> Optional[VerificationRule]:
+        """Retrieve a tenant's rule of the given type."""
+        for rule in self._rules.values():
+            if rule.tenant_id == tenant_id and rule.rule_type == rule_type:
+                return copy.deepcopy(rule)
+        return None
+
     def update(self, rule: VerificationRule) -> VerificationRule:
         """Update an existing verification rule."""
         if not rule.id or rule.id not in self._rules:
@@ -34,7 +55,8 @@ class InMemoryVerificationRuleRepository(IVerificationRuleRepository):
         if existing.tenant_id != rule.tenant_id:
             raise RuleNotFoundError(f"Rule with id '{rule.id}' not found")
 
-        rule.update_timestamp()
+        rule.created_at = existing.created_at
+        rule.updated_at = datetime.now(timezone.utc)
         self._rules[rule.id] = copy.deepcopy(rule)
         return copy.deepcopy(rule)
 
@@ -77,7 +99,11 @@ class InMemoryVerificationRuleRepository(IVerificationRuleRepository):
 
         # Generate ID if not provided
         if not rule.id:
-            rule.id = str(uuid.uuid4())
+            rule.id = uuid7()
+        # Fill in the timestamps the database sets through server defaults
+        now = datetime.now(timezone.utc)
+        rule.created_at = rule.created_at or now
+        rule.updated_at = rule.updated_at or now
 
         # Store copy to avoid external mutations
         self._rules[rule.id] = copy.deepcopy(rule)
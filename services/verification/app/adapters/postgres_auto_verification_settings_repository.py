@@ -1,25 +1,68 @@
 """PostgreSQL implementation of auto-verification settings repository."""
 
+from sqlalchemy import bindparam, delete, func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
 from typing import Optional
-import uuid
 
+from app.adapters.tenant_compiled_cache import TenantCompiledCaches, tenant_execution_options
+from app.adapters.tenant_isolation import bind_session_tenant
+from app.adapters.unit_of_work import commit
 from app.ports import IAutoVerificationSettingsRepository
 from app.models import AutoVerificationSettings
+from app.models.ids import uuid7
 from app.exceptions import SettingsAlreadyExistsError, SettingsNotFoundError
 
 
+# The expanding parameter renders one IN list per call, so test code lists of
+# any length share a single compiled statement
+_SETTINGS_BY_TEST_CODES = select(AutoVerificationSettings).where(
+    AutoVerificationSettings.tenant_id == bindparam("tenant_id"),
+    AutoVerificationSettings.test_code.in_(bindparam("test_codes", expanding=True)),
+).order_by(AutoVerificationSettings.test_code)
+
+
+# Every settings column, for listings read as plain rows
+_SETTINGS_COLUMNS = tuple(AutoVerificationSettings.__table__.columns)
+
+
+def _insert_if_absent(dialect_insert) -> object:
+    """Build the insert that yields no row if the (tenant_id, test_code) pair exists."""
+    return dialect_insert(AutoVerificationSettings).on_conflict_do_nothing(
+        index_elements=[AutoVerificationSettings.tenant_id, AutoVerificationSettings.test_code],
+    ).returning(AutoVerificationSettings)
+
+
+# ON CONFLICT is dialect-specific; SQLite is used for local development and tests
+_INSERTS_IF_ABSENT = {
+    "postgresql": _insert_if_absent(postgresql.insert),
+    "sqlite": _insert_if_absent(sqlite.insert),
+}
+
+
 class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsRepository):
     """PostgreSQL implementation of auto-verification settings repository with multi-tenant support."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, compiled_caches: Optional[TenantCompiledCaches] = None):
         """
         Initialize with database session.
 
         Args:
             session: SQLModel database session
+            compiled_caches: Per-tenant compiled statement caches (the
+                engine-wide cache is used if not given)
         """
         self._session = session
+        self._compiled_caches = compiled_caches
+
+    def _tenant_options(self, tenant_id: str):
+        """
+        Execution options selecting the tenant's compiled statement cache.
+
+        Also scopes the session to the tenant for row-level security.
+        """
+        bind_session_tenant(self._session, tenant_id)
+        return tenant_execution_options(self._compiled_caches, tenant_id)
 
     def create(self, settings: AutoVerificationSettings) -> AutoVerificationSettings:
         """Create new auto-verification settings in PostgreSQL."""
@@ -34,7 +77,8 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
             select(AutoVerificationSettings).where(
                 AutoVerificationSettings.tenant_id == settings.tenant_id,
                 AutoVerificationSettings.test_code == settings.test_code
-            )
+            ),
+            execution_options=self._tenant_options(settings.tenant_id),
         ).first()
 
         if existing:
@@ -44,20 +88,96 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
 
         # Generate ID if not provided
         if not settings.id:
-            settings.id = str(uuid.uuid4())
+            settings.id = uuid7()
 
         self._session.add(settings)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(settings)
         return settings
 
+    def create_if_absent(
+        self, settings: AutoVerificationSettings
+    ) -> Optional[AutoVerificationSettings]:
+        """Create settings in one INSERT ... ON CONFLICT DO NOTHING round trip."""
+        if not settings.tenant_id:
+            raise ValueError("Settings must have a tenant_id")
+        if not settings.test_code:
+            raise ValueError("Settings must have a test_code")
+
+        if not settings.id:
+            settings.id = uuid7()
+
+        # The unique (tenant_id, test_code) index arbitrates concurrent
+        # creates, so there is no window between a lookup and the insert.
+        # Timestamps are left to the server defaults and come back through
+        # RETURNING.
+        dialect = self._session.get_bind().dialect.name
+        created = self._session.scalars(
+            _INSERTS_IF_ABSENT[dialect],
+            [settings.model_dump(exclude={"created_at", "updated_at"})],
+            execution_options=self._tenant_options(settings.tenant_id),
+        ).first()
+        commit(self._session)
+        return created
+
+    def create_many(
+        self, settings_list: list[AutoVerificationSettings]
+    ) -> list[AutoVerificationSettings]:
+        """Create several settings in one transaction, skipping existing test codes."""
+        for settings in settings_list:
+            if not settings.tenant_id:
+                raise ValueError("Settings must have a tenant_id")
+            if not settings.test_code:
+                raise ValueError("Settings must have a test_code")
+
+        if not settings_list:
+            return []
+
+        tenant_ids = {s.tenant_id for s in settings_list}
+        if len(tenant_ids) == 1:
+            bind_session_tenant(self._session, settings_list[0].tenant_id)
+
+        # Look up all conflicting (tenant_id, test_code) pairs in one query
+        existing_keys = set(self._session.exec(
+            select(AutoVerificationSettings.tenant_id, AutoVerificationSettings.test_code).where(
+                AutoVerificationSettings.tenant_id.in_(tenant_ids),
+                AutoVerificationSettings.test_code.in_({s.test_code for s in settings_list}),
+            )
+        ).all())
+
+        to_create = []
+        for settings in settings_list:
+            key = (settings.tenant_id, settings.test_code)
+            if key in existing_keys:
+                continue
+            existing_keys.add(key)
+
+            if not settings.id:
+                settings.id = uuid7()
+            to_create.append(settings)
+
+        if not to_create:
+            return []
+
+        # Bulk INSERT: rows are sent as multi-row statements rather than one
+        # round trip per entity. Timestamps are left to the server defaults
+        # and come back through RETURNING along with the rest of each row.
+        created = list(self._session.scalars(
+            insert(AutoVerificationSettings).returning(
+                AutoVerificationSettings, sort_by_parameter_order=True
+            ),
+            [s.model_dump(exclude={"created_at", "updated_at"}) for s in to_create],
+        ))
+        commit(self._session)
+        return created
+
     def get_by_id(self, settings_id: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
         """Retrieve settings by ID, ensuring it belongs to tenant."""
         statement = select(AutoVerificationSettings).where(
             AutoVerificationSettings.id == settings_id,
             AutoVerificationSettings.tenant_id == tenant_id
         )
-        return self._session.exec(statement).first()
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
 
     def get_by_tenant(self, tenant_id: str) -> list[AutoVerificationSettings]:
         """List all auto-verification settings for a tenant."""
@@ -65,15 +185,34 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
             AutoVerificationSettings.tenant_id == tenant_id
         ).order_by(AutoVerificationSettings.test_code)
 
-        return list(self._session.exec(statement).all())
+        return list(self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).all())
 
-    def get_by_test_code(self, test_code: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
+    def get_by_test_code(
+        self, test_code: str, tenant_id: str, for_update: bool = False
+    ) -> Optional[AutoVerificationSettings]:
         """Retrieve settings for a specific test code within a tenant."""
         statement = select(AutoVerificationSettings).where(
             AutoVerificationSettings.test_code == test_code,
             AutoVerificationSettings.tenant_id == tenant_id
         )
-        return self._session.exec(statement).first()
+        if for_update:
+            # The lock is held by the session's open transaction until the
+            # next repository write commits
+            statement = statement.with_for_update()
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
+
+    def get_by_test_codes(
+        self, test_codes: list[str], tenant_id: str
+    ) -> list[AutoVerificationSettings]:
+        """Retrieve settings for several test codes in one query within a tenant."""
+        if not test_codes:
+            return []
+
+        return list(self._session.exec(
+            _SETTINGS_BY_TEST_CODES,
+            params={"tenant_id": tenant_id, "test_codes": list(set(test_codes))},
+            execution_options=self._tenant_options(tenant_id),
+        ).all())
 
     def update(self, settings: AutoVerificationSettings) -> AutoVerificationSettings:
         """Update existing auto-verification settings."""
@@ -89,7 +228,8 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
                         AutoVerificationSettings.id != settings.id,
                         AutoVerificationSettings.tenant_id == settings.tenant_id,
                         AutoVerificationSettings.test_code == settings.test_code
-                    )
+                    ),
+                    execution_options=self._tenant_options(settings.tenant_id),
                 ).first()
 
                 if duplicate:
@@ -107,13 +247,31 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
             existing.instrument_flags_to_block = settings.instrument_flags_to_block
             existing.delta_check_threshold_percent = settings.delta_check_threshold_percent
             existing.delta_check_lookback_days = settings.delta_check_lookback_days
-            existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
+    def update_by_test_code(
+        self, test_code: str, tenant_id: str, patch: dict
+    ) -> Optional[AutoVerificationSettings]:
+        """Apply a partial update in one UPDATE ... RETURNING round trip."""
+        # updated_at is set through the column's onupdate default
+        updated = self._session.scalars(
+            update(AutoVerificationSettings)
+            .where(
+                AutoVerificationSettings.tenant_id == tenant_id,
+                AutoVerificationSettings.test_code == test_code,
+            )
+            .values(**patch)
+            .returning(AutoVerificationSettings)
+            .execution_options(populate_existing=True),
+            execution_options=self._tenant_options(tenant_id),
+        ).first()
+        commit(self._session)
+        return updated
+
     def delete(self, settings_id: str, tenant_id: str) -> bool:
         """Delete auto-verification settings, ensuring it belongs to the tenant."""
         settings = self.get_by_id(settings_id, tenant_id)
@@ -121,9 +279,23 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
             return False
 
         self._session.delete(settings)
-        self._session.commit()
+        commit(self._session)
         return True
 
+    def delete_by_test_code(self, test_code: str, tenant_id: str) -> bool:
+        """Delete the settings for a test code in one DELETE ... RETURNING round trip."""
+        deleted_id = self._session.exec(
+            delete(AutoVerificationSettings)
+            .where(
+                AutoVerificationSettings.tenant_id == tenant_id,
+                AutoVerificationSettings.test_code == test_code,
+            )
+            .returning(AutoVerificationSettings.id),
+            execution_options=self._tenant_options(tenant_id),
+        ).first()
+        commit(self._session)
+        return deleted_id is not None
+
     def list_all(
         self,
         tenant_id: str,
@@ -131,19 +303,46 @@ class PostgresAutoVerificationSettingsRepository(IAutoVerificationSettingsReposi
         limit: int = 100
     ) -> tuple[list[AutoVerificationSettings], int]:
         """List all auto-verification settings for a tenant with pagination."""
-        # Build base query with tenant filter
-        query = select(AutoVerificationSettings).where(
-            AutoVerificationSettings.tenant_id == tenant_id
-        )
+        rows, total = self._list_page(tenant_id, skip, limit, AutoVerificationSettings)
+        return [row[0] for row in rows], total
 
-        # Get total count
-        count_query = select(AutoVerificationSettings).where(
-            AutoVerificationSettings.tenant_id == tenant_id
+    def list_all_projected(
+        self,
+        tenant_id: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[list[dict], int]:
+        """List a tenant's settings as dicts keyed by column name, without hydrating ORM entities."""
+        rows, total = self._list_page(tenant_id, skip, limit, *_SETTINGS_COLUMNS)
+        # Values are looked up by column, so the window total is left out and
+        # the keys never depend on the order the columns were selected in
+        return [
+            {column.name: row._mapping[column] for column in _SETTINGS_COLUMNS}
+            for row in rows
+        ], total
+
+    def _list_page(self, tenant_id: str, skip: int, limit: int, *columns) -> tuple[list, int]:
+        """Fetch a page of rows of the given columns, each ending with the tenant total."""
+        # Fetch the page and the tenant total in a single round trip: the
+        # window count is evaluated before LIMIT/OFFSET are applied.
+        query = (
+            select(*columns, func.count().over().label("total"))
+            .where(AutoVerificationSettings.tenant_id == tenant_id)
+            .order_by(AutoVerificationSettings.test_code)
+            .offset(skip)
+            .limit(limit)
         )
-        total = len(self._session.exec(count_query).all())
+        rows = self._session.exec(query, execution_options=self._tenant_options(tenant_id)).all()
 
-        # Apply sorting and pagination
-        query = query.order_by(AutoVerificationSettings.test_code).offset(skip).limit(limit)
-        settings = list(self._session.exec(query).all())
+        if rows:
+            total = rows[0][-1]
+        elif skip == 0:
+            total = 0
+        else:
+            # Page is past the end; fall back to a plain count
+            count_query = select(func.count()).select_from(AutoVerificationSettings).where(
+                AutoVerificationSettings.tenant_id == tenant_id
+            )
+            total = self._session.exec(count_query, execution_options=self._tenant_options(tenant_id)).one()
 
-        return settings, total
+        return rows, total
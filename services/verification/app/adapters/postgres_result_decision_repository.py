@@ -1,24 +1,58 @@
 """PostgreSQL implementation of result decision repository."""
 
+from sqlalchemy import bindparam, func, insert
 from sqlmodel import Session, select
 from typing import Optional
-import uuid
 
+from app.adapters.tenant_compiled_cache import TenantCompiledCaches, tenant_execution_options
+from app.adapters.tenant_isolation import bind_session_tenant
+from app.adapters.unit_of_work import commit
 from app.ports import IResultDecisionRepository
 from app.models import ResultDecision
+from app.models.ids import uuid7
+
+
+# The expanding parameter renders one IN list per call, so ID lists of any
+# length share a single compiled statement
+_DECISIONS_BY_IDS = select(ResultDecision).where(
+    ResultDecision.tenant_id == bindparam("tenant_id"),
+    ResultDecision.id.in_(bindparam("ids", expanding=True)),
+)
+
+# Decision totals for a review, counted in the database
+_DECISION_COUNTS_BY_REVIEW = (
+    select(ResultDecision.decision, func.count())
+    .where(
+        ResultDecision.review_id == bindparam("review_id"),
+        ResultDecision.tenant_id == bindparam("tenant_id"),
+    )
+    .group_by(ResultDecision.decision)
+)
 
 
 class PostgresResultDecisionRepository(IResultDecisionRepository):
     """PostgreSQL implementation of result decision repository with multi-tenant support."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, compiled_caches: Optional[TenantCompiledCaches] = None):
         """
         Initialize with database session.
 
         Args:
             session: SQLModel database session
+            compiled_caches: Per-tenant compiled statement caches (the
+                engine-wide cache is used if not given)
         """
         self._session = session
+        self._compiled_caches = compiled_caches
+
+    def _tenant_options(self, tenant_id: str):
+        """
+        Execution options selecting the tenant's compiled statement cache.
+
+        Also scopes the session to the tenant for row-level security.
+        """
+        bind_session_tenant(self._session, tenant_id)
+        return tenant_execution_options(self._compiled_caches, tenant_id)
 
     def create(self, decision: ResultDecision) -> ResultDecision:
         """Create a new result decision in PostgreSQL."""
@@ -32,20 +66,65 @@ class PostgresResultDecisionRepository(IResultDecisionRepository):
 
         # Generate ID if not provided
         if not decision.id:
-            decision.id = str(uuid.uuid4())
+            decision.id = uuid7()
 
+        bind_session_tenant(self._session, decision.tenant_id)
         self._session.add(decision)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(decision)
         return decision
 
+    def create_many(
+        self, decisions: list[ResultDecision], tenant_id: str
+    ) -> list[ResultDecision]:
+        """Create several result decisions with one bulk INSERT and one commit."""
+        for decision in decisions:
+            if decision.tenant_id != tenant_id:
+                raise ValueError("Decision must belong to the given tenant")
+            if not decision.review_id:
+                raise ValueError("Decision must have a review_id")
+            if not decision.result_id:
+                raise ValueError("Decision must have a result_id")
+
+        if not decisions:
+            return []
+
+        for decision in decisions:
+            if not decision.id:
+                decision.id = uuid7()
+
+        # decided_at is left to the server default and comes back through
+        # RETURNING along with the rest of each row
+        created = list(self._session.scalars(
+            insert(ResultDecision).returning(ResultDecision, sort_by_parameter_order=True),
+            [d.model_dump(exclude={"decided_at"}) for d in decisions],
+            execution_options=self._tenant_options(tenant_id),
+        ))
+        commit(self._session)
+        return created
+
     def get_by_id(self, decision_id: str, tenant_id: str) -> Optional[ResultDecision]:
         """Retrieve a decision by ID, ensuring it belongs to the tenant."""
         statement = select(ResultDecision).where(
             ResultDecision.id == decision_id,
             ResultDecision.tenant_id == tenant_id
         )
-        return self._session.exec(statement).first()
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
+
+    def get_by_ids(self, decision_ids: list[str], tenant_id: str) -> list[ResultDecision]:
+        """Retrieve several decisions by ID in one query, ensuring they belong to the tenant."""
+        if not decision_ids:
+            return []
+
+        found = {
+            decision.id: decision
+            for decision in self._session.exec(
+                _DECISIONS_BY_IDS,
+                params={"tenant_id": tenant_id, "ids": list(set(decision_ids))},
+                execution_options=self._tenant_options(tenant_id),
+            )
+        }
+        return [found[decision_id] for decision_id in dict.fromkeys(decision_ids) if decision_id in found]
 
     def get_by_review(self, review_id: str, tenant_id: str) -> list[ResultDecision]:
         """List all decisions for a specific review."""
@@ -54,7 +133,16 @@ class PostgresResultDecisionRepository(IResultDecisionRepository):
             ResultDecision.tenant_id == tenant_id
         ).order_by(ResultDecision.decided_at)
 
-        return list(self._session.exec(statement).all())
+        return list(self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).all())
+
+    def count_by_review_grouped(self, review_id: str, tenant_id: str) -> dict[str, int]:
+        """Count a review's decisions by decision value with one GROUP BY query."""
+        rows = self._session.exec(
+            _DECISION_COUNTS_BY_REVIEW,
+            params={"review_id": review_id, "tenant_id": tenant_id},
+            execution_options=self._tenant_options(tenant_id),
+        )
+        return {decision: count for decision, count in rows}
 
     def list_by_review(
         self,
@@ -75,10 +163,10 @@ class PostgresResultDecisionRepository(IResultDecisionRepository):
             ResultDecision.review_id == review_id,
             ResultDecision.tenant_id == tenant_id
         )
-        total = len(self._session.exec(count_query).all())
+        total = len(self._session.exec(count_query, execution_options=self._tenant_options(tenant_id)).all())
 
         # Apply sorting and pagination
         query = query.order_by(ResultDecision.decided_at).offset(skip).limit(limit)
-        decisions = list(self._session.exec(query).all())
+        decisions = list(self._session.exec(query, execution_options=self._tenant_options(tenant_id)).all())
 
         return decisions, total
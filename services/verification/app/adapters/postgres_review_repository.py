@@ -1,26 +1,113 @@
 """PostgreSQL implementation of review repository."""
 
+from sqlalchemy import bindparam, case, delete, func, insert, or_, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
 from typing import Optional
 from datetime import datetime
-import uuid
 
+from app.adapters.tenant_compiled_cache import TenantCompiledCaches, tenant_execution_options
+from app.adapters.tenant_isolation import bind_session_tenant
+from app.adapters.unit_of_work import commit
 from app.ports import IReviewRepository
-from app.models import Review, ReviewState
+from app.models import Review, ReviewState, ReviewStateCounter
+from app.models.ids import uuid7
 from app.exceptions import ReviewAlreadyExistsError, ReviewNotFoundError
 
 
+# list_by_tenant filters. Optional filters are NULL-filled (a None parameter
+# disables its predicate) rather than appended conditionally, so every filter
+# combination shares one statement and one compiled-cache entry. The
+# statements are built once here instead of on every call.
+_TENANT_REVIEW_FILTERS = (
+    Review.tenant_id == bindparam("tenant_id"),
+    or_(
+        bindparam("state", type_=Review.state.type).is_(None),
+        Review.state == bindparam("state", type_=Review.state.type),
+    ),
+    or_(
+        bindparam("reviewer_user_id", type_=Review.reviewer_user_id.type).is_(None),
+        Review.reviewer_user_id == bindparam("reviewer_user_id", type_=Review.reviewer_user_id.type),
+    ),
+    or_(
+        bindparam("start_date", type_=Review.created_at.type).is_(None),
+        Review.created_at >= bindparam("start_date", type_=Review.created_at.type),
+    ),
+    or_(
+        bindparam("end_date", type_=Review.created_at.type).is_(None),
+        Review.created_at <= bindparam("end_date", type_=Review.created_at.type),
+    ),
+)
+
+_LIST_TENANT_REVIEWS = (
+    select(Review)
+    .where(*_TENANT_REVIEW_FILTERS)
+    .order_by(Review.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+# The page with the total of all matching rows folded in as a window count,
+# so a filtered listing is one query instead of a page query and a count
+_LIST_TENANT_REVIEWS_WITH_TOTAL = (
+    select(Review, func.count().over())
+    .where(*_TENANT_REVIEW_FILTERS)
+    .order_by(Review.created_at.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+_COUNT_TENANT_REVIEWS = select(func.count()).select_from(Review).where(*_TENANT_REVIEW_FILTERS)
+
+# Total for tenant/state-only filters, read from the maintained counters
+_SUM_STATE_COUNTERS = select(func.coalesce(func.sum(ReviewStateCounter.count), 0)).where(
+    ReviewStateCounter.tenant_id == bindparam("tenant_id"),
+    or_(
+        bindparam("state", type_=ReviewStateCounter.state.type).is_(None),
+        ReviewStateCounter.state == bindparam("state", type_=ReviewStateCounter.state.type),
+    ),
+)
+
+
+def _counter_upsert(dialect_insert) -> object:
+    """Build the statement that adds a delta to a (tenant_id, state) counter."""
+    statement = dialect_insert(ReviewStateCounter)
+    return statement.on_conflict_do_update(
+        index_elements=[ReviewStateCounter.tenant_id, ReviewStateCounter.state],
+        set_={"count": ReviewStateCounter.count + statement.excluded["count"]},
+    )
+
+
+# ON CONFLICT is dialect-specific; SQLite is used for local development and tests
+_COUNTER_UPSERTS = {
+    "postgresql": _counter_upsert(postgresql.insert),
+    "sqlite": _counter_upsert(sqlite.insert),
+}
+
+
 class PostgresReviewRepository(IReviewRepository):
     """PostgreSQL implementation of review repository with multi-tenant support."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, compiled_caches: Optional[TenantCompiledCaches] = None):
         """
         Initialize with database session.
 
         Args:
             session: SQLModel database session
+            compiled_caches: Per-tenant compiled statement caches (the
+                engine-wide cache is used if not given)
         """
         self._session = session
+        self._compiled_caches = compiled_caches
+
+    def _tenant_options(self, tenant_id: str):
+        """
+        Execution options selecting the tenant's compiled statement cache.
+
+        Also scopes the session to the tenant for row-level security.
+        """
+        bind_session_tenant(self._session, tenant_id)
+        return tenant_execution_options(self._compiled_caches, tenant_id)
 
     def create(self, review: Review) -> Review:
         """Create a new review in PostgreSQL."""
@@ -35,7 +122,8 @@ class PostgresReviewRepository(IReviewRepository):
             select(Review).where(
                 Review.sample_id == review.sample_id,
                 Review.tenant_id == review.tenant_id
-            )
+            ),
+            execution_options=self._tenant_options(review.tenant_id),
         ).first()
 
         if existing:
@@ -45,10 +133,11 @@ class PostgresReviewRepository(IReviewRepository):
 
         # Generate ID if not provided
         if not review.id:
-            review.id = str(uuid.uuid4())
+            review.id = uuid7()
 
         self._session.add(review)
-        self._session.commit()
+        self._adjust_state_count(review.tenant_id, review.state, 1)
+        commit(self._session)
         self._session.refresh(review)
         return review
 
@@ -58,7 +147,7 @@ class PostgresReviewRepository(IReviewRepository):
             Review.id == review_id,
             Review.tenant_id == tenant_id
         )
-        return self._session.exec(statement).first()
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
 
     def get_by_sample_id(self, sample_id: str, tenant_id: str) -> Optional[Review]:
         """Retrieve a review by sample ID, ensuring it belongs to the tenant."""
@@ -66,14 +155,30 @@ class PostgresReviewRepository(IReviewRepository):
             Review.sample_id == sample_id,
             Review.tenant_id == tenant_id
         )
-        return self._session.exec(statement).first()
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
 
     def update(self, review: Review) -> Review:
         """Update an existing review."""
         with self._session.no_autoflush:
-            existing = self.get_by_id(review.id, review.tenant_id)
-            if not existing:
+            # existing may be the very instance the caller modified (the
+            # session's identity map), so the stored state is selected as a
+            # plain column alongside it. The row stays locked until commit,
+            # so a concurrent update of the same review waits and then sees
+            # this one's state, and the counters move once per transition
+            row = self._session.exec(
+                select(Review, Review.state).where(
+                    Review.id == review.id,
+                    Review.tenant_id == review.tenant_id
+                ).with_for_update(),
+                execution_options=self._tenant_options(review.tenant_id),
+            ).first()
+            if not row:
                 raise ReviewNotFoundError(f"Review with id '{review.id}' not found")
+            existing, stored_state = row
+
+            if stored_state != review.state:
+                self._adjust_state_count(review.tenant_id, stored_state, -1)
+                self._adjust_state_count(review.tenant_id, review.state, 1)
 
             # Update fields
             existing.reviewer_user_id = review.reviewer_user_id
@@ -83,13 +188,82 @@ class PostgresReviewRepository(IReviewRepository):
             existing.escalation_reason = review.escalation_reason
             existing.submitted_at = review.submitted_at
             existing.completed_at = review.completed_at
-            existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
+    def update_if_state(self, review: Review, expected_state: ReviewState) -> Optional[Review]:
+        """Update a review only if its stored state is still expected_state."""
+        with self._session.no_autoflush:
+            # Claim the transition with a conditional UPDATE; row locking makes
+            # a concurrent writer of the same row wait and then match nothing
+            claimed = self._session.execute(
+                update(Review)
+                .where(
+                    Review.id == review.id,
+                    Review.tenant_id == review.tenant_id,
+                    Review.state == expected_state,
+                )
+                .values(state=review.state),
+                execution_options=self._tenant_options(review.tenant_id),
+            ).rowcount
+
+        if not claimed:
+            if review in self._session:
+                # Discard the caller's changes so a later flush can't write them
+                self._session.refresh(review)
+            return None
+
+        if review.state != expected_state:
+            self._adjust_state_count(review.tenant_id, expected_state, -1)
+            self._adjust_state_count(review.tenant_id, review.state, 1)
+        # The stored state now matches, so update() leaves the counters alone
+        return self.update(review)
+
+    def decrement_pending_results(self, review_id: str, tenant_id: str) -> Optional[int]:
+        """Atomically count one more of a review's results as decided."""
+        remaining = self._session.execute(
+            update(Review)
+            .where(Review.id == review_id, Review.tenant_id == tenant_id)
+            .values(pending_results_count=case(
+                (Review.pending_results_count > 0, Review.pending_results_count - 1),
+                else_=0,
+            ))
+            .returning(Review.pending_results_count),
+            execution_options=self._tenant_options(tenant_id),
+        ).scalar_one_or_none()
+        commit(self._session)
+        return remaining
+
+    def set_pending_results(self, review_id: str, tenant_id: str, count: int) -> bool:
+        """Overwrite a review's count of results still awaiting a decision."""
+        updated = self._session.execute(
+            update(Review)
+            .where(Review.id == review_id, Review.tenant_id == tenant_id)
+            .values(pending_results_count=count),
+            execution_options=self._tenant_options(tenant_id),
+        ).rowcount
+        commit(self._session)
+        return bool(updated)
+
+    def list_awaiting_decisions(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 100
+    ) -> list[Review]:
+        """List reviews of every tenant that are pending or in progress."""
+        statement = (
+            select(Review)
+            .where(Review.state.in_((ReviewState.PENDING, ReviewState.IN_PROGRESS)))
+            .order_by(Review.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            statement = statement.where(Review.id > after_id)
+        return list(self._session.exec(statement).all())
+
     def list_by_tenant(
         self,
         tenant_id: str,
@@ -98,41 +272,67 @@ class PostgresReviewRepository(IReviewRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> tuple[list[Review], int]:
+        limit: int = 100,
+        include_total: bool = True
+    ) -> tuple[list[Review], Optional[int]]:
         """List reviews for a tenant with optional filtering."""
-        # Build base query
-        query = select(Review).where(Review.tenant_id == tenant_id)
+        params = {
+            "tenant_id": tenant_id,
+            "state": state or None,
+            "reviewer_user_id": reviewer_user_id or None,
+            "start_date": start_date,
+            "end_date": end_date,
+            "skip": skip,
+            "limit": limit,
+        }
+        options = self._tenant_options(tenant_id)
 
-        # Apply filters
-        if state:
-            query = query.where(Review.state == state)
-        if reviewer_user_id:
-            query = query.where(Review.reviewer_user_id == reviewer_user_id)
-        if start_date:
-            query = query.where(Review.created_at >= start_date)
-        if end_date:
-            query = query.where(Review.created_at <= end_date)
-
-        # Get total count before pagination
-        count_query = select(Review).where(Review.tenant_id == tenant_id)
-        if state:
-            count_query = count_query.where(Review.state == state)
-        if reviewer_user_id:
-            count_query = count_query.where(Review.reviewer_user_id == reviewer_user_id)
-        if start_date:
-            count_query = count_query.where(Review.created_at >= start_date)
-        if end_date:
-            count_query = count_query.where(Review.created_at <= end_date)
+        if include_total and (reviewer_user_id or start_date or end_date):
+            # Sorted by created_at (newest first) with pagination
+            rows = self._session.exec(
+                _LIST_TENANT_REVIEWS_WITH_TOTAL, params=params, execution_options=options
+            ).all()
+            if rows:
+                return [review for review, _ in rows], rows[0][1]
+            # A page past the end has no rows to carry the total
+            total = self.count_by_tenant(
+                tenant_id, state, reviewer_user_id, start_date, end_date
+            ) if skip else 0
+            return [], total
 
-        total = len(self._session.exec(count_query).all())
+        total = self._count_from_counters(tenant_id, state) if include_total else None
 
-        # Sort by created_at (newest first) and apply pagination
-        query = query.order_by(Review.created_at.desc()).offset(skip).limit(limit)
-        reviews = list(self._session.exec(query).all())
+        # Sorted by created_at (newest first) with pagination
+        reviews = list(self._session.exec(
+            _LIST_TENANT_REVIEWS, params=params, execution_options=options
+        ).all())
 
         return reviews, total
 
+    def count_by_tenant(
+        self,
+        tenant_id: str,
+        state: Optional[ReviewState] = None,
+        reviewer_user_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """Count a tenant's reviews matching list_by_tenant's filters."""
+        if not (reviewer_user_id or start_date or end_date):
+            return self._count_from_counters(tenant_id, state)
+
+        return self._session.exec(
+            _COUNT_TENANT_REVIEWS,
+            params={
+                "tenant_id": tenant_id,
+                "state": state or None,
+                "reviewer_user_id": reviewer_user_id or None,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+            execution_options=self._tenant_options(tenant_id),
+        ).one()
+
     def search(
         self,
         tenant_id: str,
@@ -152,16 +352,66 @@ class PostgresReviewRepository(IReviewRepository):
             query = query.where(Review.state == state)
 
         # Get total count before pagination
-        count_query = select(Review).where(Review.tenant_id == tenant_id)
         if sample_id:
-            count_query = count_query.where(Review.sample_id.ilike(f"%{sample_id}%"))
-        if state:
-            count_query = count_query.where(Review.state == state)
-
-        total = len(self._session.exec(count_query).all())
+            count_query = select(func.count()).select_from(Review).where(
+                Review.tenant_id == tenant_id,
+                Review.sample_id.ilike(f"%{sample_id}%"),
+            )
+            if state:
+                count_query = count_query.where(Review.state == state)
+            total = self._session.exec(count_query, execution_options=self._tenant_options(tenant_id)).one()
+        else:
+            total = self._count_from_counters(tenant_id, state)
 
         # Sort by created_at (newest first) and apply pagination
         query = query.order_by(Review.created_at.desc()).offset(skip).limit(limit)
-        reviews = list(self._session.exec(query).all())
+        reviews = list(self._session.exec(query, execution_options=self._tenant_options(tenant_id)).all())
 
         return reviews, total
+
+    def rebuild_state_counters(self) -> None:
+        """
+        Recompute every review state counter from the reviews table.
+
+        Counters are kept in step by create/update; this corrects any drift
+        (e.g. rows written outside the repository) and backfills counters for
+        reviews that existed before they were introduced.
+
+        Writers adjust the counters in the same transaction as the review
+        row, holding ROW EXCLUSIVE on the counter table. The rebuild takes
+        EXCLUSIVE first, which waits for writers in flight to commit and
+        holds off new ones until the rebuild commits, so the recount sees
+        every committed adjustment and none lands in between. (SQLite
+        serializes writers on its database lock anyway.)
+        """
+        if self._session.get_bind().dialect.name == "postgresql":
+            self._session.execute(
+                text(f"LOCK TABLE {ReviewStateCounter.__tablename__} IN EXCLUSIVE MODE")
+            )
+        self._session.exec(delete(ReviewStateCounter))
+        self._session.exec(
+            insert(ReviewStateCounter).from_select(
+                ["tenant_id", "state", "count"],
+                select(Review.tenant_id, Review.state, func.count()).group_by(
+                    Review.tenant_id, Review.state
+                ),
+            )
+        )
+        commit(self._session)
+
+    def _adjust_state_count(self, tenant_id: str, state: ReviewState, delta: int) -> None:
+        """Add delta to the tenant's counter for state, within the current transaction."""
+        dialect = self._session.get_bind().dialect.name
+        self._session.exec(
+            _COUNTER_UPSERTS[dialect],
+            params={"tenant_id": tenant_id, "state": state, "count": delta},
+            execution_options=self._tenant_options(tenant_id),
+        )
+
+    def _count_from_counters(self, tenant_id: str, state: Optional[ReviewState]) -> int:
+        """Total reviews for a tenant (optionally in one state) from the counters."""
+        return self._session.exec(
+            _SUM_STATE_COUNTERS,
+            params={"tenant_id": tenant_id, "state": state or None},
+            execution_options=self._tenant_options(tenant_id),
+        ).one()
@@ -1,24 +1,41 @@
 """PostgreSQL implementation of verification rule repository."""
 
+from sqlalchemy import func, insert
 from sqlmodel import Session, select
-import uuid
+from typing import Optional
 
+from app.adapters.tenant_compiled_cache import TenantCompiledCaches, tenant_execution_options
+from app.adapters.tenant_isolation import bind_session_tenant
+from app.adapters.unit_of_work import commit
 from app.ports import IVerificationRuleRepository
-from app.models import VerificationRule
+from app.models import RuleType, VerificationRule
+from app.models.ids import uuid7
 from app.exceptions import RuleNotFoundError
 
 
 class PostgresVerificationRuleRepository(IVerificationRuleRepository):
     """PostgreSQL implementation of verification rule repository with multi-tenant support."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, compiled_caches: Optional[TenantCompiledCaches] = None):
         """
         Initialize with database session.
 
         Args:
             session: SQLModel database session
+            compiled_caches: Per-tenant compiled statement caches (the
+                engine-wide cache is used if not given)
         """
         self._session = session
+        self._compiled_caches = compiled_caches
+
+    def _tenant_options(self, tenant_id: str):
+        """
+        Execution options selecting the tenant's compiled statement cache.
+
+        Also scopes the session to the tenant for row-level security.
+        """
+        bind_session_tenant(self._session, tenant_id)
+        return tenant_execution_options(self._compiled_caches, tenant_id)
 
     def get_by_tenant(self, tenant_id: str) -> list[VerificationRule]:
         """List all verification rules for a tenant, ordered by priority."""
@@ -26,7 +43,42 @@ class PostgresVerificationRuleRepository(IVerificationRuleRepository):
             VerificationRule.tenant_id == tenant_id
         ).order_by(VerificationRule.priority)
 
-        return list(self._session.exec(statement).all())
+        return list(self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).all())
+
+    def create_many(
+        self, rules: list[VerificationRule], tenant_id: str
+    ) -> list[VerificationRule]:
+        """Create several verification rules with one bulk INSERT and one commit."""
+        for rule in rules:
+            if rule.tenant_id != tenant_id:
+                raise ValueError("Rule must belong to the given tenant")
+
+        if not rules:
+            return []
+
+        for rule in rules:
+            if not rule.id:
+                rule.id = uuid7()
+
+        # Timestamps are left to the server defaults and come back through
+        # RETURNING along with the rest of each row
+        created = list(self._session.scalars(
+            insert(VerificationRule).returning(VerificationRule, sort_by_parameter_order=True),
+            [r.model_dump(exclude={"created_at", "updated_at"}) for r in rules],
+            execution_options=self._tenant_options(tenant_id),
+        ))
+        commit(self._session)
+        return created
+
+    def get_by_tenant_and_type(
+        self, tenant_id: str, rule_type: RuleType
+    ) -> Optional[VerificationRule]:
+        """Retrieve a tenant's rule of the given type (served by ix_rules_tenant_type)."""
+        statement = select(VerificationRule).where(
+            VerificationRule.tenant_id == tenant_id,
+            VerificationRule.rule_type == rule_type
+        )
+        return self._session.exec(statement, execution_options=self._tenant_options(tenant_id)).first()
 
     def update(self, rule: VerificationRule) -> VerificationRule:
         """Update an existing verification rule."""
@@ -36,7 +88,8 @@ class PostgresVerificationRuleRepository(IVerificationRuleRepository):
                 select(VerificationRule).where(
                     VerificationRule.id == rule.id,
                     VerificationRule.tenant_id == rule.tenant_id
-                )
+                ),
+                execution_options=self._tenant_options(rule.tenant_id),
             ).first()
 
             if not existing:
@@ -47,10 +100,9 @@ class PostgresVerificationRuleRepository(IVerificationRuleRepository):
             existing.enabled = rule.enabled
             existing.priority = rule.priority
             existing.description = rule.description
-            existing.update_timestamp()
 
         self._session.add(existing)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(existing)
         return existing
 
@@ -62,27 +114,30 @@ class PostgresVerificationRuleRepository(IVerificationRuleRepository):
         limit: int = 100
     ) -> tuple[list[VerificationRule], int]:
         """List all verification rules for a tenant with pagination."""
-        # Build base query
-        query = select(VerificationRule).where(
-            VerificationRule.tenant_id == tenant_id
-        )
-
-        # Apply enabled filter
+        filters = [VerificationRule.tenant_id == tenant_id]
         if enabled_only:
-            query = query.where(VerificationRule.enabled == True)
-
-        # Get total count before pagination
-        count_query = select(VerificationRule).where(
-            VerificationRule.tenant_id == tenant_id
+            filters.append(VerificationRule.enabled == True)
+
+        # Fetch the page and the total in a single round trip: the window
+        # count is evaluated before LIMIT/OFFSET are applied.
+        query = (
+            select(VerificationRule, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(VerificationRule.priority)
+            .offset(skip)
+            .limit(limit)
         )
-        if enabled_only:
-            count_query = count_query.where(VerificationRule.enabled == True)
-
-        total = len(self._session.exec(count_query).all())
-
-        # Sort by priority (ascending) and apply pagination
-        query = query.order_by(VerificationRule.priority).offset(skip).limit(limit)
-        rules = list(self._session.exec(query).all())
+        rows = self._session.exec(query, execution_options=self._tenant_options(tenant_id)).all()
+        rules = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0][1]
+        elif skip == 0:
+            total = 0
+        else:
+            # Page is past the end; fall back to a plain count
+            count_query = select(func.count()).select_from(VerificationRule).where(*filters)
+            total = self._session.exec(count_query, execution_options=self._tenant_options(tenant_id)).one()
 
         return rules, total
 
@@ -99,9 +154,10 @@ class PostgresVerificationRuleRepository(IVerificationRuleRepository):
 
         # Generate ID if not provided
         if not rule.id:
-            rule.id = str(uuid.uuid4())
+            rule.id = uuid7()
 
+        bind_session_tenant(self._session, rule.tenant_id)
         self._session.add(rule)
-        self._session.commit()
+        commit(self._session)
         self._session.refresh(rule)
         return rule
@@ -0,0 +1,51 @@
+"""Per-tenant partitioning of SQLAlchemy's compiled statement cache."""
+
+from threading import Lock
+from typing import Any, Mapping, Optional
+
+from sqlalchemy.util import EMPTY_DICT, LRUCache, immutabledict
+
+
+class TenantCompiledCaches:
+    """
+    Compiled statement caches kept separately for each tenant.
+
+    All tenants share one process, so with the single engine-wide cache a
+    tenant issuing many distinct query shapes can evict every other tenant's
+    statements. Each tenant gets its own small LRU instead, and the tenant
+    caches are themselves held in an LRU, so the caches of tenants that have
+    gone quiet are dropped first once max_tenants is reached. Memory is
+    bounded by roughly max_tenants * cache_size compiled statements.
+    """
+
+    def __init__(self, cache_size: int = 128, max_tenants: int = 1024):
+        """
+        Initialize with empty caches.
+
+        Args:
+            cache_size: Compiled statements kept per tenant
+            max_tenants: Tenants whose caches are kept at once
+        """
+        self._cache_size = cache_size
+        self._tenants: LRUCache = LRUCache(max_tenants)
+        self._lock = Lock()
+
+    def execution_options(self, tenant_id: str) -> Mapping[str, Any]:
+        """Execution options routing statements to the tenant's compiled cache."""
+        options = self._tenants.get(tenant_id)
+        if options is None:
+            with self._lock:
+                options = self._tenants.get(tenant_id)
+                if options is None:
+                    options = immutabledict({"compiled_cache": LRUCache(self._cache_size)})
+                    self._tenants[tenant_id] = options
+        return options
+
+
+def tenant_execution_options(
+    caches: Optional[TenantCompiledCaches], tenant_id: str
+) -> Mapping[str, Any]:
+    """Execution options for a tenant's statements; the engine cache if caches is None."""
+    if caches is None:
+        return EMPTY_DICT
+    return caches.execution_options(tenant_id)
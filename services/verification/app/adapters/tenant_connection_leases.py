@@ -0,0 +1,110 @@
+"""Per-tenant limits on concurrently held database sessions."""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+
+from app.exceptions import TenantConnectionLimitError
+
+
+@dataclass(frozen=True)
+class TenantPoolStats:
+    """Connection lease counts for one tenant."""
+
+    tenant_id: str
+    leased: int
+    waiting: int
+    max_leases: int
+
+
+class TenantConnectionLeases:
+    """
+    Soft per-tenant caps on database sessions served from the shared pool.
+
+    All tenants share one pool, so a single tenant issuing many concurrent
+    requests could hold every connection and starve the others. A request
+    must lease one of its tenant's max_per_tenant slots before it gets a
+    database session; once the slots are taken, the tenant's further
+    requests queue here (first come, first served) instead of in the pool,
+    leaving the remaining connections for other tenants.
+
+    Leases are taken and returned on the event loop, before the request
+    reaches the threadpool, so a queued request waits as a suspended
+    coroutine rather than parking one of the threadpool's worker threads.
+    Not thread-safe: use it from the event loop only.
+    """
+
+    def __init__(self, max_per_tenant: int, timeout: float):
+        """
+        Initialize with no leases held.
+
+        Args:
+            max_per_tenant: Sessions one tenant may hold at once
+            timeout: Seconds to wait for a free slot before failing
+        """
+        self.max_per_tenant = max_per_tenant
+        self.timeout = timeout
+        self._leased: dict[str, int] = {}
+        # Each tenant's queue of waiters, oldest first
+        self._waiting: dict[str, deque[asyncio.Future]] = {}
+
+    async def acquire(self, tenant_id: str) -> None:
+        """
+        Lease a session slot for the tenant, waiting up to timeout.
+
+        Raises:
+            TenantConnectionLimitError: If no slot frees up in time
+        """
+        if not self._waiting.get(tenant_id) and self._leased.get(tenant_id, 0) < self.max_per_tenant:
+            self._leased[tenant_id] = self._leased.get(tenant_id, 0) + 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._waiting.setdefault(tenant_id, deque())
+        queue.append(waiter)
+        try:
+            # release() hands its slot straight to the oldest waiter
+            await asyncio.wait_for(waiter, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise TenantConnectionLimitError(
+                f"Tenant {tenant_id} holds {self.max_per_tenant} connections; "
+                f"no lease freed within {self.timeout}s"
+            ) from None
+        except BaseException:
+            # Cancelled after the slot was handed over: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self.release(tenant_id)
+            raise
+        finally:
+            if waiter in queue:
+                queue.remove(waiter)
+            if not queue and self._waiting.get(tenant_id) is queue:
+                del self._waiting[tenant_id]
+
+    def release(self, tenant_id: str) -> None:
+        """Return a session slot leased by the tenant, or hand it to the next waiter."""
+        queue = self._waiting.get(tenant_id)
+        while queue:
+            waiter = queue.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        remaining = self._leased.get(tenant_id, 0) - 1
+        if remaining > 0:
+            self._leased[tenant_id] = remaining
+        else:
+            self._leased.pop(tenant_id, None)
+
+    def stats(self) -> list[TenantPoolStats]:
+        """Leases held and requests waiting, for every tenant with either."""
+        tenant_ids = sorted(self._leased.keys() | self._waiting.keys())
+        return [
+            TenantPoolStats(
+                tenant_id=tenant_id,
+                leased=self._leased.get(tenant_id, 0),
+                waiting=len(self._waiting.get(tenant_id, ())),
+                max_leases=self.max_per_tenant,
+            )
+            for tenant_id in tenant_ids
+        ]
@@ -0,0 +1,78 @@
+"""PostgreSQL row-level security keyed on the session's tenant."""
+
+from sqlalchemy import Engine, event, func, select, text
+from sqlmodel import Session
+
+# Custom setting the row-level security policies compare tenant_id against
+TENANT_SETTING = "app.current_tenant"
+
+# Tenant-owned tables protected by the tenant_isolation policy
+TENANT_TABLES = (
+    "reviews",
+    "review_state_counters",
+    "result_decisions",
+    "verification_rules",
+    "auto_verification_settings",
+)
+
+_SESSION_TENANT_KEY = "tenant_id"
+
+
+def _set_tenant(connection, tenant_id: str) -> None:
+    """Set the tenant for the rest of the connection's current transaction."""
+    # set_config(..., true) is SET LOCAL, but takes the value as a parameter
+    connection.execute(select(func.set_config(TENANT_SETTING, tenant_id, True)))
+
+
+def bind_session_tenant(session: Session, tenant_id: str) -> None:
+    """
+    Scope a session's transactions to a tenant.
+
+    The tenant is kept in session.info and set on every transaction the
+    session begins. Repositories call this before each tenant-scoped
+    statement; it only issues SQL when the tenant changes in the middle of
+    an open transaction.
+    """
+    if session.info.get(_SESSION_TENANT_KEY) == tenant_id:
+        return
+    session.info[_SESSION_TENANT_KEY] = tenant_id
+
+    if session.in_transaction():
+        connection = session.connection()
+        if connection.dialect.name == "postgresql":
+            _set_tenant(connection, tenant_id)
+
+
+@event.listens_for(Session, "after_begin")
+def _set_transaction_tenant(session, transaction, connection) -> None:
+    """Carry the session's tenant into each transaction it begins."""
+    tenant_id = session.info.get(_SESSION_TENANT_KEY)
+    if tenant_id is not None and connection.dialect.name == "postgresql":
+        _set_tenant(connection, tenant_id)
+
+
+def enable_row_level_security(engine: Engine) -> None:
+    """
+    Create the tenant_isolation policy on every tenant-owned table.
+
+    Rows are only visible to (and writable by) transactions whose
+    app.current_tenant matches their tenant_id; with no tenant set, none
+    are. The policies are forced, so they bind the table owner too: only
+    superusers and BYPASSRLS roles see across tenants. Jobs that need every
+    tenant's rows, such as rebuilding the review state counters, must
+    connect as such a role (see database_admin_url).
+
+    Idempotent; does nothing on databases other than PostgreSQL.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as connection:
+        for table in TENANT_TABLES:
+            connection.execute(text(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY"))
+            connection.execute(text(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY"))
+            connection.execute(text(f"DROP POLICY IF EXISTS tenant_isolation ON {table}"))
+            connection.execute(text(
+                f"CREATE POLICY tenant_isolation ON {table} "
+                f"USING (tenant_id = current_setting('{TENANT_SETTING}', true))"
+            ))
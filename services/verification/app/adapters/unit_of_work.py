@@ -0,0 +1,50 @@
+"""Grouping several repository writes into one database transaction."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlmodel import Session
+
+# session.info key set while a single_commit block is open. The LIS
+# integration repositories check the same key (app/adapters/unit_of_work.py
+# there), so their writes join the block when they share the session.
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def commit(session: Session) -> None:
+    """
+    Commit a repository write, or only flush it inside single_commit.
+
+    Flushing still sends the statements to the database in order, so later
+    reads and refreshes in the block see them.
+    """
+    if session.info.get(UNIT_OF_WORK_KEY):
+        session.flush()
+    else:
+        session.commit()
+
+
+@contextmanager
+def single_commit(session: Session) -> Iterator[None]:
+    """
+    Run the enclosed repository calls as one transaction, committed once.
+
+    Repositories commit through commit() above, which only flushes while
+    the block is open; the writes become durable together when the block
+    exits, or are all rolled back if it raises. A nested block joins the
+    outer one.
+    """
+    if session.info.get(UNIT_OF_WORK_KEY):
+        yield
+        return
+
+    session.info[UNIT_OF_WORK_KEY] = True
+    try:
+        yield
+    except BaseException:
+        session.rollback()
+        raise
+    else:
+        session.commit()
+    finally:
+        session.info.pop(UNIT_OF_WORK_KEY, None)
@@ -1,6 +1,8 @@
 """Review API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
@@ -115,7 +117,7 @@ class ResultDecisionResponse(BaseModel):
     result_id: str
     decision: str
     comments: Optional[str]
-    decided_at: str
+    decided_at: datetime
 
 
 class ReviewResponse(BaseModel):
@@ -128,10 +130,10 @@ class ReviewResponse(BaseModel):
     decision: Optional[str]
     comments: Optional[str]
     escalation_reason: Optional[str]
-    created_at: str
-    submitted_at: Optional[str]
-    completed_at: Optional[str]
-    updated_at: str
+    created_at: datetime
+    submitted_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    updated_at: datetime
     result_decisions: List[ResultDecisionResponse]
 
 
@@ -143,15 +145,15 @@ class ReviewQueueItem(BaseModel):
     reviewer_user_id: Optional[str]
     state: str
     decision: Optional[str]
-    created_at: str
-    submitted_at: Optional[str]
+    created_at: datetime
+    submitted_at: Optional[datetime]
 
 
 class ReviewQueueResponse(BaseModel):
     """Response model for review queue list."""
 
     reviews: List[ReviewQueueItem]
-    total: int
+    total: Optional[int]
     skip: int
     limit: int
 
@@ -163,7 +165,7 @@ class ReviewCreateResponse(BaseModel):
     sample_id: str
     reviewer_user_id: Optional[str]
     state: str
-    created_at: str
+    created_at: datetime
 
 
 class ReviewActionResponse(BaseModel):
@@ -184,14 +186,20 @@ class ResultDecisionActionResponse(BaseModel):
     message: str
 
 
+# Roles allowed through the review role checks
+_REVIEWER_ROLES = frozenset({"admin", "administrator", "pathologist", "reviewer"})
+_PATHOLOGIST_ROLES = frozenset({"admin", "administrator", "pathologist"})
+
+
 # Router
 reviews_router = APIRouter(
     prefix="/api/v1/reviews",
+    default_response_class=ORJSONResponse,
     tags=["reviews"]
 )
 
 
-def require_reviewer_role(user: dict = Depends(get_current_user)) -> dict:
+async def require_reviewer_role(user: dict = Depends(get_current_user)) -> dict:
     """
     Dependency to ensure user has reviewer or higher role.
 
@@ -206,8 +214,7 @@ def require_reviewer_role(user: dict = Depends(get_current_user)) -> dict:
     Raises:
         HTTPException: If user doesn't have appropriate role
     """
-    valid_roles = ["admin", "administrator", "pathologist", "reviewer"]
-    if user.get("role") not in valid_roles:
+    if user.get("role") not in _REVIEWER_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions. Reviewer role or higher required."
@@ -215,7 +222,7 @@ def require_reviewer_role(user: dict = Depends(get_current_user)) -> dict:
     return user
 
 
-def require_pathologist_role(user: dict = Depends(get_current_user)) -> dict:
+async def require_pathologist_role(user: dict = Depends(get_current_user)) -> dict:
     """
     Dependency to ensure user has pathologist or admin role.
 
@@ -228,8 +235,7 @@ def require_pathologist_role(user: dict = Depends(get_current_user)) -> dict:
     Raises:
         HTTPException: If user doesn't have appropriate role
     """
-    valid_roles = ["admin", "administrator", "pathologist"]
-    if user.get("role") not in valid_roles:
+    if user.get("role") not in _PATHOLOGIST_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions. Pathologist role or higher required."
@@ -252,7 +258,8 @@ async def get_review_queue(
     assigned_to_me: bool = Query(False, description="Show only reviews assigned to current user"),
     escalated: bool = Query(False, description="Show only escalated reviews"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
-    limit: int = Query(50, ge=1, le=500, description="Maximum number of records to return"),
+    limit: int = Query(50, ge=0, le=500, description="Maximum number of records to return (0 only counts)"),
+    include_total: bool = Query(True, description="Count all matching reviews (total is null if false)"),
 ):
     """
     Get review queue for current user.
@@ -265,51 +272,34 @@ async def get_review_queue(
     - assigned_to_me: Show only reviews assigned to current user
     - escalated: Show only reviews escalated to pathologist
     - skip: Pagination offset
-    - limit: Maximum records to return
+    - limit: Maximum records to return (0 returns only the total)
+    - include_total: Set to false to skip counting the matching reviews
 
     Returns:
         Paginated list of reviews in queue
     """
-    try:
-        # Determine reviewer filter
-        reviewer_user_id = None
-        if assigned_to_me:
-            reviewer_user_id = user.get("user_id")
-
-        result = review_service.list_review_queue(
-            tenant_id=tenant_id,
-            state=state,
-            reviewer_user_id=reviewer_user_id,
-            escalated_only=escalated,
-            skip=skip,
-            limit=limit,
-        )
-
-        queue_items = [
-            ReviewQueueItem(
-                review_id=r["review_id"],
-                sample_id=r["sample_id"],
-                reviewer_user_id=r["reviewer_user_id"],
-                state=r["state"],
-                decision=r["decision"],
-                created_at=r["created_at"],
-                submitted_at=r["submitted_at"],
-            )
-            for r in result["reviews"]
-        ]
-
-        return ReviewQueueResponse(
-            reviews=queue_items,
-            total=result["total"],
-            skip=result["skip"],
-            limit=result["limit"]
-        )
+    # Determine reviewer filter
+    reviewer_user_id = None
+    if assigned_to_me:
+        reviewer_user_id = user.get("user_id")
+
+    result = await run_in_threadpool(
+        review_service.list_review_queue,
+        tenant_id=tenant_id,
+        state=state,
+        reviewer_user_id=reviewer_user_id,
+        escalated_only=escalated,
+        skip=skip,
+        limit=limit,
+        include_total=include_total,
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving review queue: {str(e)}"
-        )
+    # list_review_queue returns slotted dataclasses in the ReviewQueueResponse
+    # shape, which orjson encodes natively (datetimes included), so they are
+    # encoded directly instead of being copied into one Pydantic model per
+    # review and validated again.
+    # response_model is kept for the OpenAPI schema.
+    return ORJSONResponse(result)
 
 
 @reviews_router.get(
@@ -343,44 +333,18 @@ async def get_review(
         404: If review not found
     """
     try:
-        review_data = review_service.get_review(review_id, tenant_id)
-
-        result_decisions = [
-            ResultDecisionResponse(
-                decision_id=d["decision_id"],
-                result_id=d["result_id"],
-                decision=d["decision"],
-                comments=d["comments"],
-                decided_at=d["decided_at"],
-            )
-            for d in review_data["result_decisions"]
-        ]
-
-        return ReviewResponse(
-            review_id=review_data["review_id"],
-            sample_id=review_data["sample_id"],
-            reviewer_user_id=review_data["reviewer_user_id"],
-            state=review_data["state"],
-            decision=review_data["decision"],
-            comments=review_data["comments"],
-            escalation_reason=review_data["escalation_reason"],
-            created_at=review_data["created_at"],
-            submitted_at=review_data["submitted_at"],
-            completed_at=review_data["completed_at"],
-            updated_at=review_data["updated_at"],
-            result_decisions=result_decisions,
-        )
+        review_data = await run_in_threadpool(review_service.get_review, review_id, tenant_id)
+
+        # The service returns a dataclass in the exact ReviewResponse shape, so
+        # encode it directly instead of building (and re-validating) one
+        # Pydantic model per result decision. response_model is kept for the OpenAPI schema.
+        return ORJSONResponse(review_data)
 
     except ReviewNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Review not found"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving review: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -413,7 +377,8 @@ async def create_review(
         409: If review already exists for this sample
     """
     try:
-        review = review_service.create_review(
+        review = await run_in_threadpool(
+            review_service.create_review,
             tenant_id=tenant_id,
             sample_id=request.sample_id,
             reviewer_user_id=request.reviewer_user_id,
@@ -424,7 +389,7 @@ async def create_review(
             sample_id=review.sample_id,
             reviewer_user_id=review.reviewer_user_id,
             state=review.state.value,
-            created_at=review.created_at.isoformat(),
+            created_at=review.created_at,
         )
 
     except SampleNotFoundError:
@@ -437,11 +402,6 @@ async def create_review(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Review already exists for sample '{request.sample_id}'"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating review: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -476,7 +436,8 @@ async def approve_sample(
         400: If review cannot be modified (already completed)
     """
     try:
-        review = review_service.approve_sample(
+        review = await run_in_threadpool(
+            review_service.approve_sample,
             review_id=review_id,
             tenant_id=tenant_id,
             user_id=user.get("user_id"),
@@ -505,11 +466,6 @@ async def approve_sample(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error approving sample: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -551,7 +507,8 @@ async def reject_sample(
                 detail="Rejection comments are required"
             )
 
-        review = review_service.reject_sample(
+        review = await run_in_threadpool(
+            review_service.reject_sample,
             review_id=review_id,
             tenant_id=tenant_id,
             user_id=user.get("user_id"),
@@ -580,11 +537,6 @@ async def reject_sample(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error rejecting sample: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -597,6 +549,7 @@ async def reject_sample(
 async def approve_result(
     review_id: str,
     request: ResultApprovalRequest,
+    background_tasks: BackgroundTasks,
     review_service: ReviewService = Depends(get_review_service),
     tenant_id: str = Depends(get_current_tenant_id),
     user: dict = Depends(require_reviewer_role),
@@ -605,7 +558,8 @@ async def approve_result(
     Approve an individual result within a review.
 
     Creates an approval decision for a specific result.
-    The review will be automatically completed if all results have been decided.
+    The review will be automatically completed if all results have been decided;
+    that check runs after the response is sent.
 
     Args:
         review_id: Review identifier
@@ -619,12 +573,14 @@ async def approve_result(
         400: If review cannot be modified or result doesn't belong to sample
     """
     try:
-        decision = review_service.approve_result(
+        decision = await run_in_threadpool(
+            review_service.approve_result,
             review_id=review_id,
             result_id=request.result_id,
             tenant_id=tenant_id,
             user_id=user.get("user_id"),
             comments=request.comments,
+            schedule=background_tasks.add_task,
         )
 
         return ResultDecisionActionResponse(
@@ -654,11 +610,6 @@ async def approve_result(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error approving result: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -671,6 +622,7 @@ async def approve_result(
 async def reject_result(
     review_id: str,
     request: ResultRejectionRequest,
+    background_tasks: BackgroundTasks,
     review_service: ReviewService = Depends(get_review_service),
     tenant_id: str = Depends(get_current_tenant_id),
     user: dict = Depends(require_reviewer_role),
@@ -679,7 +631,8 @@ async def reject_result(
     Reject an individual result within a review.
 
     Creates a rejection decision for a specific result.
-    The review will be automatically completed if all results have been decided.
+    The review will be automatically completed if all results have been decided;
+    that check runs after the response is sent.
     Comments are required to document the rejection reason.
 
     Args:
@@ -700,12 +653,14 @@ async def reject_result(
                 detail="Rejection comments are required"
             )
 
-        decision = review_service.reject_result(
+        decision = await run_in_threadpool(
+            review_service.reject_result,
             review_id=review_id,
             result_id=request.result_id,
             tenant_id=tenant_id,
             user_id=user.get("user_id"),
             comments=request.comments,
+            schedule=background_tasks.add_task,
         )
 
         return ResultDecisionActionResponse(
@@ -735,11 +690,6 @@ async def reject_result(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error rejecting result: {str(e)}"
-        )
 
 
 @reviews_router.post(
@@ -780,7 +730,8 @@ async def escalate_review(
                 detail="Escalation reason is required"
             )
 
-        review = review_service.escalate_review(
+        review = await run_in_threadpool(
+            review_service.escalate_review,
             review_id=review_id,
             tenant_id=tenant_id,
             user_id=user.get("user_id"),
@@ -809,8 +760,3 @@ async def escalate_review(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error escalating review: {str(e)}"
-        )
@@ -1,15 +1,20 @@
 """Verification rules API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from datetime import datetime
+import orjson
 
+from app.cache import TTLCache, etag_matches, make_etag
+from app.models import VerificationRule
 from app.services import SettingsService
-from app.dependencies import get_settings_service, get_current_tenant_id, get_current_user
+from app.dependencies import get_settings, get_settings_service, get_current_tenant_id, require_admin_role
 from app.exceptions import (
     RuleNotFoundError,
     InvalidConfigurationError,
-    InsufficientPermissionError,
 )
 
 
@@ -43,8 +48,8 @@ class RuleResponse(BaseModel):
     enabled: bool
     priority: int
     description: Optional[str]
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -57,32 +62,35 @@ class RulesListResponse(BaseModel):
     total: int
 
 
-# Router
-rules_router = APIRouter(
-    prefix="/api/v1/verification/rules",
-    tags=["verification-rules"]
-)
-
+def _rule_record(rule: VerificationRule) -> dict:
+    """
+    Build the response body for a rule returned by the service.
 
-def require_admin_role(user: dict = Depends(get_current_user)) -> dict:
+    The service output is already validated, so the dict is returned in an
+    ORJSONResponse instead of being validated against response_model again.
     """
-    Dependency to ensure user has admin role.
+    return {
+        "id": rule.id,
+        "rule_type": rule.rule_type.value,
+        "enabled": rule.enabled,
+        "priority": rule.priority,
+        "description": rule.description,
+        "created_at": rule.created_at,
+        "updated_at": rule.updated_at,
+    }
 
-    Args:
-        user: Current authenticated user
 
-    Returns:
-        User dict if authorized
+# Per-tenant cache of the encoded rules list and its ETag, invalidated by
+# update_rule_enablement
+_rules_cache = TTLCache(ttl=get_settings().response_cache_ttl_seconds)
 
-    Raises:
-        HTTPException: If user doesn't have admin role
-    """
-    if user.get("role") not in ["admin", "administrator"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions. Admin role required."
-        )
-    return user
+
+# Router
+rules_router = APIRouter(
+    prefix="/api/v1/verification/rules",
+    default_response_class=ORJSONResponse,
+    tags=["verification-rules"]
+)
 
 
 @rules_router.get(
@@ -95,6 +103,7 @@ def require_admin_role(user: dict = Depends(get_current_user)) -> dict:
 async def list_verification_rules(
     settings_service: SettingsService = Depends(get_settings_service),
     tenant_id: str = Depends(get_current_tenant_id),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     List all verification rules for the tenant.
@@ -108,35 +117,29 @@ async def list_verification_rules(
     - instrument_flag: Checks for blocked instrument flags
     - delta_check: Checks for significant change from previous result
 
+    The response carries an ETag; a request whose If-None-Match matches it
+    receives 304 Not Modified with no body.
+
     Returns:
         List of verification rules with enabled status and descriptions
     """
-    try:
-        rules_data = settings_service.get_rules(tenant_id)
-
-        rules_responses = [
-            RuleResponse(
-                id=rule["id"],
-                rule_type=rule["rule_type"],
-                enabled=rule["enabled"],
-                priority=rule["priority"],
-                description=rule["description"],
-                created_at=rule["created_at"],
-                updated_at=rule["updated_at"],
-            )
-            for rule in rules_data
-        ]
-
-        return RulesListResponse(
-            rules=rules_responses,
-            total=len(rules_responses)
-        )
+    cached = _rules_cache.get((tenant_id,))
+    if cached is None:
+        rules_data = await run_in_threadpool(settings_service.get_rules, tenant_id)
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error listing verification rules: {str(e)}"
-        )
+        # get_rules already returns dicts in the RuleResponse shape, with
+        # timestamps left for orjson to format, so the body is encoded once
+        # here and reused from the cache
+        body = orjson.dumps({"rules": rules_data, "total": len(rules_data)})
+        etag = make_etag((rule["updated_at"] for rule in rules_data), len(rules_data))
+        cached = (body, etag)
+        _rules_cache.set((tenant_id,), cached)
+
+    body, etag = cached
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @rules_router.put(
@@ -178,21 +181,15 @@ async def update_rule_enablement(
     """
     try:
         if request.enabled:
-            rule = settings_service.enable_rule(tenant_id, request.rule_type)
+            rule = await run_in_threadpool(settings_service.enable_rule, tenant_id, request.rule_type)
             action = "enabled"
         else:
-            rule = settings_service.disable_rule(tenant_id, request.rule_type)
+            rule = await run_in_threadpool(settings_service.disable_rule, tenant_id, request.rule_type)
             action = "disabled"
 
-        return RuleResponse(
-            id=rule.id,
-            rule_type=rule.rule_type.value,
-            enabled=rule.enabled,
-            priority=rule.priority,
-            description=rule.description,
-            created_at=rule.created_at.isoformat(),
-            updated_at=rule.updated_at.isoformat(),
-        )
+        _rules_cache.invalidate_tenant(tenant_id)
+
+        return ORJSONResponse(_rule_record(rule))
 
     except RuleNotFoundError:
         raise HTTPException(
@@ -204,8 +201,3 @@ async def update_rule_enablement(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating rule enablement: {str(e)}"
-        )
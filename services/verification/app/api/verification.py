@@ -1,17 +1,21 @@
 """Verification settings API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from datetime import datetime
+import orjson
 
+from app.cache import etag_matches, make_etag
+from app.models import AutoVerificationSettings
 from app.services import SettingsService
-from app.dependencies import get_settings_service, get_current_tenant_id, get_current_user
+from app.dependencies import get_settings_service, get_current_tenant_id, require_admin_role
 from app.exceptions import (
     SettingsNotFoundError,
     SettingsAlreadyExistsError,
     InvalidConfigurationError,
-    InsufficientPermissionError,
 )
 
 
@@ -93,8 +97,8 @@ class AutoVerificationSettingsResponse(BaseModel):
     instrument_flags_to_block: List[str]
     delta_check_threshold_percent: Optional[float]
     delta_check_lookback_days: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -109,32 +113,56 @@ class SettingsListResponse(BaseModel):
     limit: int
 
 
-# Router
-verification_router = APIRouter(
-    prefix="/api/v1/verification",
-    tags=["verification"]
-)
+class SettingsBatchCreateResponse(BaseModel):
+    """Response model for batch settings creation."""
 
+    created: List[AutoVerificationSettingsResponse]
+    skipped_test_codes: List[str] = Field(
+        ...,
+        description="Test codes that already had settings and were left unchanged"
+    )
+
+
+# AutoVerificationSettingsResponse keys, which are also settings field names
+_SETTINGS_RESPONSE_FIELDS = tuple(AutoVerificationSettingsResponse.model_fields)
 
-def require_admin_role(user: dict = Depends(get_current_user)) -> dict:
+
+def _settings_record(settings: AutoVerificationSettings) -> dict:
     """
-    Dependency to ensure user has admin role.
+    Build the response body for a settings record returned by the service.
 
-    Args:
-        user: Current authenticated user
+    The service output is already validated and orjson encodes it natively
+    (datetimes included), so endpoints return the dict in an ORJSONResponse
+    instead of having FastAPI validate it against response_model again.
+    response_model is kept for the OpenAPI schema.
+    """
+    return {field: getattr(settings, field) for field in _SETTINGS_RESPONSE_FIELDS}
 
-    Returns:
-        User dict if authorized
 
-    Raises:
-        HTTPException: If user doesn't have admin role
+async def _stream_settings_page(page: dict) -> AsyncIterator[bytes]:
     """
-    if user.get("role") not in ["admin", "administrator"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions. Admin role required."
-        )
-    return user
+    Encode a list_settings page as JSON one record at a time.
+
+    The service already returns dicts in the response shape, with
+    timestamps left for orjson to format, so each record is encoded
+    directly and flushed as it is produced instead of building the whole
+    response body in memory. It is an async generator so
+    Starlette iterates it on the event loop rather than in the threadpool.
+    """
+    yield b'{"settings":['
+    for index, record in enumerate(page["settings"]):
+        if index:
+            yield b","
+        yield orjson.dumps(record)
+    yield b'],"total":%d,"skip":%d,"limit":%d}' % (page["total"], page["skip"], page["limit"])
+
+
+# Router
+verification_router = APIRouter(
+    prefix="/api/v1/verification",
+    default_response_class=ORJSONResponse,
+    tags=["verification"]
+)
 
 
 @verification_router.get(
@@ -149,52 +177,38 @@ async def list_verification_settings(
     tenant_id: str = Depends(get_current_tenant_id),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     List all auto-verification settings for the tenant.
 
     Returns settings for all configured test codes with pagination.
     Results are sorted by test code alphabetically.
-    """
-    try:
-        result = settings_service.list_settings(
-            tenant_id=tenant_id,
-            skip=skip,
-            limit=limit
-        )
 
-        # Convert settings to response models
-        settings_responses = [
-            AutoVerificationSettingsResponse(
-                id=s["id"],
-                tenant_id=tenant_id,
-                test_code=s["test_code"],
-                test_name=s["test_name"],
-                reference_range_low=s["reference_range_low"],
-                reference_range_high=s["reference_range_high"],
-                critical_range_low=s["critical_range_low"],
-                critical_range_high=s["critical_range_high"],
-                instrument_flags_to_block=s["instrument_flags_to_block"],
-                delta_check_threshold_percent=s["delta_check_threshold_percent"],
-                delta_check_lookback_days=s["delta_check_lookback_days"],
-                created_at=s["created_at"],
-                updated_at=s["updated_at"],
-            )
-            for s in result["settings"]
-        ]
-
-        return SettingsListResponse(
-            settings=settings_responses,
-            total=result["total"],
-            skip=result["skip"],
-            limit=result["limit"]
-        )
+    The page is streamed record by record. The response carries an ETag; a
+    request whose If-None-Match matches it receives 304 Not Modified with no
+    body.
+    """
+    page = await run_in_threadpool(
+        settings_service.list_settings,
+        tenant_id=tenant_id,
+        skip=skip,
+        limit=limit
+    )
+    etag = make_etag(
+        (s["updated_at"] for s in page["settings"]),
+        page["total"],
+        skip,
+        limit,
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error listing verification settings: {str(e)}"
-        )
+    return StreamingResponse(
+        _stream_settings_page(page),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @verification_router.get(
@@ -222,34 +236,15 @@ async def get_verification_settings(
         404: If settings not found for this test code
     """
     try:
-        settings = settings_service.get_settings(tenant_id, test_code)
-
-        return AutoVerificationSettingsResponse(
-            id=settings.id,
-            tenant_id=settings.tenant_id,
-            test_code=settings.test_code,
-            test_name=settings.test_name,
-            reference_range_low=settings.reference_range_low,
-            reference_range_high=settings.reference_range_high,
-            critical_range_low=settings.critical_range_low,
-            critical_range_high=settings.critical_range_high,
-            instrument_flags_to_block=settings.get_instrument_flags_to_block(),
-            delta_check_threshold_percent=settings.delta_check_threshold_percent,
-            delta_check_lookback_days=settings.delta_check_lookback_days,
-            created_at=settings.created_at.isoformat(),
-            updated_at=settings.updated_at.isoformat(),
-        )
+        settings = await run_in_threadpool(settings_service.get_settings, tenant_id, test_code)
+
+        return ORJSONResponse(_settings_record(settings))
 
     except SettingsNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Verification settings not found for test code '{test_code}'"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving verification settings: {str(e)}"
-        )
 
 
 @verification_router.post(
@@ -284,7 +279,8 @@ async def create_verification_settings(
         400: If configuration is invalid
     """
     try:
-        settings = settings_service.create_settings(
+        settings = await run_in_threadpool(
+            settings_service.create_settings,
             tenant_id=tenant_id,
             test_code=settings_data.test_code,
             test_name=settings_data.test_name,
@@ -297,21 +293,7 @@ async def create_verification_settings(
             delta_check_lookback_days=settings_data.delta_check_lookback_days,
         )
 
-        return AutoVerificationSettingsResponse(
-            id=settings.id,
-            tenant_id=settings.tenant_id,
-            test_code=settings.test_code,
-            test_name=settings.test_name,
-            reference_range_low=settings.reference_range_low,
-            reference_range_high=settings.reference_range_high,
-            critical_range_low=settings.critical_range_low,
-            critical_range_high=settings.critical_range_high,
-            instrument_flags_to_block=settings.get_instrument_flags_to_block(),
-            delta_check_threshold_percent=settings.delta_check_threshold_percent,
-            delta_check_lookback_days=settings.delta_check_lookback_days,
-            created_at=settings.created_at.isoformat(),
-            updated_at=settings.updated_at.isoformat(),
-        )
+        return ORJSONResponse(_settings_record(settings), status_code=status.HTTP_201_CREATED)
 
     except SettingsAlreadyExistsError:
         raise HTTPException(
@@ -323,12 +305,61 @@ async def create_verification_settings(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
+
+
+@verification_router.post(
+    "/batch",
+    response_model=SettingsBatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create verification settings in batch",
+    description="Create auto-verification settings for many test codes at once. Admin only."
+)
+async def batch_create_verification_settings(
+    settings_data: List[AutoVerificationSettingsCreate],
+    settings_service: SettingsService = Depends(get_settings_service),
+    tenant_id: str = Depends(get_current_tenant_id),
+    user: dict = Depends(require_admin_role),
+):
+    """
+    Create auto-verification settings for many test codes in one request.
+
+    Intended for bulk imports. All entries are validated first and then
+    written in a single transaction. Test codes that already have settings
+    are skipped and reported in skipped_test_codes instead of failing the
+    whole batch.
+
+    Args:
+        settings_data: Settings configurations to create
+
+    Returns:
+        Created settings records and the skipped test codes
+
+    Raises:
+        403: If user doesn't have admin role
+        400: If any configuration is invalid (nothing is created)
+    """
+    try:
+        created = await run_in_threadpool(
+            settings_service.batch_create_settings,
+            tenant_id=tenant_id,
+            settings_data=[item.model_dump() for item in settings_data],
+        )
+    except InvalidConfigurationError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating verification settings: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
+    created_codes = {s.test_code for s in created}
+    skipped = list(dict.fromkeys(
+        item.test_code for item in settings_data if item.test_code not in created_codes
+    ))
+
+    return ORJSONResponse(
+        {"created": [_settings_record(s) for s in created], "skipped_test_codes": skipped},
+        status_code=status.HTTP_201_CREATED,
+    )
+
 
 @verification_router.put(
     "/{test_code}",
@@ -363,7 +394,8 @@ async def update_verification_settings(
         400: If updated configuration is invalid
     """
     try:
-        settings = settings_service.update_settings(
+        settings = await run_in_threadpool(
+            settings_service.update_settings,
             tenant_id=tenant_id,
             test_code=test_code,
             test_name=settings_data.test_name,
@@ -376,21 +408,7 @@ async def update_verification_settings(
             delta_check_lookback_days=settings_data.delta_check_lookback_days,
         )
 
-        return AutoVerificationSettingsResponse(
-            id=settings.id,
-            tenant_id=settings.tenant_id,
-            test_code=settings.test_code,
-            test_name=settings.test_name,
-            reference_range_low=settings.reference_range_low,
-            reference_range_high=settings.reference_range_high,
-            critical_range_low=settings.critical_range_low,
-            critical_range_high=settings.critical_range_high,
-            instrument_flags_to_block=settings.get_instrument_flags_to_block(),
-            delta_check_threshold_percent=settings.delta_check_threshold_percent,
-            delta_check_lookback_days=settings.delta_check_lookback_days,
-            created_at=settings.created_at.isoformat(),
-            updated_at=settings.updated_at.isoformat(),
-        )
+        return ORJSONResponse(_settings_record(settings))
 
     except SettingsNotFoundError:
         raise HTTPException(
@@ -402,11 +420,6 @@ async def update_verification_settings(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating verification settings: {str(e)}"
-        )
 
 
 @verification_router.delete(
@@ -439,7 +452,7 @@ async def delete_verification_settings(
         404: If settings not found for this test code
     """
     try:
-        settings_service.delete_settings(tenant_id, test_code)
+        await run_in_threadpool(settings_service.delete_settings, tenant_id, test_code)
         return None
 
     except SettingsNotFoundError:
@@ -447,8 +460,3 @@ async def delete_verification_settings(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Verification settings not found for test code '{test_code}'"
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error deleting verification settings: {str(e)}"
-        )
@@ -0,0 +1,163 @@
+"""In-process and HTTP caching helpers for read-mostly tenant configuration."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Keys are tuples whose first element is the tenant ID, so that every entry
+    belonging to a tenant can be dropped at once when that tenant's
+    configuration changes. Writes made by this process invalidate entries
+    explicitly; the TTL bounds staleness for writes made by other processes.
+
+    Attributes:
+        maxsize: Maximum number of entries kept before evicting the oldest
+        ttl: Lifetime of an entry in seconds
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that found no live entry
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove key from the cache and return its value (or default)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def invalidate_tenant(self, tenant_id: str) -> None:
+        """Remove every entry whose key belongs to the given tenant."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == tenant_id]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries currently stored (including expired ones)."""
+        return len(self._entries)
+
+
+class RequestCache:
+    """
+    Identity map of entities already loaded while handling one request.
+
+    Keys are (entity type, tenant ID, entity ID). Lookups that miss run the
+    loader and keep what it found; writes replace or drop the entry so later
+    reads in the same request see them. Not shared between requests (or
+    threads), so it needs no expiry or locking.
+
+    Attributes:
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that ran the loader
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Hashable, Any] = {}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the entity cached under key, loading (and caching) it if absent."""
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = loader()
+        if value is not None:
+            self._entries[key] = value
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store an entity just written under key."""
+        self._entries[key] = value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key so the next lookup loads it again."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+def make_etag(updated_at_values: Iterable[Any], *parts: Any) -> str:
+    """
+    Build a strong ETag for a list response.
+
+    The tag is derived from the newest updated_at among the listed records
+    plus any extra parts that change the payload (total, skip, limit), so
+    edits, inserts and deletes all produce a new tag.
+
+    Args:
+        updated_at_values: updated_at of each record in the list, all
+            datetimes or all ISO-formatted strings
+        *parts: Additional values identifying the payload
+
+    Returns:
+        Quoted ETag header value
+    """
+    newest = max(updated_at_values, default="")
+    key = "|".join(map(str, (newest, *parts)))
+    return f'"{hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an If-None-Match header value matches the given ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
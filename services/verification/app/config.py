@@ -1,7 +1,7 @@
 """Application configuration for Verification Service."""
 
-from pydantic_settings import BaseSettings
-from typing import List
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class AppSettings(BaseSettings):
@@ -13,6 +13,9 @@ class AppSettings(BaseSettings):
 
     # Database settings
     database_url: str = "postgresql://localhost/ivd_middleware"
+    # Table owner for schema setup and maintenance jobs (defaults to database_url);
+    # must be a superuser or BYPASSRLS role when db_row_level_security is on
+    database_admin_url: Optional[str] = None
     use_real_database: bool = True
 
     # JWT settings for token validation
@@ -64,15 +67,33 @@ class AppSettings(BaseSettings):
     platform_service_url: str = "http://localhost:8000"
 
     # Performance settings
-    db_pool_size: int = 5
-    db_max_overflow: int = 10
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 10  # Seconds to wait for a free connection before failing
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
     db_pool_pre_ping: bool = True
+    db_query_cache_size: int = 1200  # Compiled SQL statements kept per engine
+    db_tenant_query_cache_size: int = 128  # Compiled SQL statements kept per tenant
+    db_query_cache_max_tenants: int = 1024  # Tenants whose statement caches are kept
+    db_max_connections_per_tenant: int = 10  # Pooled connections one tenant may hold (0 = no limit)
+    db_row_level_security: bool = False  # Create tenant_isolation RLS policies (PostgreSQL)
+    review_counter_reconcile_interval_seconds: int = 3600  # Between review state counter rebuilds (0 = never)
+    review_completion_sweep_interval_seconds: int = 600  # Between sweeps completing stalled reviews (0 = never)
+    response_cache_ttl_seconds: int = 300
+    # Settings and rules the engine verifies against; other workers only see
+    # a change once their copy expires, so keep this short
+    verification_rules_cache_ttl_seconds: int = 5
 
     # Default verification rule settings
     initialize_default_rules_on_startup: bool = True
 
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        case_sensitive = False
-        env_prefix = "VERIFICATION_"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        env_prefix="VERIFICATION_",
+        frozen=True,
+    )
+
+
+# Process-wide settings, validated once at import
+settings = AppSettings()
@@ -1,14 +1,25 @@
 """Dependency injection setup for Verification Service."""
 
+import functools
+from contextlib import contextmanager
 from functools import lru_cache
+from sqlalchemy import Engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, create_engine, SQLModel
 from sqlmodel.pool import StaticPool
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from jose import JWTError, jwt
+from jose.exceptions import JWTClaimsError
+from typing import Callable, Iterator, Optional
 import logging
+import time
 
-from app.config import AppSettings
+from app._stubs import module_available
+from app.config import AppSettings, settings as app_settings
+from app.cache import TTLCache
+from app.models import ReviewStateCounter
 from app.ports import (
     IAutoVerificationSettingsRepository,
     IReviewRepository,
@@ -24,6 +35,10 @@ from app.adapters import (
     InMemoryReviewRepository,
     InMemoryResultDecisionRepository,
     InMemoryVerificationRuleRepository,
+    TenantCompiledCaches,
+    TenantConnectionLeases,
+    enable_row_level_security,
+    single_commit,
 )
 from app.services import (
     VerificationEngine,
@@ -32,159 +47,559 @@ from app.services import (
     SettingsService,
 )
 
+
 # Import from LIS integration service for result and sample repositories
 # In production, this would be done via service-to-service communication
-try:
-    from services.lis_integration.app.ports import (
+HAS_LIS_INTEGRATION = module_available("services.lis_integration.app.ports")
+
+if HAS_LIS_INTEGRATION:
+    try:
+        from services.lis_integration.app.ports import (
+            IResultRepository,
+            ISampleRepository,
+        )
+        from services.lis_integration.app.adapters import (
+            PostgresResultRepository,
+            PostgresSampleRepository,
+            InMemoryResultRepository,
+            InMemorySampleRepository,
+        )
+    except ImportError:
+        HAS_LIS_INTEGRATION = False
+
+if not HAS_LIS_INTEGRATION:
+    # Fallback for when running in isolation
+    from app._stubs import (
         IResultRepository,
         ISampleRepository,
-    )
-    from services.lis_integration.app.adapters import (
         PostgresResultRepository,
         PostgresSampleRepository,
         InMemoryResultRepository,
         InMemorySampleRepository,
     )
-    HAS_LIS_INTEGRATION = True
-except ImportError:
-    # Fallback for when running in isolation
-    HAS_LIS_INTEGRATION = False
-    from typing import Protocol
 
-    class IResultRepository(Protocol):
-        """Protocol for result repository when LIS service is not available."""
-        pass
 
-    class ISampleRepository(Protocol):
-        """Protocol for sample repository when LIS service is not available."""
-        pass
+logger = logging.getLogger(__name__)
 
-    class PostgresResultRepository:
-        """Mock for result repository."""
-        def __init__(self, session):
-            self.session = session
 
-    class PostgresSampleRepository:
-        """Mock for sample repository."""
-        def __init__(self, session):
-            self.session = session
+def get_settings() -> AppSettings:
+    """Get the process-wide application settings."""
+    return app_settings
+
+
+# Pragmas for file-backed SQLite used in local development: WAL lets readers
+# run alongside a writer, and a larger page cache / mmap keeps pooled
+# connections warm between queries
+_SQLITE_LOCAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
 
-    class InMemoryResultRepository:
-        """Mock for in-memory result repository."""
-        pass
 
-    class InMemorySampleRepository:
-        """Mock for in-memory sample repository."""
-        pass
+def _apply_sqlite_local_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure each new SQLite connection for local development."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_LOCAL_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@lru_cache(maxsize=None)
+def _make_engine(
+    environment: str,
+    database_url: str,
+    use_real_database: bool,
+    pool_pre_ping: bool,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: int,
+    pool_recycle: int,
+    query_cache_size: int,
+) -> Engine:
+    """Create the database engine for one configuration (cached per configuration)."""
+    if environment == "local" and not use_real_database:
+        # Use in-memory SQLite for local development
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            query_cache_size=query_cache_size,
+        )
+        logger.info("Using in-memory SQLite database for local development")
+    else:
+        # Use configured database URL with connection pooling
+        is_sqlite = database_url.startswith("sqlite")
+        engine = create_engine(
+            database_url,
+            connect_args={"check_same_thread": False} if is_sqlite else {},
+            pool_pre_ping=pool_pre_ping,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            query_cache_size=query_cache_size,
+        )
+        if is_sqlite and environment == "local":
+            event.listen(engine, "connect", _apply_sqlite_local_pragmas)
+        logger.info(f"Connected to database: {database_url}")
 
+    return engine
 
-logger = logging.getLogger(__name__)
 
+def get_engine(settings: AppSettings) -> Engine:
+    """Get or create database engine (cached)."""
+    return _make_engine(
+        settings.environment,
+        settings.database_url,
+        settings.use_real_database,
+        settings.db_pool_pre_ping,
+        settings.db_pool_size,
+        settings.db_max_overflow,
+        settings.db_pool_timeout,
+        settings.db_pool_recycle,
+        settings.db_query_cache_size,
+    )
 
-# Singleton settings
-@lru_cache()
-def get_settings() -> AppSettings:
-    """Get application settings (cached)."""
-    return AppSettings()
+
+def get_admin_engine(settings: AppSettings) -> Engine:
+    """
+    Get or create the engine for schema setup and maintenance jobs (cached).
+
+    Connects as database_admin_url, the table owner, so the application's
+    own role needs no DDL rights and stays bound by row-level security.
+    Without an admin URL this is the application engine.
+    """
+    if not settings.database_admin_url or not settings.use_real_database:
+        return get_engine(settings)
+
+    return _make_engine(
+        settings.environment,
+        settings.database_admin_url,
+        settings.use_real_database,
+        settings.db_pool_pre_ping,
+        1,  # Startup and the periodic counter rebuild need one connection at a time
+        0,
+        settings.db_pool_timeout,
+        settings.db_pool_recycle,
+        settings.db_query_cache_size,
+    )
 
 
-# Database engine cache
-_engine_cache = {}
+# Set once the tables have been created for this process
+_schema_ready = False
 
 
-def get_engine(settings: AppSettings):
-    """Get or create database engine (cached)."""
-    cache_key = f"{settings.environment}_{settings.database_url}_{settings.use_real_database}"
-
-    if cache_key not in _engine_cache:
-        if settings.environment == "local" and not settings.use_real_database:
-            # Use in-memory SQLite for local development
-            engine = create_engine(
-                "sqlite:///:memory:",
-                connect_args={"check_same_thread": False},
-                poolclass=StaticPool
-            )
-            SQLModel.metadata.create_all(engine)
-            logger.info("Using in-memory SQLite database for local development")
-        else:
-            # Use configured database URL with connection pooling
-            engine = create_engine(
-                settings.database_url,
-                pool_pre_ping=settings.db_pool_pre_ping,
-                pool_size=settings.db_pool_size,
-                max_overflow=settings.db_max_overflow
-            )
-            SQLModel.metadata.create_all(engine)
-            logger.info(f"Connected to database: {settings.database_url}")
-
-        _engine_cache[cache_key] = engine
-
-    return _engine_cache[cache_key]
+def ensure_schema(settings: AppSettings) -> None:
+    """
+    Create any missing tables once per process.
+
+    Called from application startup so the first request doesn't pay for
+    walking the table metadata. With db_row_level_security enabled the
+    tenant isolation policies are (re)created as well. When the review
+    state counter table is created alongside existing reviews, the counters
+    are backfilled so list totals are right from the first request. Runs
+    as the admin role (see get_admin_engine).
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+
+    engine = get_admin_engine(settings)
+    counters_existed = inspect(engine).has_table(ReviewStateCounter.__tablename__)
+    SQLModel.metadata.create_all(engine)
+    if settings.db_row_level_security:
+        enable_row_level_security(engine)
+    if not counters_existed:
+        rebuild_review_state_counters(settings)
+    _schema_ready = True
+
+
+def _can_read_all_tenants(settings: AppSettings, job: str) -> bool:
+    """
+    Check that a cross-tenant maintenance job will see every tenant's rows.
+
+    With row-level security forced, the application role sees no rows
+    outside a bound tenant; a job falling back to it without an admin URL
+    would read nothing (and rebuild every counter as zero). Such runs are
+    skipped, with an error logged each time.
+    """
+    if settings.db_row_level_security and not settings.database_admin_url:
+        logger.error(
+            "Skipping %s: db_row_level_security is enabled but database_admin_url "
+            "is not set, so the application role cannot read other tenants' rows",
+            job,
+        )
+        return False
+    return True
+
+
+def rebuild_review_state_counters(settings: AppSettings) -> None:
+    """
+    Recompute the review state counters from the reviews table.
+
+    Run on schema creation and periodically from application startup (see
+    review_counter_reconcile_interval_seconds) to correct any drift. Runs
+    as the admin role, since it reads every tenant's reviews. Does nothing
+    with in-memory repositories, which count reviews directly, or when the
+    admin role isn't configured (see _can_read_all_tenants).
+    """
+    if not settings.use_real_database:
+        return
+    if not _can_read_all_tenants(settings, "review state counter rebuild"):
+        return
+
+    with _session_factory_for(get_admin_engine(settings))() as session:
+        PostgresReviewRepository(session).rebuild_state_counters()
+    logger.info("Rebuilt review state counters")
+
+
+def complete_stalled_reviews(settings: AppSettings) -> int:
+    """
+    Complete reviews whose completion check was lost, across all tenants.
+
+    Run periodically from application startup (see
+    review_completion_sweep_interval_seconds), as the admin role since it
+    reads every tenant's reviews. Returns the number of reviews completed.
+    """
+    if not settings.use_real_database:
+        return 0
+    if not _can_read_all_tenants(settings, "stalled review sweep"):
+        return 0
+    if not HAS_LIS_INTEGRATION:
+        logger.warning("LIS integration not available - stalled reviews not completed")
+        return 0
+
+    with open_review_service(settings, admin=True) as service:
+        completed = service.complete_stalled_reviews()
+    logger.info("Completed %s stalled reviews", completed)
+    return completed
+
+
+# Session factory cache, one per engine
+_session_factory_cache: dict[Engine, sessionmaker] = {}
+
+
+def get_session_factory(settings: AppSettings) -> sessionmaker:
+    """
+    Get or create the session factory bound to the cached engine.
+
+    Sessions don't expire loaded objects on commit (repositories refresh
+    explicitly where they need database-generated values) and don't
+    autoflush (repositories commit each write), so a request only pays for
+    a pool checkout when it first touches the database.
+    """
+    return _session_factory_for(get_engine(settings))
+
+
+def _session_factory_for(engine: Engine) -> sessionmaker:
+    """Get or create the session factory for an engine (see get_session_factory)."""
+    if engine not in _session_factory_cache:
+        _session_factory_cache[engine] = sessionmaker(
+            engine,
+            class_=Session,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+
+    return _session_factory_cache[engine]
+
+
+def warm_up_connection_pool(settings: AppSettings) -> None:
+    """
+    Open the pool's base connections up front so the first requests don't pay
+    for connection establishment.
+
+    Checks out db_pool_size connections at once (so each one is a distinct
+    connection), runs a trivial query on each and returns them to the pool.
+    """
+    if not settings.use_real_database:
+        return
+
+    engine = get_engine(settings)
+    connections = []
+    try:
+        for _ in range(settings.db_pool_size):
+            connection = engine.connect()
+            connections.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in connections:
+            connection.close()
+
+    logger.info(f"Warmed up {len(connections)} database connections")
+
+
+# Security dependencies
+security = HTTPBearer()
+
+
+@lru_cache(maxsize=8192)
+def _decode_token(token: str) -> dict:
+    """
+    Verify a JWT issued by the Platform Service and return its claims (cached).
+
+    Requests from the same client carry the same token, so the signature is
+    verified once per token rather than once per dependency per request.
+    Failed decodes raise and are therefore never cached.
+
+    Raises:
+        JWTError: If the signature, expiry, audience or required claims are invalid
+    """
+    settings = get_settings()
+    claims = jwt.decode(
+        token,
+        settings.jwt_secret,
+        algorithms=[settings.jwt_algorithm],
+        audience=settings.jwt_audience,
+        options={"require_exp": True},
+    )
+    if not claims.get("tenant_id"):
+        raise JWTClaimsError("Token has no tenant_id claim")
+    return claims
+
+
+def get_token_claims(token: str) -> dict:
+    """
+    Get the validated claims of a bearer token.
+
+    Args:
+        token: Encoded JWT from the Authorization header
+
+    Returns:
+        Token claims (shared with the decode cache, so must not be mutated)
+
+    Raises:
+        HTTPException: If the token is missing, invalid or expired
+    """
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing token"
+        )
+
+    try:
+        claims = _decode_token(token)
+    except JWTError:
+        claims = None
+
+    # Cached claims outlive the token, so expiry is re-checked on every use
+    if claims is None or claims["exp"] <= time.time():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
+async def get_current_tenant_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """
+    Extract and validate tenant ID from JWT token.
+
+    This dependency ensures multi-tenant isolation.
+    """
+    return get_token_claims(credentials.credentials)["tenant_id"]
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    """
+    Get current user from JWT token.
+
+    Returns user information including tenant_id, user_id, and role.
+    Used for authorization and audit trail.
+    """
+    claims = get_token_claims(credentials.credentials)
+    return {
+        "tenant_id": claims["tenant_id"],
+        "user_id": claims.get("sub"),
+        "role": claims.get("role"),  # Possible roles: admin, reviewer, pathologist
+    }
+
+
+async def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> Optional[dict]:
+    """
+    Get current user from JWT token if available, otherwise return None.
+
+    Used for endpoints that support both authenticated and unauthenticated access.
+    """
+    if not credentials:
+        return None
+
+    try:
+        return await get_current_user(credentials)
+    except HTTPException:
+        return None
+
+
+# Roles allowed through require_admin_role
+_ADMIN_ROLES = frozenset({"admin", "administrator"})
+
+
+async def require_admin_role(user: dict = Depends(get_current_user)) -> dict:
+    """
+    Dependency to ensure user has admin role.
+
+    Args:
+        user: Current authenticated user
+
+    Returns:
+        User dict if authorized
+
+    Raises:
+        HTTPException: If user doesn't have admin role
+    """
+    if user.get("role") not in _ADMIN_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions. Admin role required."
+        )
+    return user
+
+
+# Per-tenant caps on pooled connections, so one busy tenant can't hold the
+# whole pool (None when disabled)
+tenant_connection_leases: Optional[TenantConnectionLeases] = (
+    TenantConnectionLeases(
+        max_per_tenant=app_settings.db_max_connections_per_tenant,
+        timeout=app_settings.db_pool_timeout,
+    )
+    if app_settings.use_real_database and app_settings.db_max_connections_per_tenant > 0
+    else None
+)
 
 
 # Database session factory
-def get_db_session(settings: AppSettings = Depends(get_settings)):
+async def get_db_session(
+    settings: AppSettings = Depends(get_settings),
+    tenant_id: str = Depends(get_current_tenant_id),
+):
     """
     Create database session with cached engine.
 
-    Uses connection pooling for better performance.
+    Uses connection pooling for better performance. FastAPI caches this
+    dependency per request, so every repository (and therefore every service)
+    resolved for one request shares this session and holds at most one
+    pooled connection. The request first leases one of its tenant's slots
+    (see TenantConnectionLeases) and keeps it until the session is closed.
+
+    Declared async so that the lease wait and setting up the session, which
+    does no I/O because connections are checked out lazily, stay on the
+    event loop instead of taking a threadpool hop. Closing only goes through
+    the threadpool when the session still holds a connection that needs a
+    rollback.
     """
-    engine = get_engine(settings)
-    session = Session(engine)
+    if tenant_connection_leases is not None:
+        await tenant_connection_leases.acquire(tenant_id)
     try:
-        yield session
+        session = get_session_factory(settings)()
+        try:
+            yield session
+        finally:
+            if session.in_transaction():
+                await run_in_threadpool(session.close)
+            else:
+                session.close()
     finally:
-        session.close()
+        if tenant_connection_leases is not None:
+            tenant_connection_leases.release(tenant_id)
+
+
+@lru_cache(maxsize=None)
+def _in_memory_repository(repository_class: type):
+    """
+    Get the process-wide instance of an in-memory repository.
+
+    In-memory repositories keep their data on the instance, so all requests
+    share one instance per class instead of each starting from an empty store.
+    """
+    return repository_class()
+
+
+def _select_repository(
+    postgres_class: type,
+    in_memory_class: type,
+    compiled_caches: Optional[TenantCompiledCaches] = None,
+) -> Callable[[Session], object]:
+    """
+    Resolve the repository implementation for this process.
+
+    use_real_database is fixed for the process lifetime, so the choice is
+    made once at import rather than on every request.
+    """
+    if app_settings.use_real_database:
+        if compiled_caches is None:
+            return postgres_class
+        return lambda session: postgres_class(session, compiled_caches=compiled_caches)
+    return lambda session: _in_memory_repository(in_memory_class)
+
+
+# Compiled statements for the verification repositories are cached per tenant,
+# so no single tenant's query shapes can crowd out everyone else's
+_tenant_compiled_caches = TenantCompiledCaches(
+    cache_size=app_settings.db_tenant_query_cache_size,
+    max_tenants=app_settings.db_query_cache_max_tenants,
+)
+
+_settings_repository = _select_repository(
+    PostgresAutoVerificationSettingsRepository,
+    InMemoryAutoVerificationSettingsRepository,
+    _tenant_compiled_caches,
+)
+_review_repository = _select_repository(
+    PostgresReviewRepository, InMemoryReviewRepository, _tenant_compiled_caches
+)
+_result_decision_repository = _select_repository(
+    PostgresResultDecisionRepository, InMemoryResultDecisionRepository, _tenant_compiled_caches
+)
+_verification_rule_repository = _select_repository(
+    PostgresVerificationRuleRepository, InMemoryVerificationRuleRepository, _tenant_compiled_caches
+)
+_result_repository = _select_repository(PostgresResultRepository, InMemoryResultRepository)
+_sample_repository = _select_repository(PostgresSampleRepository, InMemorySampleRepository)
 
 
 # Repository factories for verification service
 def get_auto_verification_settings_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> IAutoVerificationSettingsRepository:
     """Create auto-verification settings repository based on configuration."""
-    if settings.use_real_database:
-        return PostgresAutoVerificationSettingsRepository(session)
-    else:
-        return InMemoryAutoVerificationSettingsRepository()
+    return _settings_repository(session)
 
 
 def get_review_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> IReviewRepository:
     """Create review repository based on configuration."""
-    if settings.use_real_database:
-        return PostgresReviewRepository(session)
-    else:
-        return InMemoryReviewRepository()
+    return _review_repository(session)
 
 
 def get_result_decision_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> IResultDecisionRepository:
     """Create result decision repository based on configuration."""
-    if settings.use_real_database:
-        return PostgresResultDecisionRepository(session)
-    else:
-        return InMemoryResultDecisionRepository()
+    return _result_decision_repository(session)
 
 
 def get_verification_rule_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> IVerificationRuleRepository:
     """Create verification rule repository based on configuration."""
-    if settings.use_real_database:
-        return PostgresVerificationRuleRepository(session)
-    else:
-        return InMemoryVerificationRuleRepository()
+    return _verification_rule_repository(session)
 
 
 # Repository factories for LIS integration
 def get_result_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> Optional[IResultRepository]:
     """
@@ -198,14 +613,10 @@ def get_result_repository(
         logger.warning("LIS integration not available - result repository unavailable")
         return None
 
-    if settings.use_real_database:
-        return PostgresResultRepository(session)
-    else:
-        return InMemoryResultRepository()
+    return _result_repository(session)
 
 
 def get_sample_repository(
-    settings: AppSettings = Depends(get_settings),
     session: Session = Depends(get_db_session)
 ) -> Optional[ISampleRepository]:
     """
@@ -219,10 +630,7 @@ def get_sample_repository(
         logger.warning("LIS integration not available - sample repository unavailable")
         return None
 
-    if settings.use_real_database:
-        return PostgresSampleRepository(session)
-    else:
-        return InMemorySampleRepository()
+    return _sample_repository(session)
 
 
 # Verification engine factory
@@ -240,7 +648,9 @@ def get_verification_engine(
     return VerificationEngine(
         settings_repository=settings_repo,
         rules_repository=rules_repo,
-        result_repository=result_repo
+        result_repository=result_repo,
+        settings_cache=get_settings_lookup_cache(),
+        rules_cache=get_rules_lookup_cache(),
     )
 
 
@@ -266,17 +676,43 @@ def get_verification_service(
     )
 
 
+@contextmanager
+def open_review_service(settings: AppSettings, admin: bool = False) -> Iterator[ReviewService]:
+    """
+    Create a review service on a session of its own, closed on exit.
+
+    For work that outlives the request, such as completion checks run as
+    background tasks: by then the request's session may be closed, or
+    still in use by the request's own teardown. With admin, the session
+    connects as the admin role (see get_admin_engine), for maintenance
+    jobs that work across tenants.
+    """
+    engine = get_admin_engine(settings) if admin else get_engine(settings)
+    with _session_factory_for(engine)() as session:
+        yield ReviewService(
+            review_repository=_review_repository(session),
+            result_decision_repository=_result_decision_repository(session),
+            result_repository=_result_repository(session) if HAS_LIS_INTEGRATION else None,
+            sample_repository=_sample_repository(session) if HAS_LIS_INTEGRATION else None,
+            unit_of_work=functools.partial(single_commit, session),
+        )
+
+
 def get_review_service(
     review_repo: IReviewRepository = Depends(get_review_repository),
     decision_repo: IResultDecisionRepository = Depends(get_result_decision_repository),
     result_repo: Optional[IResultRepository] = Depends(get_result_repository),
-    sample_repo: Optional[ISampleRepository] = Depends(get_sample_repository)
+    sample_repo: Optional[ISampleRepository] = Depends(get_sample_repository),
+    session: Session = Depends(get_db_session),
 ) -> ReviewService:
     """
     Create review service with injected dependencies.
 
     The service manages manual review workflow for test results that
     failed auto-verification, including approval, rejection, and escalation.
+    All repositories share the request's session, so each decision
+    workflow is committed as one transaction; completion checks deferred
+    past the response open their own session.
     """
     if result_repo is None or sample_repo is None:
         logger.warning("Creating ReviewService with missing repositories")
@@ -285,96 +721,56 @@ def get_review_service(
         review_repository=review_repo,
         result_decision_repository=decision_repo,
         result_repository=result_repo,
-        sample_repository=sample_repo
+        sample_repository=sample_repo,
+        unit_of_work=(
+            functools.partial(single_commit, session)
+            if app_settings.use_real_database
+            else None
+        ),
+        completion_service_factory=(
+            functools.partial(open_review_service, app_settings)
+            if app_settings.use_real_database
+            else None
+        ),
     )
 
 
-def get_settings_service(
-    settings_repo: IAutoVerificationSettingsRepository = Depends(get_auto_verification_settings_repository),
-    rules_repo: IVerificationRuleRepository = Depends(get_verification_rule_repository)
-) -> SettingsService:
-    """
-    Create settings service with injected dependencies.
-
-    The service manages configuration of verification rules and settings
-    including reference ranges, critical ranges, and delta check parameters.
-    """
-    return SettingsService(
-        settings_repository=settings_repo,
-        rules_repository=rules_repo
-    )
-
-
-# Security dependencies
-security = HTTPBearer()
-
-
-def get_current_tenant_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> str:
+@lru_cache()
+def get_settings_lookup_cache() -> TTLCache:
     """
-    Extract and validate tenant ID from JWT token.
+    Get the process-wide cache of settings lookups.
 
-    This dependency ensures multi-tenant isolation.
-    In a real implementation, this would validate the JWT token
-    with the Platform Service. For now, it extracts from headers.
+    Services are created per request, so the cache is kept here and shared
+    by every SettingsService instance. Invalidation only reaches this
+    process, so entries expire after verification_rules_cache_ttl_seconds.
     """
-    token = credentials.credentials
-
-    # TODO: In production, validate JWT token with Platform Service
-    # For now, extract tenant_id from Bearer token claim
-
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing token"
-        )
+    return TTLCache(maxsize=10_000, ttl=get_settings().verification_rules_cache_ttl_seconds)
 
-    # Placeholder: in real implementation, parse JWT and extract tenant_id
-    # For now, return a default or extract from token
-    return "default-tenant"
 
-
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> dict:
+@lru_cache()
+def get_rules_lookup_cache() -> TTLCache:
     """
-    Get current user from JWT token.
+    Get the process-wide cache of verification rule lookups.
 
-    Returns user information including tenant_id, user_id, and role.
-    Used for authorization and audit trail.
+    Read by every VerificationEngine and invalidated by SettingsService when
+    a tenant's rules change.
     """
-    token = credentials.credentials
-
-    # TODO: In production, validate JWT token with Platform Service
-    # Extract user information from token including role-based permissions
-
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing token"
-        )
+    return TTLCache(maxsize=10_000, ttl=get_settings().verification_rules_cache_ttl_seconds)
 
-    # Placeholder user info
-    return {
-        "tenant_id": "default-tenant",
-        "user_id": "default-user",
-        "role": "admin"  # Possible roles: admin, reviewer, pathologist
-    }
 
-
-def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-) -> Optional[dict]:
+def get_settings_service(
+    settings_repo: IAutoVerificationSettingsRepository = Depends(get_auto_verification_settings_repository),
+    rules_repo: IVerificationRuleRepository = Depends(get_verification_rule_repository)
+) -> SettingsService:
     """
-    Get current user from JWT token if available, otherwise return None.
+    Create settings service with injected dependencies.
 
-    Used for endpoints that support both authenticated and unauthenticated access.
+    The service manages configuration of verification rules and settings
+    including reference ranges, critical ranges, and delta check parameters.
     """
-    if not credentials:
-        return None
-
-    try:
-        return get_current_user(credentials)
-    except HTTPException:
-        return None
+    return SettingsService(
+        settings_repository=settings_repo,
+        rules_repository=rules_repo,
+        settings_cache=get_settings_lookup_cache(),
+        rules_cache=get_rules_lookup_cache(),
+    )
@@ -69,3 +69,8 @@ class InsufficientPermissionError(VerificationException):
 class InvalidConfigurationError(VerificationException):
     """Invalid configuration for verification."""
     pass
+
+
+class TenantConnectionLimitError(VerificationException):
+    """The tenant's database sessions are all in use and none freed up in time."""
+    pass
@@ -1,13 +1,25 @@
 """Main application entry point for Verification Service."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Callable, Optional
 from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-
-from app.config import AppSettings
-from app.dependencies import get_settings_service, get_settings
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+
+from app.config import AppSettings, settings
+from app.dependencies import (
+    get_settings_service,
+    ensure_schema,
+    rebuild_review_state_counters,
+    complete_stalled_reviews,
+    warm_up_connection_pool,
+    tenant_connection_leases,
+)
 from app.exceptions import (
     VerificationException,
     SettingsNotFoundError,
@@ -23,6 +35,7 @@ from app.exceptions import (
     InvalidReviewDecisionError,
     InvalidResultDecisionError,
     InsufficientPermissionError,
+    TenantConnectionLimitError,
 )
 
 # Import routers from API modules
@@ -54,6 +67,26 @@ def configure_logging(settings: AppSettings):
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+async def run_periodically(
+    job: Callable[[AppSettings], object], interval_seconds: int, settings: AppSettings
+) -> None:
+    """
+    Run a maintenance job in the threadpool every interval, until cancelled.
+
+    Used for the review state counter rebuild, which corrects counter drift
+    from rows written outside the repository, and the sweep completing
+    reviews whose deferred completion check was lost. A failed run is
+    logged and retried at the next interval.
+    """
+    logger = logging.getLogger(__name__)
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await run_in_threadpool(job, settings)
+        except Exception:
+            logger.exception("Maintenance job %s failed", job.__name__)
+
+
 # Application lifespan events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -63,7 +96,6 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events for the application.
     """
     # Startup
-    settings = get_settings()
     configure_logging(settings)
     logger = logging.getLogger(__name__)
 
@@ -71,6 +103,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Database: {'Real' if settings.use_real_database else 'In-Memory'}")
 
+    # Create database tables before serving traffic
+    try:
+        ensure_schema(settings)
+    except Exception as e:
+        logger.error(f"Failed to create database schema: {e}")
+
+    # Establish pooled database connections before serving traffic
+    try:
+        warm_up_connection_pool(settings)
+    except Exception as e:
+        logger.error(f"Failed to warm up database connection pool: {e}")
+
     # Initialize default verification rules for new tenants if enabled
     if settings.initialize_default_rules_on_startup:
         try:
@@ -82,216 +126,183 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Failed to initialize default rules: {e}")
 
+    maintenance_tasks = []
+    if settings.use_real_database:
+        for job, interval_seconds in (
+            (rebuild_review_state_counters, settings.review_counter_reconcile_interval_seconds),
+            (complete_stalled_reviews, settings.review_completion_sweep_interval_seconds),
+        ):
+            if interval_seconds > 0:
+                maintenance_tasks.append(
+                    asyncio.create_task(run_periodically(job, interval_seconds, settings))
+                )
+
     logger.info(f"{settings.service_name} started successfully")
 
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.service_name}")
+    for task in maintenance_tasks:
+        task.cancel()
 
 
 # Create FastAPI application
-settings = AppSettings()
-
 app = FastAPI(
     title=settings.api_title,
     description=settings.api_description,
     version=settings.api_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
-# Configure CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins if settings.environment != "production" else [],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class FrozenSetCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks request origins against a frozenset."""
 
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        # Starlette keeps the origins as given (a list) and scans it per request
+        self.allow_origins = frozenset(self.allow_origins)
 
-# Exception handlers
-@app.exception_handler(SettingsNotFoundError)
-async def settings_not_found_handler(request: Request, exc: SettingsNotFoundError):
-    """Handle settings not found errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "settings_not_found",
-            "message": str(exc),
-            "detail": "The requested verification settings do not exist"
-        }
-    )
 
-
-@app.exception_handler(SettingsAlreadyExistsError)
-async def settings_already_exists_handler(request: Request, exc: SettingsAlreadyExistsError):
-    """Handle settings already exist errors."""
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content={
-            "error": "settings_already_exist",
-            "message": str(exc),
-            "detail": "Verification settings already exist for this test code"
-        }
-    )
-
-
-@app.exception_handler(ReviewNotFoundError)
-async def review_not_found_handler(request: Request, exc: ReviewNotFoundError):
-    """Handle review not found errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "review_not_found",
-            "message": str(exc),
-            "detail": "The requested review does not exist"
-        }
+# Configure CORS middleware (production allows no cross-origin callers, so
+# the middleware is left out entirely there)
+if settings.environment != "production":
+    app.add_middleware(
+        FrozenSetCORSMiddleware,
+        allow_origins=tuple(settings.cors_origins),
+        allow_credentials=True,
+        allow_methods=("GET", "POST", "PUT", "PATCH", "DELETE"),
+        allow_headers=("authorization", "content-type", "if-none-match"),
     )
 
 
-@app.exception_handler(ReviewAlreadyExistsError)
-async def review_already_exists_handler(request: Request, exc: ReviewAlreadyExistsError):
-    """Handle review already exists errors."""
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content={
-            "error": "review_already_exists",
-            "message": str(exc),
-            "detail": "A review already exists for this sample"
-        }
-    )
-
-
-@app.exception_handler(ReviewCannotBeModifiedError)
-async def review_cannot_be_modified_handler(request: Request, exc: ReviewCannotBeModifiedError):
-    """Handle review modification errors."""
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content={
-            "error": "review_cannot_be_modified",
-            "message": str(exc),
-            "detail": "This review is already completed and cannot be modified"
-        }
-    )
-
-
-@app.exception_handler(ReviewStateTransitionError)
-async def review_state_transition_handler(request: Request, exc: ReviewStateTransitionError):
-    """Handle invalid review state transition errors."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={
-            "error": "invalid_state_transition",
-            "message": str(exc),
-            "detail": "The requested state transition is not allowed"
-        }
-    )
-
-
-@app.exception_handler(ResultNotFoundError)
-async def result_not_found_handler(request: Request, exc: ResultNotFoundError):
-    """Handle result not found errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "result_not_found",
-            "message": str(exc),
-            "detail": "The requested result does not exist"
-        }
-    )
-
-
-@app.exception_handler(SampleNotFoundError)
-async def sample_not_found_handler(request: Request, exc: SampleNotFoundError):
-    """Handle sample not found errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "sample_not_found",
-            "message": str(exc),
-            "detail": "The requested sample does not exist"
-        }
-    )
-
-
-@app.exception_handler(RuleNotFoundError)
-async def rule_not_found_handler(request: Request, exc: RuleNotFoundError):
-    """Handle rule not found errors."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={
-            "error": "rule_not_found",
-            "message": str(exc),
-            "detail": "The requested verification rule does not exist"
-        }
-    )
+# Exception handlers
+# Maps each domain exception to (status code, error code, detail message)
+EXC_MAP: dict[type[VerificationException], tuple[int, str, str]] = {
+    SettingsNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "settings_not_found",
+        "The requested verification settings do not exist",
+    ),
+    SettingsAlreadyExistsError: (
+        status.HTTP_409_CONFLICT,
+        "settings_already_exist",
+        "Verification settings already exist for this test code",
+    ),
+    ReviewNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "review_not_found",
+        "The requested review does not exist",
+    ),
+    ReviewAlreadyExistsError: (
+        status.HTTP_409_CONFLICT,
+        "review_already_exists",
+        "A review already exists for this sample",
+    ),
+    ReviewCannotBeModifiedError: (
+        status.HTTP_409_CONFLICT,
+        "review_cannot_be_modified",
+        "This review is already completed and cannot be modified",
+    ),
+    ReviewStateTransitionError: (
+        status.HTTP_400_BAD_REQUEST,
+        "invalid_state_transition",
+        "The requested state transition is not allowed",
+    ),
+    ResultNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "result_not_found",
+        "The requested result does not exist",
+    ),
+    SampleNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "sample_not_found",
+        "The requested sample does not exist",
+    ),
+    RuleNotFoundError: (
+        status.HTTP_404_NOT_FOUND,
+        "rule_not_found",
+        "The requested verification rule does not exist",
+    ),
+    InvalidConfigurationError: (
+        status.HTTP_400_BAD_REQUEST,
+        "invalid_configuration",
+        "The provided configuration is invalid",
+    ),
+    InvalidReviewDecisionError: (
+        status.HTTP_400_BAD_REQUEST,
+        "invalid_review_decision",
+        "The provided review decision is invalid",
+    ),
+    InvalidResultDecisionError: (
+        status.HTTP_400_BAD_REQUEST,
+        "invalid_result_decision",
+        "The provided result decision is invalid",
+    ),
+    InsufficientPermissionError: (
+        status.HTTP_403_FORBIDDEN,
+        "insufficient_permission",
+        "You do not have permission to perform this action",
+    ),
+    TenantConnectionLimitError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "too_many_concurrent_requests",
+        "Too many concurrent requests for this tenant; retry shortly",
+    ),
+}
+
+# Extra response headers for the exceptions that need them
+EXC_HEADERS: dict[type[VerificationException], dict[str, str]] = {
+    TenantConnectionLimitError: {"Retry-After": "1"},
+}
+
+DEFAULT_EXC_ENTRY = (
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+    "verification_error",
+    "An error occurred in the verification service",
+)
 
 
-@app.exception_handler(InvalidConfigurationError)
-async def invalid_configuration_handler(request: Request, exc: InvalidConfigurationError):
-    """Handle invalid configuration errors."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={
-            "error": "invalid_configuration",
-            "message": str(exc),
-            "detail": "The provided configuration is invalid"
-        }
+def _error_body_fragments(error: str, detail: str) -> tuple[bytes, bytes]:
+    """Pre-encode the parts of an error body before and after the message."""
+    return (
+        b'{"error":' + orjson.dumps(error) + b',"message":',
+        b',"detail":' + orjson.dumps(detail) + b"}",
     )
 
 
-@app.exception_handler(InvalidReviewDecisionError)
-async def invalid_review_decision_handler(request: Request, exc: InvalidReviewDecisionError):
-    """Handle invalid review decision errors."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={
-            "error": "invalid_review_decision",
-            "message": str(exc),
-            "detail": "The provided review decision is invalid"
-        }
-    )
+# Error bodies only vary by message, so the constant parts are encoded once here
+_EXC_RESPONSES: dict[type[VerificationException], tuple[int, bytes, bytes]] = {
+    exc_type: (status_code, *_error_body_fragments(error, detail))
+    for exc_type, (status_code, error, detail) in EXC_MAP.items()
+}
+_DEFAULT_EXC_RESPONSE = (
+    DEFAULT_EXC_ENTRY[0],
+    *_error_body_fragments(DEFAULT_EXC_ENTRY[1], DEFAULT_EXC_ENTRY[2]),
+)
 
 
-@app.exception_handler(InvalidResultDecisionError)
-async def invalid_result_decision_handler(request: Request, exc: InvalidResultDecisionError):
-    """Handle invalid result decision errors."""
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content={
-            "error": "invalid_result_decision",
-            "message": str(exc),
-            "detail": "The provided result decision is invalid"
-        }
+@app.exception_handler(VerificationException)
+async def verification_exception_handler(request: Request, exc: VerificationException):
+    """Handle verification service exceptions through the EXC_MAP lookup table."""
+    status_code, prefix, suffix = _EXC_RESPONSES.get(type(exc), _DEFAULT_EXC_RESPONSE)
+    return Response(
+        content=prefix + orjson.dumps(str(exc)) + suffix,
+        status_code=status_code,
+        headers=EXC_HEADERS.get(type(exc)),
+        media_type="application/json",
     )
 
 
-@app.exception_handler(InsufficientPermissionError)
-async def insufficient_permission_handler(request: Request, exc: InsufficientPermissionError):
-    """Handle insufficient permission errors."""
-    return JSONResponse(
-        status_code=status.HTTP_403_FORBIDDEN,
-        content={
-            "error": "insufficient_permission",
-            "message": str(exc),
-            "detail": "You do not have permission to perform this action"
-        }
-    )
+@dataclass(slots=True)
+class ErrorPayload:
+    """Error envelope for responses that aren't built from a pre-encoded template."""
 
-
-@app.exception_handler(VerificationException)
-async def verification_exception_handler(request: Request, exc: VerificationException):
-    """Handle generic verification service exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "verification_error",
-            "message": str(exc),
-            "detail": "An error occurred in the verification service"
-        }
-    )
+    error: str
+    message: str
+    detail: Optional[str]
 
 
 @app.exception_handler(Exception)
@@ -299,13 +310,15 @@ async def generic_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
     logger = logging.getLogger(__name__)
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    payload = ErrorPayload(
+        error="internal_server_error",
+        message="An unexpected error occurred",
+        detail=str(exc) if settings.environment != "production" else None,
+    )
+    return Response(
+        content=orjson.dumps(payload),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "internal_server_error",
-            "message": "An unexpected error occurred",
-            "detail": str(exc) if settings.environment != "production" else None
-        }
+        media_type="application/json",
     )
 
 
@@ -342,44 +355,82 @@ else:
     logging.warning("API routers not found - application will have no endpoints")
 
 
+# Health and root responses only depend on the (frozen) settings, so their
+# bodies are encoded once at import and served as-is
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": settings.service_name,
+    "environment": settings.environment,
+    "version": settings.api_version
+})
+
+_ROOT_BODY = orjson.dumps({
+    "service": "IVD Middleware - Verification Service",
+    "description": "Automated verification and manual review of test results",
+    "version": settings.api_version,
+    "docs": "/docs",
+    "health": "/health",
+    "features": {
+        "auto_verification": settings.enable_auto_verification,
+        "delta_check": settings.enable_delta_check,
+        "review_escalation": settings.enable_review_escalation,
+        "audit_trail": settings.enable_audit_trail
+    }
+})
+
+
 # Health check endpoint
 @app.get("/health")
-def health_check():
+async def health_check():
     """
     Health check endpoint.
 
     Returns service status and basic information.
     Used by load balancers and monitoring systems.
     """
+    return Response(
+        content=_HEALTH_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=5"},
+    )
+
+
+# Connection lease metrics endpoint
+@app.get("/health/connection-leases")
+async def connection_lease_stats():
+    """
+    Database connection lease metrics, aggregated over all tenants.
+
+    Reports how many tenants hold leases or are at their limit and how many
+    requests are leased or waiting, for capacity planning of the per-tenant
+    limit. The endpoint is unauthenticated, so tenant IDs are not exposed.
+    """
+    if tenant_connection_leases is None:
+        return {"enabled": False}
+    stats = tenant_connection_leases.stats()
     return {
-        "status": "healthy",
-        "service": settings.service_name,
-        "environment": settings.environment,
-        "version": settings.api_version
+        "enabled": True,
+        "max_per_tenant": tenant_connection_leases.max_per_tenant,
+        "tenants_leasing": sum(1 for s in stats if s.leased),
+        "tenants_at_limit": sum(1 for s in stats if s.leased >= s.max_leases),
+        "leased": sum(s.leased for s in stats),
+        "waiting": sum(s.waiting for s in stats),
     }
 
 
 # Root endpoint
 @app.get("/")
-def root():
+async def root():
     """
     Root endpoint.
 
     Returns service information and links to documentation.
     """
-    return {
-        "service": "IVD Middleware - Verification Service",
-        "description": "Automated verification and manual review of test results",
-        "version": settings.api_version,
-        "docs": "/docs",
-        "health": "/health",
-        "features": {
-            "auto_verification": settings.enable_auto_verification,
-            "delta_check": settings.enable_delta_check,
-            "review_escalation": settings.enable_review_escalation,
-            "audit_trail": settings.enable_audit_trail
-        }
-    }
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 
 # Run the application
@@ -1,7 +1,7 @@
 """Verification Service domain models."""
 
 from .auto_verification_settings import AutoVerificationSettings
-from .review import Review, ReviewState, ReviewDecision, ResultDecision
+from .review import Review, ReviewState, ReviewDecision, ReviewStateCounter, ResultDecision
 from .verification_rule import VerificationRule, RuleType
 
 __all__ = [
@@ -9,6 +9,7 @@ __all__ = [
     "Review",
     "ReviewState",
     "ReviewDecision",
+    "ReviewStateCounter",
     "ResultDecision",
     "VerificationRule",
     "RuleType",
@@ -1,9 +1,31 @@
 """Auto-verification settings domain model."""
 
+from sqlalchemy import JSON, Column, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import SQLModel, Field, Index
 from typing import Optional
 from datetime import datetime
-import json
+from functools import cached_property
+
+from app.models.ids import uuid7
+
+
+# Cached properties derived from each field, dropped when the field is reassigned
+_DERIVED_FROM = {
+    "instrument_flags_to_block": ("blocked_flags",),
+    "reference_range_low": ("reference_bounds",),
+    "reference_range_high": ("reference_bounds",),
+    "critical_range_low": ("critical_bounds",),
+    "critical_range_high": ("critical_bounds",),
+}
+
+
+def _as_bounds(low: Optional[float], high: Optional[float]) -> tuple[float, float]:
+    """Turn optional range limits into floats, leaving an unset limit open."""
+    return (
+        float("-inf") if low is None else float(low),
+        float("inf") if high is None else float(high),
+    )
 
 
 class AutoVerificationSettings(SQLModel, table=True):
@@ -16,12 +38,27 @@ class AutoVerificationSettings(SQLModel, table=True):
 
     __tablename__ = "auto_verification_settings"
     __table_args__ = (
-        Index('ix_settings_tenant_test', 'tenant_id', 'test_code', unique=True),
-        Index('ix_settings_tenant_id', 'tenant_id'),
+        # Covering index: verification lookups by (tenant_id, test_code) read the
+        # ranges and flags straight from the index on PostgreSQL. It also serves
+        # tenant_id-only queries, so no separate tenant_id index is kept.
+        Index(
+            'ix_settings_tenant_test',
+            'tenant_id',
+            'test_code',
+            unique=True,
+            postgresql_include=[
+                'reference_range_low',
+                'reference_range_high',
+                'critical_range_low',
+                'critical_range_high',
+                'delta_check_threshold_percent',
+                'instrument_flags_to_block',
+            ],
+        ),
     )
 
-    id: Optional[str] = Field(default=None, primary_key=True)
-    tenant_id: str = Field(index=True, nullable=False)
+    id: Optional[str] = Field(default_factory=uuid7, primary_key=True)  # UUIDv7, time-ordered
+    tenant_id: str = Field(nullable=False)
 
     # Test identification
     test_code: str = Field(nullable=False)  # e.g., "GLU", "WBC", "HGB"
@@ -35,29 +72,49 @@ class AutoVerificationSettings(SQLModel, table=True):
     critical_range_low: Optional[float] = Field(default=None)
     critical_range_high: Optional[float] = Field(default=None)
 
-    # Instrument flags that prevent auto-verification
-    # Stored as JSON array: ["H", "L", "C", ...]
-    instrument_flags_to_block: str = Field(default="[]", nullable=False)
+    # Instrument flags that prevent auto-verification: ["H", "L", "C", ...]
+    # Stored as a native JSON array (JSONB on PostgreSQL) and decoded by the driver
+    instrument_flags_to_block: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False),
+    )
 
     # Delta check configuration (percentage change from previous result)
     delta_check_threshold_percent: Optional[float] = Field(default=None)
     delta_check_lookback_days: int = Field(default=30, nullable=False)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Timestamps, set by the database on INSERT/UPDATE
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
+
+    @cached_property
+    def blocked_flags(self) -> frozenset[str]:
+        """Upper-cased instrument flags that block auto-verification, for O(1) membership tests."""
+        return frozenset(flag.upper() for flag in self.instrument_flags_to_block or ())
 
-    def update_timestamp(self):
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+    @cached_property
+    def reference_bounds(self) -> tuple[float, float]:
+        """Reference range as (low, high) floats, with an unset limit at -inf/inf."""
+        return _as_bounds(self.reference_range_low, self.reference_range_high)
 
-    def get_instrument_flags_to_block(self) -> list[str]:
-        """Parse instrument flags from JSON."""
-        try:
-            return json.loads(self.instrument_flags_to_block)
-        except (json.JSONDecodeError, TypeError):
-            return []
+    @cached_property
+    def critical_bounds(self) -> tuple[float, float]:
+        """Critical range as (low, high) floats, with an unset limit at -inf/inf."""
+        return _as_bounds(self.critical_range_low, self.critical_range_high)
 
-    def set_instrument_flags_to_block(self, flags: list[str]):
-        """Store instrument flags as JSON."""
-        self.instrument_flags_to_block = json.dumps(flags)
+    def __setattr__(self, name, value):
+        # Drop cached derived values when a field they are computed from is replaced
+        for derived in _DERIVED_FROM.get(name, ()):
+            self.__dict__.pop(derived, None)
+        super().__setattr__(name, value)
@@ -0,0 +1,48 @@
+"""Custom column types shared by the domain models."""
+
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Stores a Python Enum as a SMALLINT code instead of its string value.
+
+    Enum columns such as review state sit in the hottest indexes; a 2-byte
+    code keeps those indexes several times smaller than the VARCHAR values.
+    Codes follow the enum's declaration order, so new members must only
+    ever be appended.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._codes = {member: code for code, member in enumerate(enum_class)}
+        self._members = list(enum_class)
+
+    def _member(self, value) -> Enum:
+        """Resolve a member from itself, its name or its value."""
+        if isinstance(value, self.enum_class):
+            return value
+        # Names are accepted as the string Enum type SQLModel maps by default did
+        member = self.enum_class.__members__.get(value)
+        return member if member is not None else self.enum_class(value)
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return self._codes[self._member(value)]
+
+    def process_literal_param(self, value, dialect) -> str:
+        return "NULL" if value is None else str(self._codes[self._member(value)])
+
+    def process_result_value(self, value, dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
@@ -0,0 +1,21 @@
+"""Primary key generation for the domain models."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> str:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562) as a string.
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys sort
+    after existing ones and B-tree inserts land on the rightmost index page
+    instead of scattering across the index as random uuid4 keys do. The
+    remaining bits are random apart from the version and variant fields.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
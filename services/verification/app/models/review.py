@@ -1,10 +1,14 @@
 """Review domain model."""
 
+from sqlalchemy import DDL, Column, DateTime, Integer, event, func, text
 from sqlmodel import SQLModel, Field, Index
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+from app.models.column_types import SmallIntEnum
+from app.models.ids import uuid7
+
 
 class ReviewState(str, Enum):
     """State of a sample review."""
@@ -33,12 +37,24 @@ class Review(SQLModel, table=True):
     __table_args__ = (
         Index('ix_reviews_tenant_id', 'tenant_id'),
         Index('ix_reviews_sample_id', 'sample_id'),
-        Index('ix_reviews_state', 'state'),
         Index('ix_reviews_tenant_state', 'tenant_id', 'state'),
+        # Serves list_by_tenant's reviewer and date filters and its
+        # created_at ordering
+        Index(
+            'ix_reviews_tenant_state_reviewer_created',
+            'tenant_id', 'state', 'reviewer_user_id', 'created_at',
+        ),
+        # Trigram index for search's partial sample_id match (ILIKE '%x%'),
+        # which a btree can't serve; PostgreSQL only
+        Index(
+            'ix_reviews_sample_id_trgm', 'sample_id',
+            postgresql_using='gin',
+            postgresql_ops={'sample_id': 'gin_trgm_ops'},
+        ).ddl_if(dialect='postgresql'),
     )
 
-    id: Optional[str] = Field(default=None, primary_key=True)
-    tenant_id: str = Field(index=True, nullable=False)
+    id: Optional[str] = Field(default_factory=uuid7, primary_key=True)  # UUIDv7, time-ordered
+    tenant_id: str = Field(nullable=False)  # Indexed via __table_args__
     sample_id: str = Field(nullable=False)  # References samples table from LIS service
 
     # Reviewer assignment
@@ -48,22 +64,67 @@ class Review(SQLModel, table=True):
     )
 
     # Review state and decision
-    state: ReviewState = Field(default=ReviewState.PENDING, nullable=False)
-    decision: Optional[ReviewDecision] = Field(default=None)
+    # Stored as SMALLINT codes to keep the state indexes compact
+    state: ReviewState = Field(
+        default=ReviewState.PENDING,
+        sa_column=Column(SmallIntEnum(ReviewState), nullable=False),
+    )
+    decision: Optional[ReviewDecision] = Field(
+        default=None,
+        sa_column=Column(SmallIntEnum(ReviewDecision), nullable=True),
+    )
+
+    # Results still awaiting a decision, decremented with each per-result
+    # decision so completion needs no count while some remain
+    pending_results_count: int = Field(
+        default=0,
+        sa_column=Column(Integer, server_default=text("0"), nullable=False),
+    )
 
     # Review comments and reasoning
     comments: Optional[str] = Field(default=None)
     escalation_reason: Optional[str] = Field(default=None)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Timestamps (created_at/updated_at are set by the database on INSERT/UPDATE)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
     submitted_at: Optional[datetime] = Field(default=None)
     completed_at: Optional[datetime] = Field(default=None)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
 
-    def update_timestamp(self):
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Review.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class ReviewStateCounter(SQLModel, table=True):
+    """
+    Number of reviews per tenant and state.
+
+    Maintained in the same transaction as every review write, so listings
+    filtered only by tenant and state read their total from here instead of
+    counting review rows.
+    """
+
+    __tablename__ = "review_state_counters"
+
+    tenant_id: str = Field(primary_key=True)
+    state: ReviewState = Field(sa_column=Column(SmallIntEnum(ReviewState), primary_key=True))
+    count: int = Field(default=0, nullable=False)
 
 
 class ResultDecision(SQLModel, table=True):
@@ -80,8 +141,8 @@ class ResultDecision(SQLModel, table=True):
         Index('ix_decisions_tenant_id', 'tenant_id'),
     )
 
-    id: Optional[str] = Field(default=None, primary_key=True)
-    tenant_id: str = Field(index=True, nullable=False)
+    id: Optional[str] = Field(default_factory=uuid7, primary_key=True)  # UUIDv7, time-ordered
+    tenant_id: str = Field(nullable=False)  # Indexed via __table_args__
     review_id: str = Field(nullable=False)  # References reviews table
     result_id: str = Field(nullable=False)  # References results table from LIS service
 
@@ -89,5 +150,8 @@ class ResultDecision(SQLModel, table=True):
     decision: str = Field(nullable=False)  # "approved" or "rejected"
     comments: Optional[str] = Field(default=None)
 
-    # Timestamp
-    decided_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Timestamp, set by the database on INSERT
+    decided_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
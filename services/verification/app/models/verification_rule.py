@@ -1,10 +1,14 @@
 """Verification rule domain model."""
 
+from sqlalchemy import Column, DateTime, func
 from sqlmodel import SQLModel, Field, Index
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+from app.models.column_types import SmallIntEnum
+from app.models.ids import uuid7
+
 
 class RuleType(str, Enum):
     """Types of verification rules."""
@@ -27,21 +31,28 @@ class VerificationRule(SQLModel, table=True):
         Index('ix_rules_tenant_id', 'tenant_id'),
     )
 
-    id: Optional[str] = Field(default=None, primary_key=True)
-    tenant_id: str = Field(index=True, nullable=False)
+    id: Optional[str] = Field(default_factory=uuid7, primary_key=True)  # UUIDv7, time-ordered
+    tenant_id: str = Field(nullable=False)  # Indexed via __table_args__
 
     # Rule identification
-    rule_type: RuleType = Field(nullable=False)
+    rule_type: RuleType = Field(sa_column=Column(SmallIntEnum(RuleType), nullable=False))
     enabled: bool = Field(default=True, nullable=False)
     priority: int = Field(default=0, nullable=False)  # Evaluation order
 
     # Description for UI display
     description: Optional[str] = Field(default=None)
 
-    # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-
-    def update_timestamp(self):
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+    # Timestamps, set by the database on INSERT/UPDATE
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False),
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+    )
@@ -30,6 +30,49 @@ class IAutoVerificationSettingsRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def create_if_absent(
+        self, settings: AutoVerificationSettings
+    ) -> Optional[AutoVerificationSettings]:
+        """
+        Create settings unless the tenant already has settings for the test code.
+
+        The existence check and the insert are a single atomic operation.
+
+        Args:
+            settings: Settings entity to create (must have tenant_id and test_code set)
+
+        Returns:
+            Created settings with generated ID, or None if settings for the
+            same tenant_id and test_code already exist
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        pass
+
+    @abc.abstractmethod
+    def create_many(
+        self, settings_list: list[AutoVerificationSettings]
+    ) -> list[AutoVerificationSettings]:
+        """
+        Create several auto-verification settings in a single transaction.
+
+        Entries whose (tenant_id, test_code) already exists, either in the
+        repository or earlier in the same batch, are skipped rather than
+        raising.
+
+        Args:
+            settings_list: Settings entities to create (each must have tenant_id and test_code set)
+
+        Returns:
+            The settings that were created, in input order, with generated IDs
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        pass
+
     @abc.abstractmethod
     def get_by_id(self, settings_id: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
         """
@@ -58,19 +101,40 @@ class IAutoVerificationSettingsRepository(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_by_test_code(self, test_code: str, tenant_id: str) -> Optional[AutoVerificationSettings]:
+    def get_by_test_code(
+        self, test_code: str, tenant_id: str, for_update: bool = False
+    ) -> Optional[AutoVerificationSettings]:
         """
         Retrieve settings for a specific test code within a tenant.
 
         Args:
             test_code: Test code identifier (e.g., "GLU", "WBC")
             tenant_id: Tenant identifier for isolation
+            for_update: Lock the settings row until the next write commits,
+                so a read-modify-write cannot lose a concurrent update
 
         Returns:
             Settings for the test code if found in tenant, None otherwise
         """
         pass
 
+    @abc.abstractmethod
+    def get_by_test_codes(
+        self, test_codes: list[str], tenant_id: str
+    ) -> list[AutoVerificationSettings]:
+        """
+        Retrieve settings for several test codes in one lookup within a tenant.
+
+        Args:
+            test_codes: Test code identifiers
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            Settings found in the tenant, ordered by test_code (test codes
+            without settings are omitted)
+        """
+        pass
+
     @abc.abstractmethod
     def update(self, settings: AutoVerificationSettings) -> AutoVerificationSettings:
         """
@@ -87,6 +151,23 @@ class IAutoVerificationSettingsRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def update_by_test_code(
+        self, test_code: str, tenant_id: str, patch: dict
+    ) -> Optional[AutoVerificationSettings]:
+        """
+        Apply a partial update to the settings for a test code within a tenant.
+
+        Args:
+            test_code: Test code whose settings to update
+            tenant_id: Tenant identifier for isolation
+            patch: New values keyed by field name; other fields are kept
+
+        Returns:
+            Updated settings, or None if the tenant has no settings for the test code
+        """
+        pass
+
     @abc.abstractmethod
     def delete(self, settings_id: str, tenant_id: str) -> bool:
         """
@@ -101,6 +182,20 @@ class IAutoVerificationSettingsRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def delete_by_test_code(self, test_code: str, tenant_id: str) -> bool:
+        """
+        Delete the settings for a test code within a tenant.
+
+        Args:
+            test_code: Test code whose settings to delete
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            True if deleted, False if not found
+        """
+        pass
+
     @abc.abstractmethod
     def list_all(
         self,
@@ -120,3 +215,26 @@ class IAutoVerificationSettingsRepository(abc.ABC):
             Tuple of (list of settings, total count)
         """
         pass
+
+    @abc.abstractmethod
+    def list_all_projected(
+        self,
+        tenant_id: str,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[list[dict], int]:
+        """
+        List a tenant's settings as plain dicts, with pagination.
+
+        Same page as list_all, without building settings entities. Each row
+        maps the AutoVerificationSettings column names to their values.
+
+        Args:
+            tenant_id: Tenant identifier
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of row dicts, total count)
+        """
+        pass
@@ -30,6 +30,26 @@ class IResultDecisionRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def create_many(
+        self, decisions: list[ResultDecision], tenant_id: str
+    ) -> list[ResultDecision]:
+        """
+        Create several result decisions for a tenant in a single transaction.
+
+        Args:
+            decisions: Decision entities to create (each must have review_id and
+                result_id set, and belong to tenant_id)
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            The created decisions, in input order, with generated IDs
+
+        Raises:
+            ValueError: If required fields are missing or a decision belongs to another tenant
+        """
+        pass
+
     @abc.abstractmethod
     def get_by_id(self, decision_id: str, tenant_id: str) -> Optional[ResultDecision]:
         """
@@ -44,6 +64,21 @@ class IResultDecisionRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def get_by_ids(self, decision_ids: list[str], tenant_id: str) -> list[ResultDecision]:
+        """
+        Retrieve several decisions by ID in one lookup, ensuring they belong to the tenant.
+
+        Args:
+            decision_ids: Decision identifiers
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            Decisions found in the tenant, in the order of decision_ids
+            (unknown IDs and other tenants' decisions are omitted)
+        """
+        pass
+
     @abc.abstractmethod
     def get_by_review(self, review_id: str, tenant_id: str) -> list[ResultDecision]:
         """
@@ -58,6 +93,21 @@ class IResultDecisionRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def count_by_review_grouped(self, review_id: str, tenant_id: str) -> dict[str, int]:
+        """
+        Count a review's decisions by decision value.
+
+        Args:
+            review_id: Review identifier
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            Mapping of decision value (e.g. "approved") to count; values with
+            no decisions are omitted
+        """
+        pass
+
     @abc.abstractmethod
     def list_by_review(
         self,
@@ -76,6 +76,74 @@ class IReviewRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def update_if_state(self, review: Review, expected_state: ReviewState) -> Optional[Review]:
+        """
+        Update a review only if its stored state is still expected_state.
+
+        Lets concurrent writers move a review out of a state at most once:
+        whichever writes second gets None instead of overwriting the first.
+
+        Args:
+            review: Review with updated fields (must have ID)
+            expected_state: State the review must still be in
+
+        Returns:
+            Updated review, or None if the review is missing or its state changed
+        """
+        pass
+
+    @abc.abstractmethod
+    def decrement_pending_results(self, review_id: str, tenant_id: str) -> Optional[int]:
+        """
+        Atomically count one more of a review's results as decided.
+
+        Args:
+            review_id: Review identifier
+            tenant_id: Tenant identifier
+
+        Returns:
+            Results still pending afterwards (never below zero), or None if
+            the review doesn't exist
+        """
+        pass
+
+    @abc.abstractmethod
+    def set_pending_results(self, review_id: str, tenant_id: str, count: int) -> bool:
+        """
+        Overwrite a review's count of results still awaiting a decision.
+
+        Args:
+            review_id: Review identifier
+            tenant_id: Tenant identifier
+            count: Results of the review's sample that still need review
+
+        Returns:
+            True if updated, False if the review doesn't exist
+        """
+        pass
+
+    @abc.abstractmethod
+    def list_awaiting_decisions(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 100
+    ) -> list[Review]:
+        """
+        List reviews of every tenant that are pending or in progress.
+
+        For maintenance jobs only: unlike every other query this is not
+        scoped to a tenant (escalated reviews are left out).
+
+        Args:
+            after_id: Only return reviews with a greater ID (keyset pagination)
+            limit: Maximum number of records to return
+
+        Returns:
+            Reviews ordered by ID
+        """
+        pass
+
     @abc.abstractmethod
     def list_by_tenant(
         self,
@@ -85,8 +153,9 @@ class IReviewRepository(abc.ABC):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> tuple[list[Review], int]:
+        limit: int = 100,
+        include_total: bool = True
+    ) -> tuple[list[Review], Optional[int]]:
         """
         List reviews for a tenant with optional filtering.
 
@@ -98,12 +167,38 @@ class IReviewRepository(abc.ABC):
             end_date: Optional end of date range (based on created_at)
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_total: If False, the total is not counted and None is
+                returned in its place
 
         Returns:
             Tuple of (list of reviews, total count)
         """
         pass
 
+    @abc.abstractmethod
+    def count_by_tenant(
+        self,
+        tenant_id: str,
+        state: Optional[ReviewState] = None,
+        reviewer_user_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        Count a tenant's reviews matching list_by_tenant's filters.
+
+        Args:
+            tenant_id: Tenant identifier
+            state: Optional review state filter
+            reviewer_user_id: Optional filter by assigned reviewer
+            start_date: Optional start of date range (based on created_at)
+            end_date: Optional end of date range (based on created_at)
+
+        Returns:
+            Number of matching reviews
+        """
+        pass
+
     @abc.abstractmethod
     def search(
         self,
@@ -6,22 +6,24 @@ from dataclasses import dataclass
 from app.models import AutoVerificationSettings, VerificationRule
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationDecision:
     """
     The outcome of applying verification rules to a result.
 
+    Immutable and slotted: one is created per result in every batch.
+
     Attributes:
         can_auto_verify: Whether the result passed all verification rules
-        failed_rules: List of rule types that failed (empty if can_auto_verify is True)
+        failed_rules: Rule types that failed (empty if can_auto_verify is True)
         failure_reasons: Human-readable reasons for each failed rule
     """
     can_auto_verify: bool
-    failed_rules: list[str]
-    failure_reasons: list[str]
+    failed_rules: tuple[str, ...]
+    failure_reasons: tuple[str, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResultData:
     """
     Simplified result data structure for verification.
@@ -159,7 +161,8 @@ class IVerificationEngine(abc.ABC):
         self,
         result: ResultData,
         tenant_id: str,
-        settings: AutoVerificationSettings
+        settings: AutoVerificationSettings,
+        sample_history: Optional[dict[str, list]] = None,
     ) -> tuple[bool, Optional[str]]:
         """
         Check if result value changed significantly from previous result (delta check).
@@ -168,6 +171,8 @@ class IVerificationEngine(abc.ABC):
             result: Current result data
             tenant_id: Tenant identifier for historical result lookup
             settings: Auto-verification settings containing delta thresholds
+            sample_history: Optional memo of sample_id -> results shared across
+                a batch, so each sample's history is fetched once
 
         Returns:
             Tuple of (passes_check, failure_reason)
@@ -2,7 +2,7 @@
 
 import abc
 from typing import Optional
-from app.models import VerificationRule
+from app.models import RuleType, VerificationRule
 
 
 class IVerificationRuleRepository(abc.ABC):
@@ -26,6 +26,41 @@ class IVerificationRuleRepository(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def create_many(
+        self, rules: list[VerificationRule], tenant_id: str
+    ) -> list[VerificationRule]:
+        """
+        Create several verification rules for a tenant in a single transaction.
+
+        Args:
+            rules: Rule entities to create (each must belong to tenant_id)
+            tenant_id: Tenant identifier for isolation
+
+        Returns:
+            The created rules, in input order, with generated IDs
+
+        Raises:
+            ValueError: If a rule belongs to another tenant
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_by_tenant_and_type(
+        self, tenant_id: str, rule_type: RuleType
+    ) -> Optional[VerificationRule]:
+        """
+        Retrieve a tenant's rule of the given type.
+
+        Args:
+            tenant_id: Tenant identifier
+            rule_type: Rule type (each tenant has at most one rule per type)
+
+        Returns:
+            Rule if found, None otherwise
+        """
+        pass
+
     @abc.abstractmethod
     def update(self, rule: VerificationRule) -> VerificationRule:
         """
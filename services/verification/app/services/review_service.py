@@ -1,9 +1,14 @@
 """Review service implementation."""
 
+import functools
 import logging
-from typing import Optional
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Optional
 from datetime import datetime
 
+from app._stubs import module_available
+from app.cache import RequestCache
 from app.ports.review_repository import IReviewRepository
 from app.ports.result_decision_repository import IResultDecisionRepository
 from app.models import (
@@ -24,61 +29,125 @@ from app.exceptions import (
 
 # Import from LIS integration service for result and sample management
 # In production, this would be done via service-to-service communication
-try:
-    from services.lis_integration.app.ports.result_repository import IResultRepository
-    from services.lis_integration.app.ports.sample_repository import ISampleRepository
-    from services.lis_integration.app.models import ResultStatus, SampleStatus
-except ImportError:
-    # Fallback for when running in isolation
-    from typing import Protocol
-    from enum import Enum
-
-    class ResultStatus(str, Enum):
-        """Result verification status."""
-
-        PENDING = "pending"
-        VERIFIED = "verified"
-        NEEDS_REVIEW = "needs_review"
-        REJECTED = "rejected"
-
-    class SampleStatus(str, Enum):
-        """Sample status."""
-
-        PENDING = "pending"
-        VERIFIED = "verified"
-        NEEDS_REVIEW = "needs_review"
-        REJECTED = "rejected"
-
-    class IResultRepository(Protocol):
-        """Protocol for result repository."""
+HAS_LIS_INTEGRATION = module_available("services.lis_integration.app.models")
 
-        def get_by_id(self, result_id: str, tenant_id: str):
-            """Get result by ID."""
-            ...
+if HAS_LIS_INTEGRATION:
+    try:
+        from services.lis_integration.app.ports.result_repository import IResultRepository
+        from services.lis_integration.app.ports.sample_repository import ISampleRepository
+        from services.lis_integration.app.models import ResultStatus, SampleStatus
+    except ImportError:
+        HAS_LIS_INTEGRATION = False
 
-        def list_by_sample(self, sample_id: str, tenant_id: str):
-            """List results by sample."""
-            ...
-
-        def update_verification_status(
-            self, result_id: str, tenant_id: str, status, method: Optional[str] = None
-        ):
-            """Update verification status."""
-            ...
-
-    class ISampleRepository(Protocol):
-        """Protocol for sample repository."""
+if not HAS_LIS_INTEGRATION:
+    # Fallback for when running in isolation
+    from app._stubs import IResultRepository, ISampleRepository, ResultStatus, SampleStatus
 
-        def get_by_id(self, sample_id: str, tenant_id: str):
-            """Get sample by ID."""
-            ...
 
-        def update(self, sample):
-            """Update sample."""
-            ...
+logger = logging.getLogger(__name__)
 
 
-logger = logging.getLogger(__name__)
+# One bit per review state, so a state's valid successors fit in one int
+_STATE_BIT: dict[ReviewState, int] = {state: 1 << i for i, state in enumerate(ReviewState)}
+
+
+def _state_mask(*states: ReviewState) -> int:
+    """Bitmask with the bits of the given states set."""
+    mask = 0
+    for state in states:
+        mask |= _STATE_BIT[state]
+    return mask
+
+
+# States each review state may move to, as bitmasks of _STATE_BIT
+_VALID_TRANSITIONS: dict[ReviewState, int] = {
+    ReviewState.PENDING: _state_mask(
+        ReviewState.IN_PROGRESS, ReviewState.APPROVED, ReviewState.REJECTED, ReviewState.ESCALATED
+    ),
+    ReviewState.IN_PROGRESS: _state_mask(
+        ReviewState.APPROVED, ReviewState.REJECTED, ReviewState.ESCALATED
+    ),
+    ReviewState.ESCALATED: _state_mask(ReviewState.APPROVED, ReviewState.REJECTED),
+    ReviewState.APPROVED: 0,  # Terminal state
+    ReviewState.REJECTED: 0,  # Terminal state
+}
+
+# States a review is in once completed
+_COMPLETED_STATES = frozenset({ReviewState.APPROVED, ReviewState.REJECTED})
+
+# States in which a review may be completed without a reviewer's request;
+# escalated reviews wait for the pathologist
+_AUTO_COMPLETABLE_STATES = frozenset({ReviewState.PENDING, ReviewState.IN_PROGRESS})
+
+# ResultDecision.decision values, shared by the writes and the completion counts
+_APPROVED = "approved"
+_REJECTED = "rejected"
+
+
+@dataclass(slots=True, frozen=True)
+class ResultDecisionSummary:
+    """A result decision as shown in review details."""
+
+    decision_id: str
+    result_id: str
+    decision: str
+    comments: Optional[str]
+    decided_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewDetail:
+    """A review with all its result decisions."""
+
+    review_id: str
+    sample_id: str
+    reviewer_user_id: Optional[str]
+    state: str
+    decision: Optional[str]
+    comments: Optional[str]
+    escalation_reason: Optional[str]
+    created_at: datetime
+    submitted_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    updated_at: datetime
+    result_decisions: list[ResultDecisionSummary]
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewSummary:
+    """A review as listed in the review queue."""
+
+    review_id: str
+    sample_id: str
+    reviewer_user_id: Optional[str]
+    state: str
+    decision: Optional[str]
+    created_at: datetime
+    submitted_at: Optional[datetime]
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewQueuePage:
+    """One page of the review queue."""
+
+    reviews: list[ReviewSummary]
+    total: Optional[int]
+    skip: int
+    limit: int
+
+
+def _single_transaction(method):
+    """Run a review workflow's writes inside the service's unit of work."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            with self.unit_of_work():
+                return method(self, *args, **kwargs)
+        except Exception:
+            # Entities cached during the workflow may hold rolled-back changes
+            self.request_cache.clear()
+            raise
+    return wrapper
 
 
 class ReviewService:
@@ -98,6 +167,13 @@ class ReviewService:
         result_decision_repository: Repository for result decisions
         result_repository: Repository for test results
         sample_repository: Repository for samples
+        request_cache: Reviews, results and samples already loaded by this
+            service instance (one is created per request)
+        unit_of_work: Factory for the context that makes each decision
+            workflow commit once (a no-op context if none is given)
+        completion_service_factory: Factory for a context that yields a
+            ReviewService on its own database session, for completion checks
+            deferred until after the response (None to use this service)
     """
 
     def __init__(
@@ -106,6 +182,9 @@ class ReviewService:
         result_decision_repository: IResultDecisionRepository,
         result_repository: IResultRepository,
         sample_repository: ISampleRepository,
+        request_cache: Optional[RequestCache] = None,
+        unit_of_work: Optional[Callable[[], ContextManager]] = None,
+        completion_service_factory: Optional[Callable[[], ContextManager["ReviewService"]]] = None,
     ):
         """
         Initialize the review service.
@@ -115,11 +194,23 @@ class ReviewService:
             result_decision_repository: Repository for result decisions
             result_repository: Repository for accessing and updating results
             sample_repository: Repository for accessing and updating samples
+            request_cache: Optional identity map to share with other services
+                handling the same request (a private one is used otherwise)
+            unit_of_work: Optional factory for a context manager that groups
+                the repository writes of one workflow into a single
+                transaction (e.g. single_commit over the request's session)
+            completion_service_factory: Optional factory for a context
+                manager yielding a ReviewService with its own session; the
+                request's session may already be closed when a deferred
+                completion check runs
         """
         self.review_repository = review_repository
         self.result_decision_repository = result_decision_repository
         self.result_repository = result_repository
         self.sample_repository = sample_repository
+        self.request_cache = request_cache if request_cache is not None else RequestCache()
+        self.unit_of_work = unit_of_work or nullcontext
+        self.completion_service_factory = completion_service_factory
 
     def create_review(
         self,
@@ -142,10 +233,10 @@ class ReviewService:
             SampleNotFoundError: If sample doesn't exist
             ReviewAlreadyExistsError: If review already exists for this sample
         """
-        logger.info(f"Creating review for sample {sample_id} in tenant {tenant_id}")
+        logger.info("Creating review for sample %s in tenant %s", sample_id, tenant_id)
 
         # Verify sample exists
-        sample = self.sample_repository.get_by_id(sample_id, tenant_id)
+        sample = self._get_sample(sample_id, tenant_id)
         if sample is None:
             raise SampleNotFoundError(
                 f"Sample {sample_id} not found in tenant {tenant_id}"
@@ -170,14 +261,18 @@ class ReviewService:
             sample_id=sample_id,
             reviewer_user_id=reviewer_user_id,
             state=state,
+            pending_results_count=self.result_repository.count_by_sample_and_status(
+                sample_id, tenant_id, ResultStatus.NEEDS_REVIEW
+            ),
         )
 
         created_review = self.review_repository.create(review)
-        logger.info(f"Created review {created_review.id} for sample {sample_id}")
+        self.request_cache.set(("review", tenant_id, created_review.id), created_review)
+        logger.info("Created review %s for sample %s", created_review.id, sample_id)
 
         return created_review
 
-    def get_review(self, review_id: str, tenant_id: str) -> dict:
+    def get_review(self, review_id: str, tenant_id: str) -> ReviewDetail:
         """
         Get review details including all result decisions.
 
@@ -186,14 +281,14 @@ class ReviewService:
             tenant_id: Tenant identifier
 
         Returns:
-            Dictionary containing review details and result decisions
+            Review details and result decisions
 
         Raises:
             ReviewNotFoundError: If review doesn't exist
         """
-        logger.debug(f"Getting review {review_id} for tenant {tenant_id}")
+        logger.debug("Getting review %s for tenant %s", review_id, tenant_id)
 
-        review = self.review_repository.get_by_id(review_id, tenant_id)
+        review = self._get_review(review_id, tenant_id)
         if review is None:
             raise ReviewNotFoundError(
                 f"Review {review_id} not found in tenant {tenant_id}"
@@ -202,29 +297,23 @@ class ReviewService:
         # Load result decisions
         decisions = self.result_decision_repository.get_by_review(review_id, tenant_id)
 
-        return {
-            "review_id": review.id,
-            "sample_id": review.sample_id,
-            "reviewer_user_id": review.reviewer_user_id,
-            "state": review.state.value,
-            "decision": review.decision.value if review.decision else None,
-            "comments": review.comments,
-            "escalation_reason": review.escalation_reason,
-            "created_at": review.created_at.isoformat(),
-            "submitted_at": review.submitted_at.isoformat() if review.submitted_at else None,
-            "completed_at": review.completed_at.isoformat() if review.completed_at else None,
-            "updated_at": review.updated_at.isoformat(),
-            "result_decisions": [
-                {
-                    "decision_id": d.id,
-                    "result_id": d.result_id,
-                    "decision": d.decision,
-                    "comments": d.comments,
-                    "decided_at": d.decided_at.isoformat(),
-                }
+        return ReviewDetail(
+            review_id=review.id,
+            sample_id=review.sample_id,
+            reviewer_user_id=review.reviewer_user_id,
+            state=review.state.value,
+            decision=review.decision.value if review.decision else None,
+            comments=review.comments,
+            escalation_reason=review.escalation_reason,
+            created_at=review.created_at,
+            submitted_at=review.submitted_at,
+            completed_at=review.completed_at,
+            updated_at=review.updated_at,
+            result_decisions=[
+                ResultDecisionSummary(d.id, d.result_id, d.decision, d.comments, d.decided_at)
                 for d in decisions
             ],
-        }
+        )
 
     def list_review_queue(
         self,
@@ -234,7 +323,8 @@ class ReviewService:
         escalated_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> dict:
+        include_total: bool = True,
+    ) -> ReviewQueuePage:
         """
         Get queue of samples needing review with optional filtering.
 
@@ -245,42 +335,58 @@ class ReviewService:
             escalated_only: If True, only return escalated reviews
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_total: If False, skip counting the matching reviews
 
         Returns:
-            Dictionary containing list of reviews and total count
+            The page of reviews and the total count (None if not included)
+
+        Raises:
+            ValueError: If skip is negative
         """
-        logger.debug(f"Listing review queue for tenant {tenant_id}")
+        logger.debug("Listing review queue for tenant %s", tenant_id)
+
+        if skip < 0:
+            raise ValueError("skip cannot be negative")
 
         # Apply escalated filter if requested
         if escalated_only:
             state = ReviewState.ESCALATED
 
+        # An empty page only needs the count (pagination metadata prefetch)
+        if limit <= 0:
+            total = self.review_repository.count_by_tenant(
+                tenant_id=tenant_id, state=state, reviewer_user_id=reviewer_user_id
+            ) if include_total else None
+            return ReviewQueuePage(reviews=[], total=total, skip=skip, limit=limit)
+
         reviews, total = self.review_repository.list_by_tenant(
             tenant_id=tenant_id,
             state=state,
             reviewer_user_id=reviewer_user_id,
             skip=skip,
             limit=limit,
+            include_total=include_total,
         )
 
-        return {
-            "reviews": [
-                {
-                    "review_id": r.id,
-                    "sample_id": r.sample_id,
-                    "reviewer_user_id": r.reviewer_user_id,
-                    "state": r.state.value,
-                    "decision": r.decision.value if r.decision else None,
-                    "created_at": r.created_at.isoformat(),
-                    "submitted_at": r.submitted_at.isoformat() if r.submitted_at else None,
-                }
+        return ReviewQueuePage(
+            reviews=[
+                ReviewSummary(
+                    r.id,
+                    r.sample_id,
+                    r.reviewer_user_id,
+                    r.state.value,
+                    r.decision.value if r.decision else None,
+                    r.created_at,
+                    r.submitted_at,
+                )
                 for r in reviews
             ],
-            "total": total,
-            "skip": skip,
-            "limit": limit,
-        }
+            total=total,
+            skip=skip,
+            limit=limit,
+        )
 
+    @_single_transaction
     def approve_sample(
         self,
         review_id: str,
@@ -307,7 +413,7 @@ class ReviewService:
             ReviewCannotBeModifiedError: If review is already completed
             ReviewStateTransitionError: If state transition is invalid
         """
-        logger.info(f"Approving all results in review {review_id} by user {user_id}")
+        logger.info("Approving all results in review %s by user %s", review_id, user_id)
 
         # Load review
         review = self._load_and_validate_review(review_id, tenant_id)
@@ -315,44 +421,44 @@ class ReviewService:
         # Validate state transition
         self._validate_state_transition(review, ReviewState.APPROVED)
 
-        # Get all results for the sample that need review
-        results = self.result_repository.list_by_sample(review.sample_id, tenant_id)
-        results_needing_review = [
-            r for r in results if r.verification_status == ResultStatus.NEEDS_REVIEW
-        ]
+        # Get the results for the sample that need review (filtered in the database)
+        results_needing_review = self.result_repository.list_by_sample_and_status(
+            review.sample_id, tenant_id, [ResultStatus.NEEDS_REVIEW]
+        )
 
         if not results_needing_review:
             logger.warning(
-                f"No results needing review found for sample {review.sample_id}"
+                "No results needing review found for sample %s", review.sample_id
             )
 
-        # Create approval decision for each result
-        for result in results_needing_review:
-            self._approve_result_internal(
-                review_id=review_id,
-                result_id=result.id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                comments=comments,
-            )
+        # Create approval decisions for all results in one batch
+        self._record_decisions(
+            review_id=review_id,
+            result_ids=[r.id for r in results_needing_review],
+            tenant_id=tenant_id,
+            decision=_APPROVED,
+            result_status=ResultStatus.VERIFIED,
+            comments=comments,
+        )
 
         # Update review status
         review.state = ReviewState.APPROVED
         review.decision = ReviewDecisionType.APPROVE_ALL
         review.comments = comments
-        review.completed_at = datetime.utcnow()
-        review.submitted_at = datetime.utcnow()
-        review.update_timestamp()
+        now = datetime.utcnow()
+        review.completed_at = now
+        review.submitted_at = now
 
-        updated_review = self.review_repository.update(review)
+        updated_review = self._update_review(review)
 
         # Update sample status
         self._update_sample_status(review.sample_id, tenant_id, SampleStatus.VERIFIED)
 
-        logger.info(f"Approved all results in review {review_id}")
+        logger.info("Approved all results in review %s", review_id)
 
         return updated_review
 
+    @_single_transaction
     def reject_sample(
         self,
         review_id: str,
@@ -379,7 +485,7 @@ class ReviewService:
             ReviewCannotBeModifiedError: If review is already completed
             ReviewStateTransitionError: If state transition is invalid
         """
-        logger.info(f"Rejecting all results in review {review_id} by user {user_id}")
+        logger.info("Rejecting all results in review %s by user %s", review_id, user_id)
 
         # Load review
         review = self._load_and_validate_review(review_id, tenant_id)
@@ -387,39 +493,39 @@ class ReviewService:
         # Validate state transition
         self._validate_state_transition(review, ReviewState.REJECTED)
 
-        # Get all results for the sample that need review
-        results = self.result_repository.list_by_sample(review.sample_id, tenant_id)
-        results_needing_review = [
-            r for r in results if r.verification_status == ResultStatus.NEEDS_REVIEW
-        ]
-
-        # Create rejection decision for each result
-        for result in results_needing_review:
-            self._reject_result_internal(
-                review_id=review_id,
-                result_id=result.id,
-                tenant_id=tenant_id,
-                user_id=user_id,
-                comments=comments,
-            )
+        # Get the results for the sample that need review (filtered in the database)
+        results_needing_review = self.result_repository.list_by_sample_and_status(
+            review.sample_id, tenant_id, [ResultStatus.NEEDS_REVIEW]
+        )
+
+        # Create rejection decisions for all results in one batch
+        self._record_decisions(
+            review_id=review_id,
+            result_ids=[r.id for r in results_needing_review],
+            tenant_id=tenant_id,
+            decision=_REJECTED,
+            result_status=ResultStatus.REJECTED,
+            comments=comments,
+        )
 
         # Update review status
         review.state = ReviewState.REJECTED
         review.decision = ReviewDecisionType.REJECT_ALL
         review.comments = comments
-        review.completed_at = datetime.utcnow()
-        review.submitted_at = datetime.utcnow()
-        review.update_timestamp()
+        now = datetime.utcnow()
+        review.completed_at = now
+        review.submitted_at = now
 
-        updated_review = self.review_repository.update(review)
+        updated_review = self._update_review(review)
 
         # Update sample status
         self._update_sample_status(review.sample_id, tenant_id, SampleStatus.REJECTED)
 
-        logger.info(f"Rejected all results in review {review_id}")
+        logger.info("Rejected all results in review %s", review_id)
 
         return updated_review
 
+    @_single_transaction
     def approve_result(
         self,
         review_id: str,
@@ -427,6 +533,7 @@ class ReviewService:
         tenant_id: str,
         user_id: str,
         comments: Optional[str] = None,
+        schedule: Optional[Callable[..., None]] = None,
     ) -> ResultDecision:
         """
         Approve an individual result within a review.
@@ -437,6 +544,9 @@ class ReviewService:
             tenant_id: Tenant identifier
             user_id: User ID performing the approval
             comments: Optional approval comments
+            schedule: If given, the check for whether this decision
+                completes the review is passed to it as schedule(func, *args)
+                to run after the response (e.g. BackgroundTasks.add_task)
 
         Returns:
             Created result decision record
@@ -444,23 +554,16 @@ class ReviewService:
         Raises:
             ReviewNotFoundError: If review doesn't exist
             ResultNotFoundError: If result doesn't exist
+            InvalidReviewDecisionError: If result belongs to another sample
             ReviewCannotBeModifiedError: If review is completed
         """
-        logger.info(f"Approving result {result_id} in review {review_id} by user {user_id}")
+        logger.info("Approving result %s in review %s by user %s", result_id, review_id, user_id)
 
         # Load and validate review
         review = self._load_and_validate_review(review_id, tenant_id)
 
         # Verify result exists and belongs to this sample
-        result = self.result_repository.get_by_id(result_id, tenant_id)
-        if result is None:
-            raise ResultNotFoundError(
-                f"Result {result_id} not found in tenant {tenant_id}"
-            )
-        if result.sample_id != review.sample_id:
-            raise InvalidReviewDecisionError(
-                f"Result {result_id} does not belong to sample {review.sample_id}"
-            )
+        self._check_result_in_sample(result_id, review.sample_id, tenant_id)
 
         # Create approval decision
         decision = self._approve_result_internal(
@@ -471,11 +574,14 @@ class ReviewService:
             comments=comments,
         )
 
-        # Check if all results have been decided
-        self._check_and_complete_review(review, tenant_id)
+        # Check if all results have been decided; not needed while the
+        # review's counter shows some still pending
+        if not self.review_repository.decrement_pending_results(review_id, tenant_id):
+            self._schedule_completion_check(review, tenant_id, schedule)
 
         return decision
 
+    @_single_transaction
     def reject_result(
         self,
         review_id: str,
@@ -483,6 +589,7 @@ class ReviewService:
         tenant_id: str,
         user_id: str,
         comments: Optional[str] = None,
+        schedule: Optional[Callable[..., None]] = None,
     ) -> ResultDecision:
         """
         Reject an individual result within a review.
@@ -493,6 +600,9 @@ class ReviewService:
             tenant_id: Tenant identifier
             user_id: User ID performing the rejection
             comments: Optional rejection reason
+            schedule: If given, the check for whether this decision
+                completes the review is passed to it as schedule(func, *args)
+                to run after the response (e.g. BackgroundTasks.add_task)
 
         Returns:
             Created result decision record
@@ -500,23 +610,16 @@ class ReviewService:
         Raises:
             ReviewNotFoundError: If review doesn't exist
             ResultNotFoundError: If result doesn't exist
+            InvalidReviewDecisionError: If result belongs to another sample
             ReviewCannotBeModifiedError: If review is completed
         """
-        logger.info(f"Rejecting result {result_id} in review {review_id} by user {user_id}")
+        logger.info("Rejecting result %s in review %s by user %s", result_id, review_id, user_id)
 
         # Load and validate review
         review = self._load_and_validate_review(review_id, tenant_id)
 
         # Verify result exists and belongs to this sample
-        result = self.result_repository.get_by_id(result_id, tenant_id)
-        if result is None:
-            raise ResultNotFoundError(
-                f"Result {result_id} not found in tenant {tenant_id}"
-            )
-        if result.sample_id != review.sample_id:
-            raise InvalidReviewDecisionError(
-                f"Result {result_id} does not belong to sample {review.sample_id}"
-            )
+        self._check_result_in_sample(result_id, review.sample_id, tenant_id)
 
         # Create rejection decision
         decision = self._reject_result_internal(
@@ -527,11 +630,52 @@ class ReviewService:
             comments=comments,
         )
 
-        # Check if all results have been decided
-        self._check_and_complete_review(review, tenant_id)
+        # Check if all results have been decided; not needed while the
+        # review's counter shows some still pending
+        if not self.review_repository.decrement_pending_results(review_id, tenant_id):
+            self._schedule_completion_check(review, tenant_id, schedule)
 
         return decision
 
+    def complete_stalled_reviews(self, batch_size: int = 100) -> int:
+        """
+        Complete reviews whose last result decision was never followed by completion.
+
+        A completion check deferred until after a response is lost if the
+        process stops first, and a result that leaves review without a
+        decision (re-import, LIS correction) never counts the review's
+        counter down. This maintenance job catches both up across all
+        tenants: every pending or in-progress review has its results
+        counted, and is completed once none of its sample's results still
+        needs review and at least one result decision was recorded.
+        Escalated reviews are left to the pathologist. Counters that
+        disagree with the count are resynced.
+
+        Args:
+            batch_size: Reviews loaded per query
+
+        Returns:
+            Number of reviews completed
+        """
+        completed = 0
+        after_id = None
+        while True:
+            reviews = self.review_repository.list_awaiting_decisions(after_id=after_id, limit=batch_size)
+            if not reviews:
+                break
+            after_id = reviews[-1].id
+
+            for review in reviews:
+                try:
+                    if self._complete_stalled_review(review.id, review.tenant_id):
+                        completed += 1
+                except Exception:
+                    # One broken review must not hold up the rest
+                    logger.exception("Failed to complete review %s", review.id)
+            self.request_cache.clear()
+
+        return completed
+
     def escalate_review(
         self,
         review_id: str,
@@ -556,7 +700,7 @@ class ReviewService:
             ReviewCannotBeModifiedError: If review is already completed
             ReviewStateTransitionError: If state transition is invalid
         """
-        logger.info(f"Escalating review {review_id} by user {user_id}: {reason}")
+        logger.info("Escalating review %s by user %s: %s", review_id, user_id, reason)
 
         # Load review
         review = self._load_and_validate_review(review_id, tenant_id)
@@ -568,17 +712,16 @@ class ReviewService:
         review.state = ReviewState.ESCALATED
         review.escalation_reason = reason
         review.submitted_at = datetime.utcnow()
-        review.update_timestamp()
 
-        updated_review = self.review_repository.update(review)
+        updated_review = self._update_review(review)
 
-        logger.info(f"Escalated review {review_id} to pathologist")
+        logger.info("Escalated review %s to pathologist", review_id)
 
         return updated_review
 
     def _load_and_validate_review(self, review_id: str, tenant_id: str) -> Review:
         """Load review and validate it can be modified."""
-        review = self.review_repository.get_by_id(review_id, tenant_id)
+        review = self._get_review(review_id, tenant_id)
         if review is None:
             raise ReviewNotFoundError(
                 f"Review {review_id} not found in tenant {tenant_id}"
@@ -596,15 +739,7 @@ class ReviewService:
         self, review: Review, new_state: ReviewState
     ) -> None:
         """Validate that state transition is allowed."""
-        valid_transitions = {
-            ReviewState.PENDING: [ReviewState.IN_PROGRESS, ReviewState.APPROVED, ReviewState.REJECTED, ReviewState.ESCALATED],
-            ReviewState.IN_PROGRESS: [ReviewState.APPROVED, ReviewState.REJECTED, ReviewState.ESCALATED],
-            ReviewState.ESCALATED: [ReviewState.APPROVED, ReviewState.REJECTED],
-            ReviewState.APPROVED: [],  # Terminal state
-            ReviewState.REJECTED: [],  # Terminal state
-        }
-
-        if new_state not in valid_transitions.get(review.state, []):
+        if not _VALID_TRANSITIONS.get(review.state, 0) & _STATE_BIT[new_state]:
             raise ReviewStateTransitionError(
                 f"Cannot transition review from {review.state.value} to {new_state.value}"
             )
@@ -623,7 +758,7 @@ class ReviewService:
             tenant_id=tenant_id,
             review_id=review_id,
             result_id=result_id,
-            decision="approved",
+            decision=_APPROVED,
             comments=comments,
         )
         created_decision = self.result_decision_repository.create(decision)
@@ -636,7 +771,7 @@ class ReviewService:
             method="manual",
         )
 
-        logger.debug(f"Approved result {result_id} in review {review_id}")
+        logger.debug("Approved result %s in review %s", result_id, review_id)
 
         return created_decision
 
@@ -654,7 +789,7 @@ class ReviewService:
             tenant_id=tenant_id,
             review_id=review_id,
             result_id=result_id,
-            decision="rejected",
+            decision=_REJECTED,
             comments=comments,
         )
         created_decision = self.result_decision_repository.create(decision)
@@ -667,57 +802,201 @@ class ReviewService:
             method="manual",
         )
 
-        logger.debug(f"Rejected result {result_id} in review {review_id}")
+        logger.debug("Rejected result %s in review %s", result_id, review_id)
 
         return created_decision
 
-    def _check_and_complete_review(self, review: Review, tenant_id: str) -> None:
-        """Check if all results have been decided and complete review if so."""
-        # Get all results for sample
-        results = self.result_repository.list_by_sample(review.sample_id, tenant_id)
-        results_needing_review = [
-            r for r in results if r.verification_status == ResultStatus.NEEDS_REVIEW
-        ]
+    def _record_decisions(
+        self,
+        review_id: str,
+        result_ids: list[str],
+        tenant_id: str,
+        decision: str,
+        result_status: ResultStatus,
+        comments: Optional[str],
+    ) -> list[ResultDecision]:
+        """Internal method to record the same decision for several results at once."""
+        if not result_ids:
+            return []
+
+        # Create all decision records with a single insert
+        created_decisions = self.result_decision_repository.create_many(
+            [
+                ResultDecision(
+                    tenant_id=tenant_id,
+                    review_id=review_id,
+                    result_id=result_id,
+                    decision=decision,
+                    comments=comments,
+                )
+                for result_id in result_ids
+            ],
+            tenant_id,
+        )
 
-        # If no more results need review, mark review as complete
-        if not results_needing_review:
-            decisions = self.result_decision_repository.get_by_review(
-                review.id, tenant_id
-            )
+        # Update all result verification statuses with a single statement
+        self.result_repository.update_verification_status_bulk(
+            result_ids=result_ids,
+            tenant_id=tenant_id,
+            status=result_status,
+            method="manual",
+        )
 
-            # Determine overall decision
-            approved_count = sum(1 for d in decisions if d.decision == "approved")
-            rejected_count = sum(1 for d in decisions if d.decision == "rejected")
+        logger.debug("Recorded %s %s decisions in review %s", len(result_ids), decision, review_id)
 
-            if rejected_count == 0:
-                review.decision = ReviewDecisionType.APPROVE_ALL
-                review.state = ReviewState.APPROVED
-                sample_status = SampleStatus.VERIFIED
-            elif approved_count == 0:
-                review.decision = ReviewDecisionType.REJECT_ALL
-                review.state = ReviewState.REJECTED
-                sample_status = SampleStatus.REJECTED
-            else:
-                review.decision = ReviewDecisionType.PARTIAL
-                review.state = ReviewState.APPROVED
-                sample_status = SampleStatus.VERIFIED  # At least some results verified
+        return created_decisions
 
-            review.completed_at = datetime.utcnow()
-            review.submitted_at = review.submitted_at or datetime.utcnow()
-            review.update_timestamp()
+    def _schedule_completion_check(
+        self, review: Review, tenant_id: str, schedule: Optional[Callable[..., None]]
+    ) -> None:
+        """Check for review completion now, or hand the check to schedule if given."""
+        if schedule is None:
+            # Only called once the counter ran out; review may predate that
+            self._check_and_complete_review(review, tenant_id, stored_pending_count=0)
+        else:
+            schedule(self._run_deferred_completion_check, review.id, tenant_id)
+
+    def _run_deferred_completion_check(self, review_id: str, tenant_id: str) -> None:
+        """Run a completion check after the response, on a dedicated session if one is available."""
+        if self.completion_service_factory is None:
+            self._complete_review_if_decided(review_id, tenant_id)
+            return
+        with self.completion_service_factory() as service:
+            service._complete_review_if_decided(review_id, tenant_id)
+
+    @_single_transaction
+    def _complete_review_if_decided(self, review_id: str, tenant_id: str) -> None:
+        """Run a deferred completion check in its own transaction."""
+        # Reloaded: other decisions may have changed the review since
+        review = self.review_repository.get_by_id(review_id, tenant_id)
+        if review is not None and review.state not in _COMPLETED_STATES:
+            self._check_and_complete_review(review, tenant_id)
 
-            self.review_repository.update(review)
-            self._update_sample_status(review.sample_id, tenant_id, sample_status)
+    @_single_transaction
+    def _complete_stalled_review(self, review_id: str, tenant_id: str) -> bool:
+        """Run a maintenance completion check in its own transaction; True if completed."""
+        # Reloaded: a reviewer may have escalated or completed it since
+        review = self.review_repository.get_by_id(review_id, tenant_id)
+        if review is None or review.state not in _AUTO_COMPLETABLE_STATES:
+            return False
+        return self._check_and_complete_review(review, tenant_id)
 
-            logger.info(f"Completed review {review.id} with decision {review.decision.value}")
+    def _check_and_complete_review(
+        self, review: Review, tenant_id: str, stored_pending_count: Optional[int] = None
+    ) -> bool:
+        """
+        Check if all results have been decided and complete review if so; True if completed.
+
+        stored_pending_count is the review's stored counter, when the given
+        review may hold an older value.
+        """
+        # The review's pending_results_count only gates this check; counting
+        # the results confirms it (reviews created before the counter start
+        # at zero, and a result decided twice is decremented twice)
+        pending_count = self.result_repository.count_by_sample_and_status(
+            review.sample_id, tenant_id, ResultStatus.NEEDS_REVIEW
+        )
+
+        if stored_pending_count is None:
+            stored_pending_count = review.pending_results_count
+        if pending_count != stored_pending_count:
+            # Resync the counter, so the next decisions are gated on what
+            # is actually pending
+            self.review_repository.set_pending_results(review.id, tenant_id, pending_count)
+            self.request_cache.invalidate(("review", tenant_id, review.id))
+        if pending_count > 0:
+            return False
+
+        # No more results need review: complete the review, with the
+        # overall decision taken from the decision totals
+        decision_counts = self.result_decision_repository.count_by_review_grouped(
+            review.id, tenant_id
+        )
+        approved_count = decision_counts.get(_APPROVED, 0)
+        rejected_count = decision_counts.get(_REJECTED, 0)
+        if approved_count + rejected_count == 0:
+            # Nothing was decided, so there is nothing to complete it with
+            logger.info("Review %s has no result decisions; left open", review.id)
+            return False
+
+        open_state = review.state
+        if rejected_count == 0:
+            review.decision = ReviewDecisionType.APPROVE_ALL
+            review.state = ReviewState.APPROVED
+            sample_status = SampleStatus.VERIFIED
+        elif approved_count == 0:
+            review.decision = ReviewDecisionType.REJECT_ALL
+            review.state = ReviewState.REJECTED
+            sample_status = SampleStatus.REJECTED
+        else:
+            review.decision = ReviewDecisionType.PARTIAL
+            review.state = ReviewState.APPROVED
+            sample_status = SampleStatus.VERIFIED  # At least some results verified
+
+        now = datetime.utcnow()
+        review.completed_at = now
+        review.submitted_at = review.submitted_at or now
+
+        # Completion checks for the review's last decisions may race;
+        # only the first to move it out of its open state completes it
+        if self._update_review_if_state(review, open_state) is None:
+            logger.info("Review %s was already completed", review.id)
+            return False
+        self._update_sample_status(review.sample_id, tenant_id, sample_status)
+
+        logger.info("Completed review %s with decision %s", review.id, review.decision.value)
+        return True
 
     def _update_sample_status(
         self, sample_id: str, tenant_id: str, status: SampleStatus
     ) -> None:
-        """Update sample status."""
-        sample = self.sample_repository.get_by_id(sample_id, tenant_id)
-        if sample:
-            sample.status = status
-            sample.update_timestamp()
-            self.sample_repository.update(sample)
-            logger.debug(f"Updated sample {sample_id} status to {status.value}")
+        """Update sample status with a single write (the sample isn't loaded)."""
+        if self.sample_repository.update_status(sample_id, tenant_id, status):
+            self.request_cache.invalidate(("sample", tenant_id, sample_id))
+            logger.debug("Updated sample %s status to %s", sample_id, status.value)
+
+    def _get_review(self, review_id: str, tenant_id: str) -> Optional[Review]:
+        """Get a review, reusing one already loaded in this request."""
+        return self.request_cache.get_or_load(
+            ("review", tenant_id, review_id),
+            lambda: self.review_repository.get_by_id(review_id, tenant_id),
+        )
+
+    def _check_result_in_sample(self, result_id: str, sample_id: str, tenant_id: str) -> None:
+        """Check that a result belongs to the review's sample, without loading it."""
+        if self.result_repository.exists_in_sample(result_id, sample_id, tenant_id):
+            return
+        # Only a failed check pays for the lookup that picks the error
+        if self.result_repository.get_by_id(result_id, tenant_id) is None:
+            raise ResultNotFoundError(
+                f"Result {result_id} not found in tenant {tenant_id}"
+            )
+        raise InvalidReviewDecisionError(
+            f"Result {result_id} does not belong to sample {sample_id}"
+        )
+
+    def _get_sample(self, sample_id: str, tenant_id: str):
+        """Get a sample, reusing one already loaded in this request."""
+        return self.request_cache.get_or_load(
+            ("sample", tenant_id, sample_id),
+            lambda: self.sample_repository.get_by_id(sample_id, tenant_id),
+        )
+
+    def _update_review(self, review: Review) -> Review:
+        """Update a review and keep the stored version for later reads."""
+        updated_review = self.review_repository.update(review)
+        self.request_cache.set(("review", review.tenant_id, review.id), updated_review)
+        return updated_review
+
+    def _update_review_if_state(
+        self, review: Review, expected_state: ReviewState
+    ) -> Optional[Review]:
+        """Update a review still in expected_state; None if its state had changed."""
+        updated_review = self.review_repository.update_if_state(review, expected_state)
+        if updated_review is None:
+            # The cached review holds the changes that were not applied
+            self.request_cache.invalidate(("review", review.tenant_id, review.id))
+        else:
+            self.request_cache.set(("review", review.tenant_id, review.id), updated_review)
+        return updated_review
+
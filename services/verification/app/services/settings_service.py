@@ -8,6 +8,7 @@ from app.ports.auto_verification_settings_repository import (
     IAutoVerificationSettingsRepository,
 )
 from app.ports.verification_rule_repository import IVerificationRuleRepository
+from app.cache import TTLCache
 from app.models import AutoVerificationSettings, VerificationRule, RuleType
 from app.exceptions import (
     SettingsNotFoundError,
@@ -19,6 +20,18 @@ from app.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Rule types by value, and their list for error messages, built once
+_RULE_TYPES_BY_VALUE: dict[str, RuleType] = {r.value: r for r in RuleType}
+_RULE_TYPE_VALUES = ", ".join(_RULE_TYPES_BY_VALUE)
+
+# Settings fields validated against each other, in _validate_ranges order
+_RANGE_FIELDS = (
+    "reference_range_low",
+    "reference_range_high",
+    "critical_range_low",
+    "critical_range_high",
+)
+
 
 class SettingsService:
     """
@@ -35,6 +48,10 @@ class SettingsService:
     Attributes:
         settings_repository: Repository for auto-verification settings
         rules_repository: Repository for verification rules
+        settings_cache: Optional cache of get_settings lookups keyed by
+            (tenant_id, test_code), shared across service instances
+        rules_cache: Optional cache of rule lookups keyed by (tenant_id,),
+            shared with the verification engine
     """
 
     # Default rules for new tenants
@@ -69,6 +86,8 @@ class SettingsService:
         self,
         settings_repository: IAutoVerificationSettingsRepository,
         rules_repository: IVerificationRuleRepository,
+        settings_cache: Optional[TTLCache] = None,
+        rules_cache: Optional[TTLCache] = None,
     ):
         """
         Initialize the settings service.
@@ -76,9 +95,15 @@ class SettingsService:
         Args:
             settings_repository: Repository for accessing settings
             rules_repository: Repository for accessing rules
+            settings_cache: Optional cache for get_settings lookups; caching is
+                disabled when omitted
+            rules_cache: Optional cache of rule lookups made by the
+                verification engine; entries are dropped when rules change
         """
         self.settings_repository = settings_repository
         self.rules_repository = rules_repository
+        self.settings_cache = settings_cache
+        self.rules_cache = rules_cache
 
     def create_settings(
         self,
@@ -116,16 +141,11 @@ class SettingsService:
             InvalidConfigurationError: If configuration is invalid
         """
         logger.info(
-            f"Creating verification settings for test {test_code} in tenant {tenant_id}"
+            "Creating verification settings for test %s in tenant %s",
+            test_code,
+            tenant_id,
         )
 
-        # Check if settings already exist
-        existing = self.settings_repository.get_by_test_code(test_code, tenant_id)
-        if existing is not None:
-            raise SettingsAlreadyExistsError(
-                f"Settings already exist for test {test_code} in tenant {tenant_id}"
-            )
-
         # Validate configuration
         self._validate_ranges(
             reference_range_low,
@@ -146,20 +166,92 @@ class SettingsService:
             critical_range_high=critical_range_high,
             delta_check_threshold_percent=delta_check_threshold_percent,
             delta_check_lookback_days=delta_check_lookback_days,
+            instrument_flags_to_block=list(instrument_flags_to_block or []),
         )
 
-        # Set instrument flags if provided
-        if instrument_flags_to_block:
-            settings.set_instrument_flags_to_block(instrument_flags_to_block)
-
-        created_settings = self.settings_repository.create(settings)
+        # The existence check happens in the insert itself
+        created_settings = self.settings_repository.create_if_absent(settings)
+        if created_settings is None:
+            raise SettingsAlreadyExistsError(
+                f"Settings already exist for test {test_code} in tenant {tenant_id}"
+            )
+        self._invalidate_cached_settings(tenant_id, test_code)
 
         logger.info(
-            f"Created verification settings {created_settings.id} for test {test_code}"
+            "Created verification settings %s for test %s",
+            created_settings.id,
+            test_code,
         )
 
         return created_settings
 
+    def batch_create_settings(
+        self, tenant_id: str, settings_data: list[dict]
+    ) -> list[AutoVerificationSettings]:
+        """
+        Create auto-verification settings for many test codes at once.
+
+        All entries are validated before anything is written, then inserted in
+        a single repository call. Test codes that already have settings are
+        skipped, as are repeats of a test code within the batch.
+
+        Args:
+            tenant_id: Tenant identifier
+            settings_data: One dict per test code, with the same keys as the
+                create_settings arguments (test_code and test_name required)
+
+        Returns:
+            The settings records that were created
+
+        Raises:
+            InvalidConfigurationError: If any entry's configuration is invalid
+        """
+        logger.info(
+            "Batch creating %s verification settings in tenant %s",
+            len(settings_data),
+            tenant_id,
+        )
+
+        settings_list = []
+        for data in settings_data:
+            delta_check_lookback_days = data.get("delta_check_lookback_days", 30)
+            self._validate_ranges(
+                data.get("reference_range_low"),
+                data.get("reference_range_high"),
+                data.get("critical_range_low"),
+                data.get("critical_range_high"),
+            )
+            self._validate_delta_config(
+                data.get("delta_check_threshold_percent"), delta_check_lookback_days
+            )
+
+            settings = AutoVerificationSettings(
+                tenant_id=tenant_id,
+                test_code=data["test_code"],
+                test_name=data["test_name"],
+                reference_range_low=data.get("reference_range_low"),
+                reference_range_high=data.get("reference_range_high"),
+                critical_range_low=data.get("critical_range_low"),
+                critical_range_high=data.get("critical_range_high"),
+                delta_check_threshold_percent=data.get("delta_check_threshold_percent"),
+                delta_check_lookback_days=delta_check_lookback_days,
+                instrument_flags_to_block=list(data.get("instrument_flags_to_block") or []),
+            )
+            settings_list.append(settings)
+
+        created = self.settings_repository.create_many(settings_list)
+        for settings in created:
+            self._invalidate_cached_settings(tenant_id, settings.test_code)
+
+        logger.info(
+            "Batch created %s of %s verification settings in tenant %s",
+            len(created),
+            len(settings_data),
+            tenant_id,
+        )
+
+        return created
+
     def get_settings(self, tenant_id: str, test_code: str) -> AutoVerificationSettings:
         """
         Get auto-verification settings for a specific test code.
@@ -174,7 +266,13 @@ class SettingsService:
         Raises:
             SettingsNotFoundError: If settings don't exist for this test code
         """
-        logger.debug(f"Getting settings for test {test_code} in tenant {tenant_id}")
+        logger.debug("Getting settings for test %s in tenant %s", test_code, tenant_id)
+
+        cache_key = (tenant_id, test_code)
+        if self.settings_cache is not None:
+            cached = self.settings_cache.get(cache_key)
+            if cached is not None:
+                return self._detached_copy(cached)
 
         settings = self.settings_repository.get_by_test_code(test_code, tenant_id)
         if settings is None:
@@ -182,6 +280,9 @@ class SettingsService:
                 f"No settings found for test {test_code} in tenant {tenant_id}"
             )
 
+        if self.settings_cache is not None:
+            self.settings_cache.set(cache_key, self._detached_copy(settings))
+
         return settings
 
     def list_settings(
@@ -198,30 +299,17 @@ class SettingsService:
         Returns:
             Dictionary containing list of settings and total count
         """
-        logger.debug(f"Listing settings for tenant {tenant_id}")
+        logger.debug("Listing settings for tenant %s", tenant_id)
 
-        settings_list, total = self.settings_repository.list_all(
+        # Rows come back as plain dicts keyed by column name, so no entities
+        # are built. Timestamps stay datetimes; the API's orjson encoder
+        # formats them.
+        rows, total = self.settings_repository.list_all_projected(
             tenant_id=tenant_id, skip=skip, limit=limit
         )
 
         return {
-            "settings": [
-                {
-                    "id": s.id,
-                    "test_code": s.test_code,
-                    "test_name": s.test_name,
-                    "reference_range_low": s.reference_range_low,
-                    "reference_range_high": s.reference_range_high,
-                    "critical_range_low": s.critical_range_low,
-                    "critical_range_high": s.critical_range_high,
-                    "instrument_flags_to_block": s.get_instrument_flags_to_block(),
-                    "delta_check_threshold_percent": s.delta_check_threshold_percent,
-                    "delta_check_lookback_days": s.delta_check_lookback_days,
-                    "created_at": s.created_at.isoformat(),
-                    "updated_at": s.updated_at.isoformat(),
-                }
-                for s in settings_list
-            ],
+            "settings": rows,
             "total": total,
             "skip": skip,
             "limit": limit,
@@ -265,54 +353,53 @@ class SettingsService:
             SettingsNotFoundError: If settings don't exist for this test code
             InvalidConfigurationError: If updated configuration is invalid
         """
-        logger.info(f"Updating settings for test {test_code} in tenant {tenant_id}")
-
-        # Load existing settings
-        settings = self.settings_repository.get_by_test_code(test_code, tenant_id)
-        if settings is None:
-            raise SettingsNotFoundError(
-                f"No settings found for test {test_code} in tenant {tenant_id}"
+        logger.info("Updating settings for test %s in tenant %s", test_code, tenant_id)
+
+        # Only the provided fields are written
+        patch = {
+            field: value
+            for field, value in (
+                ("test_name", test_name),
+                ("reference_range_low", reference_range_low),
+                ("reference_range_high", reference_range_high),
+                ("critical_range_low", critical_range_low),
+                ("critical_range_high", critical_range_high),
+                ("delta_check_threshold_percent", delta_check_threshold_percent),
+                ("delta_check_lookback_days", delta_check_lookback_days),
             )
-
-        # Update fields if provided
-        if test_name is not None:
-            settings.test_name = test_name
-
-        if reference_range_low is not None:
-            settings.reference_range_low = reference_range_low
-        if reference_range_high is not None:
-            settings.reference_range_high = reference_range_high
-
-        if critical_range_low is not None:
-            settings.critical_range_low = critical_range_low
-        if critical_range_high is not None:
-            settings.critical_range_high = critical_range_high
-
+            if value is not None
+        }
         if instrument_flags_to_block is not None:
-            settings.set_instrument_flags_to_block(instrument_flags_to_block)
+            patch["instrument_flags_to_block"] = list(instrument_flags_to_block)
+
+        self._validate_delta_config(delta_check_threshold_percent, delta_check_lookback_days)
 
-        if delta_check_threshold_percent is not None:
-            settings.delta_check_threshold_percent = delta_check_threshold_percent
-        if delta_check_lookback_days is not None:
-            settings.delta_check_lookback_days = delta_check_lookback_days
+        # The ranges are validated together, so a partial range change is
+        # checked against the stored values. The row stays locked until the
+        # update below commits, so a concurrent edit cannot slip in between.
+        if not patch.keys().isdisjoint(_RANGE_FIELDS):
+            current = self.settings_repository.get_by_test_code(
+                test_code, tenant_id, for_update=True
+            )
+            if current is None:
+                raise SettingsNotFoundError(
+                    f"No settings found for test {test_code} in tenant {tenant_id}"
+                )
+            self._validate_ranges(
+                *(patch.get(field, getattr(current, field)) for field in _RANGE_FIELDS)
+            )
 
-        # Validate updated configuration
-        self._validate_ranges(
-            settings.reference_range_low,
-            settings.reference_range_high,
-            settings.critical_range_low,
-            settings.critical_range_high,
-        )
-        self._validate_delta_config(
-            settings.delta_check_threshold_percent,
-            settings.delta_check_lookback_days,
+        # Save (updated_at is set by the repository)
+        updated_settings = self.settings_repository.update_by_test_code(
+            test_code, tenant_id, patch
         )
+        if updated_settings is None:
+            raise SettingsNotFoundError(
+                f"No settings found for test {test_code} in tenant {tenant_id}"
+            )
+        self._invalidate_cached_settings(tenant_id, test_code)
 
-        # Update timestamp and save
-        settings.update_timestamp()
-        updated_settings = self.settings_repository.update(settings)
-
-        logger.info(f"Updated settings for test {test_code}")
+        logger.info("Updated settings for test %s", test_code)
 
         return updated_settings
 
@@ -330,22 +417,16 @@ class SettingsService:
         Raises:
             SettingsNotFoundError: If settings don't exist
         """
-        logger.info(f"Deleting settings for test {test_code} in tenant {tenant_id}")
+        logger.info("Deleting settings for test %s in tenant %s", test_code, tenant_id)
 
-        # Get settings to find ID
-        settings = self.settings_repository.get_by_test_code(test_code, tenant_id)
-        if settings is None:
+        deleted = self.settings_repository.delete_by_test_code(test_code, tenant_id)
+        if not deleted:
             raise SettingsNotFoundError(
                 f"No settings found for test {test_code} in tenant {tenant_id}"
             )
+        self._invalidate_cached_settings(tenant_id, test_code)
 
-        # Delete settings
-        deleted = self.settings_repository.delete(settings.id, tenant_id)
-
-        if deleted:
-            logger.info(f"Deleted settings for test {test_code}")
-        else:
-            logger.warning(f"Failed to delete settings for test {test_code}")
+        logger.info("Deleted settings for test %s", test_code)
 
         return deleted
 
@@ -359,7 +440,7 @@ class SettingsService:
         Returns:
             List of rule configurations
         """
-        logger.debug(f"Getting verification rules for tenant {tenant_id}")
+        logger.debug("Getting verification rules for tenant %s", tenant_id)
 
         rules = self.rules_repository.get_by_tenant(tenant_id)
 
@@ -370,8 +451,8 @@ class SettingsService:
                 "enabled": r.enabled,
                 "priority": r.priority,
                 "description": r.description,
-                "created_at": r.created_at.isoformat(),
-                "updated_at": r.updated_at.isoformat(),
+                "created_at": r.created_at,
+                "updated_at": r.updated_at,
             }
             for r in rules
         ]
@@ -391,20 +472,13 @@ class SettingsService:
             RuleNotFoundError: If rule doesn't exist
             InvalidConfigurationError: If rule type is invalid
         """
-        logger.info(f"Enabling rule {rule_type} for tenant {tenant_id}")
+        logger.info("Enabling rule %s for tenant %s", rule_type, tenant_id)
 
         # Validate rule type
-        try:
-            rule_type_enum = RuleType(rule_type)
-        except ValueError:
-            raise InvalidConfigurationError(
-                f"Invalid rule type: {rule_type}. Must be one of: "
-                f"{', '.join(r.value for r in RuleType)}"
-            )
+        rule_type_enum = self._parse_rule_type(rule_type)
 
         # Find rule
-        rules = self.rules_repository.get_by_tenant(tenant_id)
-        rule = next((r for r in rules if r.rule_type == rule_type_enum), None)
+        rule = self.rules_repository.get_by_tenant_and_type(tenant_id, rule_type_enum)
 
         if rule is None:
             raise RuleNotFoundError(
@@ -413,11 +487,11 @@ class SettingsService:
 
         # Enable rule
         rule.enabled = True
-        rule.update_timestamp()
 
         updated_rule = self.rules_repository.update(rule)
+        self._invalidate_cached_rules(tenant_id)
 
-        logger.info(f"Enabled rule {rule_type} for tenant {tenant_id}")
+        logger.info("Enabled rule %s for tenant %s", rule_type, tenant_id)
 
         return updated_rule
 
@@ -436,20 +510,13 @@ class SettingsService:
             RuleNotFoundError: If rule doesn't exist
             InvalidConfigurationError: If rule type is invalid
         """
-        logger.info(f"Disabling rule {rule_type} for tenant {tenant_id}")
+        logger.info("Disabling rule %s for tenant %s", rule_type, tenant_id)
 
         # Validate rule type
-        try:
-            rule_type_enum = RuleType(rule_type)
-        except ValueError:
-            raise InvalidConfigurationError(
-                f"Invalid rule type: {rule_type}. Must be one of: "
-                f"{', '.join(r.value for r in RuleType)}"
-            )
+        rule_type_enum = self._parse_rule_type(rule_type)
 
         # Find rule
-        rules = self.rules_repository.get_by_tenant(tenant_id)
-        rule = next((r for r in rules if r.rule_type == rule_type_enum), None)
+        rule = self.rules_repository.get_by_tenant_and_type(tenant_id, rule_type_enum)
 
         if rule is None:
             raise RuleNotFoundError(
@@ -458,11 +525,11 @@ class SettingsService:
 
         # Disable rule
         rule.enabled = False
-        rule.update_timestamp()
 
         updated_rule = self.rules_repository.update(rule)
+        self._invalidate_cached_rules(tenant_id)
 
-        logger.info(f"Disabled rule {rule_type} for tenant {tenant_id}")
+        logger.info("Disabled rule %s for tenant %s", rule_type, tenant_id)
 
         return updated_rule
 
@@ -479,38 +546,53 @@ class SettingsService:
         Returns:
             List of created rule records
         """
-        logger.info(f"Initializing default rules for tenant {tenant_id}")
+        logger.info("Initializing default rules for tenant %s", tenant_id)
 
         # Check if rules already exist
         existing_rules = self.rules_repository.get_by_tenant(tenant_id)
         if existing_rules:
             logger.warning(
-                f"Rules already exist for tenant {tenant_id} - skipping initialization"
+                "Rules already exist for tenant %s - skipping initialization",
+                tenant_id,
             )
             return existing_rules
 
-        # Create default rules
-        created_rules = []
-        for rule_config in self.DEFAULT_RULES:
-            rule = VerificationRule(
-                tenant_id=tenant_id,
-                rule_type=rule_config["rule_type"],
-                enabled=rule_config["enabled"],
-                priority=rule_config["priority"],
-                description=rule_config["description"],
-            )
+        # Create default rules in one batch
+        rules = [
+            VerificationRule(tenant_id=tenant_id, **rule_config)
+            for rule_config in self.DEFAULT_RULES
+        ]
+        created_rules = self.rules_repository.create_many(rules, tenant_id)
+        self._invalidate_cached_rules(tenant_id)
+
+        logger.info("Initialized %s default rules for tenant %s", len(created_rules), tenant_id)
+
+        return created_rules
 
-            # Note: This would need to be implemented in the repository
-            # For now, we assume the repository has a create method or
-            # rules are seeded at the database level
-            logger.debug(
-                f"Would create rule {rule.rule_type.value} with priority {rule.priority}"
+    @staticmethod
+    def _parse_rule_type(rule_type: str) -> RuleType:
+        """Look up a rule type by value, rejecting unknown ones."""
+        rule_type_enum = _RULE_TYPES_BY_VALUE.get(rule_type)
+        if rule_type_enum is None:
+            raise InvalidConfigurationError(
+                f"Invalid rule type: {rule_type}. Must be one of: {_RULE_TYPE_VALUES}"
             )
-            # created_rules.append(self.rules_repository.create(rule))
+        return rule_type_enum
 
-        logger.info(f"Initialized {len(self.DEFAULT_RULES)} default rules for tenant {tenant_id}")
+    def _invalidate_cached_settings(self, tenant_id: str, test_code: str) -> None:
+        """Drop the cached get_settings entry for a test code after a write."""
+        if self.settings_cache is not None:
+            self.settings_cache.pop((tenant_id, test_code))
 
-        return created_rules
+    def _invalidate_cached_rules(self, tenant_id: str) -> None:
+        """Drop the cached rule lookup for a tenant after a rule changes."""
+        if self.rules_cache is not None:
+            self.rules_cache.pop((tenant_id,))
+
+    @staticmethod
+    def _detached_copy(settings: AutoVerificationSettings) -> AutoVerificationSettings:
+        """Copy settings into an instance not bound to any database session."""
+        return AutoVerificationSettings(**settings.model_dump())
 
     def _validate_ranges(
         self,
@@ -531,50 +613,49 @@ class SettingsService:
         Raises:
             InvalidConfigurationError: If ranges are invalid
         """
-        # Reference range validation
+        # Each range's low bound must be below its high bound
+        for label, low, high in (
+            ("Reference", reference_low, reference_high),
+            ("Critical", critical_low, critical_high),
+        ):
+            if low is not None and high is not None and low >= high:
+                raise InvalidConfigurationError(
+                    f"{label} range low ({low}) must be less than high ({high})"
+                )
+
+        # Cross-validation: critical ranges should be outside reference ranges.
+        # The messages are only formatted if the warning is actually emitted.
         if (
             reference_low is not None
-            and reference_high is not None
-            and reference_low >= reference_high
+            and critical_low is not None
+            and critical_low >= reference_low
         ):
-            raise InvalidConfigurationError(
-                f"Reference range low ({reference_low}) must be less than high ({reference_high})"
+            logger.warning(
+                "Critical low (%s) should typically be less than reference low (%s)",
+                critical_low,
+                reference_low,
             )
 
-        # Critical range validation
         if (
-            critical_low is not None
+            reference_high is not None
             and critical_high is not None
-            and critical_low >= critical_high
+            and critical_high <= reference_high
         ):
-            raise InvalidConfigurationError(
-                f"Critical range low ({critical_low}) must be less than high ({critical_high})"
+            logger.warning(
+                "Critical high (%s) should typically be greater than reference high (%s)",
+                critical_high,
+                reference_high,
             )
 
-        # Cross-validation: critical ranges should be outside reference ranges
-        if reference_low is not None and critical_low is not None:
-            if critical_low >= reference_low:
-                logger.warning(
-                    f"Critical low ({critical_low}) should typically be less than "
-                    f"reference low ({reference_low})"
-                )
-
-        if reference_high is not None and critical_high is not None:
-            if critical_high <= reference_high:
-                logger.warning(
-                    f"Critical high ({critical_high}) should typically be greater than "
-                    f"reference high ({reference_high})"
-                )
-
     def _validate_delta_config(
-        self, threshold_percent: Optional[float], lookback_days: int
+        self, threshold_percent: Optional[float], lookback_days: Optional[int]
     ) -> None:
         """
         Validate delta check configuration.
 
         Args:
             threshold_percent: Delta check threshold percentage
-            lookback_days: Number of days to look back
+            lookback_days: Number of days to look back (None if unchanged)
 
         Raises:
             InvalidConfigurationError: If configuration is invalid
@@ -589,11 +670,12 @@ class SettingsService:
                     f"Delta check threshold ({threshold_percent}%) is unreasonably high"
                 )
 
-        if lookback_days < 1:
-            raise InvalidConfigurationError(
-                f"Delta check lookback days ({lookback_days}) must be at least 1"
-            )
-        if lookback_days > 365:
-            raise InvalidConfigurationError(
-                f"Delta check lookback days ({lookback_days}) is unreasonably high"
-            )
+        if lookback_days is not None:
+            if lookback_days < 1:
+                raise InvalidConfigurationError(
+                    f"Delta check lookback days ({lookback_days}) must be at least 1"
+                )
+            if lookback_days > 365:
+                raise InvalidConfigurationError(
+                    f"Delta check lookback days ({lookback_days}) is unreasonably high"
+                )
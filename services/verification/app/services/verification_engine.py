@@ -1,6 +1,7 @@
 """Verification engine implementation."""
 
 import logging
+import re
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -14,8 +15,13 @@ from app.ports.auto_verification_settings_repository import (
 )
 from app.ports.verification_rule_repository import IVerificationRuleRepository
 from app.models import AutoVerificationSettings, VerificationRule, RuleType
+from app.cache import TTLCache
 from app.exceptions import SettingsNotFoundError
 
+# One token of an LIS flag string; flags are separated by commas, semicolons
+# or whitespace
+_FLAG_TOKEN = re.compile(r"[^,;\s]+")
+
 # Note: We import from LIS integration service for result history lookup
 # In production, this would be done via service-to-service communication
 try:
@@ -34,6 +40,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Rule types that compare the result value numerically
+_NUMERIC_RULE_TYPES = frozenset({RuleType.REFERENCE_RANGE, RuleType.CRITICAL_RANGE})
+
+# Marks a result value that has not been parsed yet
+_UNPARSED = object()
+
+
+def _parse_numeric(value: Optional[str]) -> Optional[float]:
+    """Parse a result value as a float, or return None if it isn't numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
 
 class VerificationEngine(IVerificationEngine):
     """
@@ -49,6 +69,9 @@ class VerificationEngine(IVerificationEngine):
         settings_repository: Repository for auto-verification settings
         rules_repository: Repository for verification rules
         result_repository: Repository for historical results (for delta checks)
+        settings_cache: Optional cache of settings lookups keyed by
+            (tenant_id, test_code)
+        rules_cache: Optional cache of rule lookups keyed by (tenant_id,)
     """
 
     def __init__(
@@ -56,6 +79,8 @@ class VerificationEngine(IVerificationEngine):
         settings_repository: IAutoVerificationSettingsRepository,
         rules_repository: IVerificationRuleRepository,
         result_repository: Optional[IResultRepository] = None,
+        settings_cache: Optional[TTLCache] = None,
+        rules_cache: Optional[TTLCache] = None,
     ):
         """
         Initialize the verification engine.
@@ -65,10 +90,16 @@ class VerificationEngine(IVerificationEngine):
             rules_repository: Repository for accessing verification rules
             result_repository: Optional repository for accessing historical results
                              (required only if delta check rule is enabled)
+            settings_cache: Optional cache for settings lookups, shared with
+                SettingsService so its writes invalidate entries
+            rules_cache: Optional cache for rule lookups, shared with
+                SettingsService so its writes invalidate entries
         """
         self.settings_repository = settings_repository
         self.rules_repository = rules_repository
         self.result_repository = result_repository
+        self.settings_cache = settings_cache
+        self.rules_cache = rules_cache
 
     def verify_result(
         self,
@@ -109,9 +140,7 @@ class VerificationEngine(IVerificationEngine):
 
         # Load settings if not provided
         if settings is None:
-            settings = self.settings_repository.get_by_test_code(
-                result.test_code, tenant_id
-            )
+            settings = self._load_settings(result.test_code, tenant_id)
             if settings is None:
                 raise SettingsNotFoundError(
                     f"No auto-verification settings found for test code "
@@ -120,29 +149,103 @@ class VerificationEngine(IVerificationEngine):
 
         # Load rules if not provided
         if rules is None:
-            rules = self.rules_repository.get_by_tenant(tenant_id)
+            rules = self._load_rules(tenant_id)
+
+        return self._evaluate(result, tenant_id, settings, self._enabled_in_priority_order(rules))
+
+    def _load_settings(
+        self, test_code: str, tenant_id: str
+    ) -> Optional[AutoVerificationSettings]:
+        """Look up settings for a test code, through the settings cache if configured."""
+        if self.settings_cache is None:
+            return self.settings_repository.get_by_test_code(test_code, tenant_id)
+
+        cache_key = (tenant_id, test_code)
+        settings = self.settings_cache.get(cache_key)
+        if settings is None:
+            settings = self.settings_repository.get_by_test_code(test_code, tenant_id)
+            if settings is not None:
+                # Cache an instance detached from the request's session
+                settings = AutoVerificationSettings(**settings.model_dump())
+                self.settings_cache.set(cache_key, settings)
+        return settings
+
+    def _load_settings_for_codes(
+        self, test_codes: list[str], tenant_id: str
+    ) -> dict[str, AutoVerificationSettings]:
+        """Look up settings for several test codes, fetching cache misses in one call."""
+        found = {}
+        missing = []
+        for test_code in test_codes:
+            settings = None
+            if self.settings_cache is not None:
+                settings = self.settings_cache.get((tenant_id, test_code))
+            if settings is None:
+                missing.append(test_code)
+            else:
+                found[test_code] = settings
+
+        if missing:
+            for settings in self.settings_repository.get_by_test_codes(missing, tenant_id):
+                if self.settings_cache is not None:
+                    settings = AutoVerificationSettings(**settings.model_dump())
+                    self.settings_cache.set((tenant_id, settings.test_code), settings)
+                found[settings.test_code] = settings
+        return found
+
+    def _load_rules(self, tenant_id: str) -> list[VerificationRule]:
+        """Look up a tenant's rules, through the rules cache if configured."""
+        if self.rules_cache is None:
+            return self.rules_repository.get_by_tenant(tenant_id)
+
+        cache_key = (tenant_id,)
+        rules = self.rules_cache.get(cache_key)
+        if rules is None:
+            # Cache instances detached from the request's session
+            rules = [
+                VerificationRule(**rule.model_dump())
+                for rule in self.rules_repository.get_by_tenant(tenant_id)
+            ]
+            self.rules_cache.set(cache_key, rules)
+        return rules
 
-        # Filter to only enabled rules and sort by priority
-        enabled_rules = [r for r in rules if r.enabled]
-        enabled_rules.sort(key=lambda r: r.priority)
+    @staticmethod
+    def _enabled_in_priority_order(rules: list[VerificationRule]) -> list[VerificationRule]:
+        """Filter to only enabled rules and sort by priority."""
+        return sorted((r for r in rules if r.enabled), key=lambda r: r.priority)
 
+    def _evaluate(
+        self,
+        result: ResultData,
+        tenant_id: str,
+        settings: AutoVerificationSettings,
+        enabled_rules: list[VerificationRule],
+        sample_history: Optional[dict[str, list]] = None,
+    ) -> VerificationDecision:
+        """Apply enabled rules (already in priority order) to a result."""
         logger.debug(
             f"Applying {len(enabled_rules)} enabled rules to result {result.result_id}"
         )
 
         # Apply each rule in order (short-circuit on first failure)
-        failed_rules = []
-        failure_reasons = []
+        failed_rules: tuple[str, ...] = ()
+        failure_reasons: tuple[str, ...] = ()
+        numeric_value = _UNPARSED
 
         for rule in enabled_rules:
-            passes, reason = self._apply_rule(rule, result, tenant_id, settings)
+            if rule.rule_type in _NUMERIC_RULE_TYPES and numeric_value is _UNPARSED:
+                # Parse the value once for all numeric checks
+                numeric_value = _parse_numeric(result.value)
+            passes, reason = self._apply_rule(
+                rule, result, tenant_id, settings, numeric_value, sample_history
+            )
 
             if not passes:
                 logger.info(
                     f"Result {result.result_id} failed rule {rule.rule_type}: {reason}"
                 )
-                failed_rules.append(rule.rule_type.value)
-                failure_reasons.append(reason)
+                failed_rules = (rule.rule_type.value,)
+                failure_reasons = (reason,)
                 # Short-circuit: stop on first failure
                 break
 
@@ -190,8 +293,8 @@ class VerificationEngine(IVerificationEngine):
         if not results:
             return {}
 
-        # Load rules once for all results
-        rules = self.rules_repository.get_by_tenant(tenant_id)
+        # Load rules once for all results, already filtered and ordered
+        enabled_rules = self._enabled_in_priority_order(self._load_rules(tenant_id))
 
         # Group results by test code to batch load settings
         results_by_test = {}
@@ -200,12 +303,11 @@ class VerificationEngine(IVerificationEngine):
                 results_by_test[result.test_code] = []
             results_by_test[result.test_code].append(result)
 
-        # Load settings for each unique test code
-        settings_cache = {}
-        for test_code in results_by_test.keys():
-            settings = self.settings_repository.get_by_test_code(test_code, tenant_id)
-            if settings:
-                settings_cache[test_code] = settings
+        # Load settings for all unique test codes in one lookup
+        settings_cache = self._load_settings_for_codes(list(results_by_test), tenant_id)
+
+        # Sample histories fetched for delta checks, shared by the whole batch
+        sample_history: dict[str, list] = {}
 
         # Verify each result using cached settings and rules
         decisions = {}
@@ -220,14 +322,18 @@ class VerificationEngine(IVerificationEngine):
                     )
                     decisions[result.result_id] = VerificationDecision(
                         can_auto_verify=False,
-                        failed_rules=["settings_missing"],
-                        failure_reasons=[
-                            f"No verification settings configured for test {result.test_code}"
-                        ],
+                        failed_rules=("settings_missing",),
+                        failure_reasons=(
+                            f"No verification settings configured for test {result.test_code}",
+                        ),
                     )
                 else:
-                    decisions[result.result_id] = self.verify_result(
-                        result, tenant_id, settings=settings, rules=rules
+                    if not result.test_code:
+                        raise ValueError("Result must have a test_code")
+                    if not result.result_id:
+                        raise ValueError("Result must have a result_id")
+                    decisions[result.result_id] = self._evaluate(
+                        result, tenant_id, settings, enabled_rules, sample_history
                     )
             except Exception as e:
                 logger.error(
@@ -236,8 +342,8 @@ class VerificationEngine(IVerificationEngine):
                 )
                 decisions[result.result_id] = VerificationDecision(
                     can_auto_verify=False,
-                    failed_rules=["verification_error"],
-                    failure_reasons=[f"Verification error: {str(e)}"],
+                    failed_rules=("verification_error",),
+                    failure_reasons=(f"Verification error: {str(e)}",),
                 )
 
         logger.info(
@@ -262,28 +368,18 @@ class VerificationEngine(IVerificationEngine):
             - passes_check: True if value is within range or no range is configured
             - failure_reason: None if passes, explanation if fails
         """
-        # If no range configured, pass by default
-        if (
-            settings.reference_range_low is None
-            and settings.reference_range_high is None
-        ):
-            return True, None
+        # Bounds are precomputed floats; an unset limit is open, so it never fails
+        low, high = settings.reference_bounds
 
         # Check lower bound
-        if (
-            settings.reference_range_low is not None
-            and value < settings.reference_range_low
-        ):
+        if value < low:
             return (
                 False,
                 f"Value {value} below reference range minimum {settings.reference_range_low}",
             )
 
         # Check upper bound
-        if (
-            settings.reference_range_high is not None
-            and value > settings.reference_range_high
-        ):
+        if value > high:
             return (
                 False,
                 f"Value {value} above reference range maximum {settings.reference_range_high}",
@@ -309,28 +405,18 @@ class VerificationEngine(IVerificationEngine):
             - passes_check: True if value is not in critical range or no range is configured
             - failure_reason: None if passes, explanation if fails
         """
-        # If no critical range configured, pass by default
-        if (
-            settings.critical_range_low is None
-            and settings.critical_range_high is None
-        ):
-            return True, None
+        # Bounds are precomputed floats; an unset limit is open, so it never fails
+        low, high = settings.critical_bounds
 
         # Check if value is critically low
-        if (
-            settings.critical_range_low is not None
-            and value <= settings.critical_range_low
-        ):
+        if value <= low:
             return (
                 False,
                 f"Value {value} in critical range (critically low, <= {settings.critical_range_low})",
             )
 
         # Check if value is critically high
-        if (
-            settings.critical_range_high is not None
-            and value >= settings.critical_range_high
-        ):
+        if value >= high:
             return (
                 False,
                 f"Value {value} in critical range (critically high, >= {settings.critical_range_high})",
@@ -357,21 +443,17 @@ class VerificationEngine(IVerificationEngine):
         if not lis_flags:
             return True, None
 
-        # Get list of blocked flags from settings
-        blocked_flags = settings.get_instrument_flags_to_block()
+        # Get set of blocked flags from settings (upper-cased, cached per instance)
+        blocked_flags = settings.blocked_flags
         if not blocked_flags:
             return True, None
 
-        # Parse flags from result (handle comma, semicolon, or space separated)
-        result_flags = [
-            f.strip().upper()
-            for f in lis_flags.replace(";", ",").replace(" ", ",").split(",")
-            if f.strip()
-        ]
+        # Parse flags from result (comma, semicolon, or space separated) in
+        # a single pass
+        result_flags = _FLAG_TOKEN.findall(lis_flags.upper())
 
         # Check for any blocked flags
-        blocked_flags_upper = [f.upper() for f in blocked_flags]
-        found_blocked = [f for f in result_flags if f in blocked_flags_upper]
+        found_blocked = [f for f in result_flags if f in blocked_flags]
 
         if found_blocked:
             return (
@@ -386,6 +468,7 @@ class VerificationEngine(IVerificationEngine):
         result: ResultData,
         tenant_id: str,
         settings: AutoVerificationSettings,
+        sample_history: Optional[dict[str, list]] = None,
     ) -> tuple[bool, Optional[str]]:
         """
         Check if result value changed significantly from previous result (delta check).
@@ -394,6 +477,8 @@ class VerificationEngine(IVerificationEngine):
             result: Current result data
             tenant_id: Tenant identifier for historical result lookup
             settings: Auto-verification settings containing delta thresholds
+            sample_history: Optional per-batch memo of sample_id -> results, so
+                each sample's history is fetched once per batch
 
         Returns:
             Tuple of (passes_check, failure_reason)
@@ -422,9 +507,15 @@ class VerificationEngine(IVerificationEngine):
 
         # Find previous result for the same test and sample
         try:
-            previous_results = self.result_repository.list_by_sample(
-                result.sample_id, tenant_id
-            )
+            previous_results = None
+            if sample_history is not None:
+                previous_results = sample_history.get(result.sample_id)
+            if previous_results is None:
+                previous_results = self.result_repository.list_by_sample(
+                    result.sample_id, tenant_id
+                )
+                if sample_history is not None:
+                    sample_history[result.sample_id] = previous_results
 
             # Filter to same test code, exclude current result, get most recent
             previous_results = [
@@ -499,6 +590,8 @@ class VerificationEngine(IVerificationEngine):
         result: ResultData,
         tenant_id: str,
         settings: AutoVerificationSettings,
+        numeric_value: object = _UNPARSED,
+        sample_history: Optional[dict[str, list]] = None,
     ) -> tuple[bool, Optional[str]]:
         """
         Apply a single verification rule to a result.
@@ -508,16 +601,17 @@ class VerificationEngine(IVerificationEngine):
             result: Result data to check
             tenant_id: Tenant identifier
             settings: Verification settings for the test
+            numeric_value: Result value already parsed by _parse_numeric, if available
+            sample_history: Optional per-batch memo of sample results for delta checks
 
         Returns:
             Tuple of (passes, failure_reason)
         """
         # Parse value if needed for numeric checks
-        numeric_value = None
-        if rule.rule_type in (RuleType.REFERENCE_RANGE, RuleType.CRITICAL_RANGE):
-            try:
-                numeric_value = float(result.value)
-            except (TypeError, ValueError):
+        if rule.rule_type in _NUMERIC_RULE_TYPES:
+            if numeric_value is _UNPARSED:
+                numeric_value = _parse_numeric(result.value)
+            if numeric_value is None:
                 # Non-numeric value for numeric check - cannot verify
                 return (
                     False,
@@ -535,7 +629,7 @@ class VerificationEngine(IVerificationEngine):
             return self.check_instrument_flags(result.lis_flags, settings)
 
         elif rule.rule_type == RuleType.DELTA_CHECK:
-            return self.check_delta(result, tenant_id, settings)
+            return self.check_delta(result, tenant_id, settings, sample_history)
 
         else:
             logger.warning(f"Unknown rule type: {rule.rule_type}")
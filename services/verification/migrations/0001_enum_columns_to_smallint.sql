@@ -0,0 +1,83 @@
+-- Convert review state, review decision and rule type from enum names to
+-- the SMALLINT codes SmallIntEnum stores (app/models/column_types.py).
+--
+-- Databases created before these columns switched to SmallIntEnum hold the
+-- member names ('PENDING', 'APPROVE_ALL', ...) in PostgreSQL enum types.
+-- Codes are the members' declaration order. A name without a code leaves
+-- NULL behind, which the NOT NULL and CHECK constraints below reject,
+-- rolling back the whole conversion.
+--
+-- Run once, with the service stopped, as the admin role (database_admin_url:
+-- superuser or BYPASSRLS, or row-level security hides the rows to convert):
+--   psql "$VERIFICATION_DATABASE_ADMIN_URL" -v ON_ERROR_STOP=1 \
+--        -f migrations/0001_enum_columns_to_smallint.sql
+
+BEGIN;
+
+-- reviews.state, reviews.decision
+ALTER TABLE reviews ADD COLUMN state_code SMALLINT, ADD COLUMN decision_code SMALLINT;
+UPDATE reviews SET
+    state_code = CASE state::text
+        WHEN 'PENDING' THEN 0
+        WHEN 'IN_PROGRESS' THEN 1
+        WHEN 'APPROVED' THEN 2
+        WHEN 'REJECTED' THEN 3
+        WHEN 'ESCALATED' THEN 4
+    END,
+    decision_code = CASE decision::text
+        WHEN 'APPROVE_ALL' THEN 0
+        WHEN 'REJECT_ALL' THEN 1
+        WHEN 'PARTIAL' THEN 2
+    END;
+ALTER TABLE reviews ALTER COLUMN state_code SET NOT NULL;
+-- decision is nullable, so validate its conversion with a throwaway check
+ALTER TABLE reviews ADD CONSTRAINT reviews_decision_converted
+    CHECK (decision IS NULL OR decision_code IS NOT NULL);
+ALTER TABLE reviews DROP CONSTRAINT reviews_decision_converted;
+-- Also drops ix_reviews_tenant_state and ix_reviews_tenant_state_reviewer_created
+ALTER TABLE reviews DROP COLUMN state, DROP COLUMN decision;
+ALTER TABLE reviews RENAME COLUMN state_code TO state;
+ALTER TABLE reviews RENAME COLUMN decision_code TO decision;
+CREATE INDEX ix_reviews_tenant_state ON reviews (tenant_id, state);
+CREATE INDEX ix_reviews_tenant_state_reviewer_created
+    ON reviews (tenant_id, state, reviewer_user_id, created_at);
+
+-- review_state_counters.state
+ALTER TABLE review_state_counters ADD COLUMN state_code SMALLINT;
+UPDATE review_state_counters SET state_code = CASE state::text
+    WHEN 'PENDING' THEN 0
+    WHEN 'IN_PROGRESS' THEN 1
+    WHEN 'APPROVED' THEN 2
+    WHEN 'REJECTED' THEN 3
+    WHEN 'ESCALATED' THEN 4
+END;
+ALTER TABLE review_state_counters ALTER COLUMN state_code SET NOT NULL;
+-- Also drops the (tenant_id, state) primary key
+ALTER TABLE review_state_counters DROP COLUMN state;
+ALTER TABLE review_state_counters RENAME COLUMN state_code TO state;
+ALTER TABLE review_state_counters ADD PRIMARY KEY (tenant_id, state);
+
+-- verification_rules.rule_type
+ALTER TABLE verification_rules ADD COLUMN rule_type_code SMALLINT;
+UPDATE verification_rules SET rule_type_code = CASE rule_type::text
+    WHEN 'REFERENCE_RANGE' THEN 0
+    WHEN 'CRITICAL_RANGE' THEN 1
+    WHEN 'INSTRUMENT_FLAG' THEN 2
+    WHEN 'DELTA_CHECK' THEN 3
+END;
+ALTER TABLE verification_rules ALTER COLUMN rule_type_code SET NOT NULL;
+-- Also drops ix_rules_tenant_type
+ALTER TABLE verification_rules DROP COLUMN rule_type;
+ALTER TABLE verification_rules RENAME COLUMN rule_type_code TO rule_type;
+CREATE UNIQUE INDEX ix_rules_tenant_type ON verification_rules (tenant_id, rule_type);
+
+-- Enum types SQLAlchemy created for the old columns
+DROP TYPE IF EXISTS reviewstate;
+DROP TYPE IF EXISTS reviewdecision;
+DROP TYPE IF EXISTS ruletype;
+
+COMMIT;
+
+ANALYZE reviews;
+ANALYZE review_state_counters;
+ANALYZE verification_rules;
@@ -0,0 +1,33 @@
+-- Add reviews.pending_results_count, the number of a review's results still
+-- awaiting a decision, and backfill it for reviews that are still open.
+--
+-- Without the backfill every existing review starts at zero, so its first
+-- per-result decision runs a completion check straight away. The backfill
+-- counts the sample's NEEDS_REVIEW results in the LIS results table, which
+-- must be reachable from this database; where it is not, skip the UPDATE:
+-- the stalled review sweep (review_completion_sweep_interval_seconds)
+-- recounts every open review's results and resyncs the counter.
+--
+-- Run once, after 0001, as the admin role (database_admin_url):
+--   psql "$VERIFICATION_DATABASE_ADMIN_URL" -v ON_ERROR_STOP=1 \
+--        -f migrations/0002_review_pending_results_count.sql
+
+BEGIN;
+
+ALTER TABLE reviews ADD COLUMN IF NOT EXISTS pending_results_count INTEGER NOT NULL DEFAULT 0;
+
+-- Open reviews only: PENDING (0), IN_PROGRESS (1), ESCALATED (4)
+UPDATE reviews SET pending_results_count = pending.n
+FROM (
+    SELECT tenant_id, sample_id, count(*) AS n
+    FROM results
+    WHERE verification_status::text = 'NEEDS_REVIEW'
+    GROUP BY tenant_id, sample_id
+) AS pending
+WHERE reviews.tenant_id = pending.tenant_id
+  AND reviews.sample_id = pending.sample_id
+  AND reviews.state IN (0, 1, 4);
+
+COMMIT;
+
+ANALYZE reviews;
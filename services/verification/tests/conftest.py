@@ -42,6 +42,18 @@ from app.services import (
 # SQLModel Metadata Management (fixes parametrized fixture reuse)
 # ============================================================================
 
+# Tables whose unique indexes are ON CONFLICT targets for the adapters; the
+# database rejects the statements if the index is missing
+_CONFLICT_TARGET_TABLES = {"auto_verification_settings"}
+
+
+def _clear_sqlmodel_metadata():
+    for table in list(SQLModel.metadata.tables.values()):
+        table.constraints.clear()
+        if table.name not in _CONFLICT_TARGET_TABLES:
+            table.indexes.clear()
+
+
 @pytest.fixture(autouse=True)
 def _refresh_sqlmodel_metadata():
     """
@@ -50,15 +62,11 @@ def _refresh_sqlmodel_metadata():
     This prevents "already exists" errors when parametrized fixtures reuse
     the same database engine across multiple test runs.
     """
-    for table in list(SQLModel.metadata.tables.values()):
-        table.constraints.clear()
-        table.indexes.clear()
+    _clear_sqlmodel_metadata()
 
     yield
 
-    for table in list(SQLModel.metadata.tables.values()):
-        table.constraints.clear()
-        table.indexes.clear()
+    _clear_sqlmodel_metadata()
 
 
 # ============================================================================
@@ -173,7 +181,7 @@ def sample_settings():
         reference_range_high=100.0,
         critical_range_low=40.0,
         critical_range_high=400.0,
-        instrument_flags_to_block='["C"]',
+        instrument_flags_to_block=["C"],
         delta_check_threshold_percent=10.0,
         delta_check_lookback_days=30,
     )
@@ -0,0 +1,89 @@
+"""Integration tests for tenant row-level security on PostgreSQL.
+
+Set TEST_DATABASE_URL to a scratch PostgreSQL database, connecting as a
+superuser, to run them; they are skipped otherwise.
+"""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import ProgrammingError
+from sqlmodel import Session, SQLModel, select
+
+from app.adapters import bind_session_tenant, enable_row_level_security
+from app.adapters.tenant_isolation import TENANT_TABLES
+from app.models import Review, ReviewState
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not (TEST_DATABASE_URL or "").startswith("postgresql"),
+    reason="TEST_DATABASE_URL does not point at PostgreSQL",
+)
+
+# Created and dropped inside each test's transaction
+APP_ROLE = "verification_rls_test_owner"
+
+
+@pytest.fixture
+def owner_connection():
+    """
+    Connection acting as a non-superuser role that owns the tenant tables.
+
+    Everything, including the role, is rolled back at the end of the test.
+    """
+    engine = create_engine(TEST_DATABASE_URL)
+    SQLModel.metadata.create_all(engine)
+    enable_row_level_security(engine)
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    connection.execute(text(f"CREATE ROLE {APP_ROLE}"))
+    for table in TENANT_TABLES:
+        connection.execute(text(f"ALTER TABLE {table} OWNER TO {APP_ROLE}"))
+    connection.execute(text(f"SET LOCAL ROLE {APP_ROLE}"))
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+class TestRowLevelSecurity:
+    """Tests that the tenant_isolation policies hold for the table owner."""
+
+    def test_owner_cannot_read_another_tenants_rows(self, owner_connection):
+        """Test that a session bound to one tenant never sees another tenant's reviews."""
+        session = Session(bind=owner_connection)
+        bind_session_tenant(session, "tenant-a")
+        review = Review(
+            id=str(uuid.uuid4()),
+            tenant_id="tenant-a",
+            sample_id=str(uuid.uuid4()),
+            state=ReviewState.PENDING,
+        )
+        session.add(review)
+        session.flush()
+
+        bind_session_tenant(session, "tenant-b")
+        assert session.exec(select(Review.id)).all() == []
+
+        bind_session_tenant(session, "tenant-a")
+        assert session.exec(select(Review.id)).all() == [review.id]
+
+    def test_owner_cannot_write_rows_for_another_tenant(self, owner_connection):
+        """Test that inserting a review for a tenant other than the session's is refused."""
+        session = Session(bind=owner_connection)
+        bind_session_tenant(session, "tenant-b")
+        session.add(Review(
+            id=str(uuid.uuid4()),
+            tenant_id="tenant-a",
+            sample_id=str(uuid.uuid4()),
+            state=ReviewState.PENDING,
+        ))
+
+        with pytest.raises(ProgrammingError, match="row-level security"):
+            session.flush()
@@ -28,7 +28,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=100.0,
             critical_range_low=40.0,
             critical_range_high=400.0,
-            instrument_flags_to_block='["C"]',
+            instrument_flags_to_block=["C"],
             delta_check_threshold_percent=10.0,
             delta_check_lookback_days=30,
         )
@@ -52,7 +52,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=100.0,
             critical_range_low=40.0,
             critical_range_high=400.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=10.0,
             delta_check_lookback_days=30,
         )
@@ -67,7 +67,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=105.0,
             critical_range_low=45.0,
             critical_range_high=405.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=12.0,
             delta_check_lookback_days=35,
         )
@@ -76,6 +76,38 @@ class TestAutoVerificationSettingsRepository:
         with pytest.raises(Exception):  # Could be IntegrityError or ValueError
             repo.create(settings2)
 
+    def test_create_if_absent(self, auto_verification_settings_repository):
+        """Test conditional creation returns None when the test code already has settings."""
+        repo = auto_verification_settings_repository
+
+        created = repo.create_if_absent(AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID,
+            test_code=TEST_TEST_CODE,
+            test_name=TEST_TEST_NAME,
+            reference_range_low=70.0,
+            instrument_flags_to_block=["H"],
+        ))
+
+        assert created is not None
+        assert created.id is not None
+        assert created.created_at is not None
+        assert created.instrument_flags_to_block == ["H"]
+
+        duplicate = repo.create_if_absent(AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID,
+            test_code=TEST_TEST_CODE,
+            test_name="Glucose 2",
+        ))
+
+        assert duplicate is None
+        stored = repo.get_by_test_code(TEST_TEST_CODE, TEST_TENANT_ID)
+        assert stored.test_name == TEST_TEST_NAME
+        assert repo.create_if_absent(AutoVerificationSettings(
+            tenant_id="other-tenant",
+            test_code=TEST_TEST_CODE,
+            test_name=TEST_TEST_NAME,
+        )) is not None
+
     def test_get_by_id(self, auto_verification_settings_repository):
         """Test retrieving settings by ID."""
         repo = auto_verification_settings_repository
@@ -88,7 +120,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=11.0,
             critical_range_low=2.0,
             critical_range_high=30.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=15.0,
             delta_check_lookback_days=45,
         )
@@ -112,7 +144,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=16.0,
             critical_range_low=7.0,
             critical_range_high=20.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=8.0,
             delta_check_lookback_days=30,
         )
@@ -135,7 +167,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=400.0,
             critical_range_low=50.0,
             critical_range_high=1000.0,
-            instrument_flags_to_block='["H", "L"]',
+            instrument_flags_to_block=["H", "L"],
             delta_check_threshold_percent=20.0,
             delta_check_lookback_days=60,
         )
@@ -146,6 +178,10 @@ class TestAutoVerificationSettingsRepository:
         assert retrieved is not None
         assert retrieved.test_code == "PLT"
         assert retrieved.test_name == "Platelets"
+        assert retrieved.instrument_flags_to_block == ["H", "L"]
+        assert retrieved.blocked_flags == frozenset({"H", "L"})
+        assert retrieved.reference_bounds == (150.0, 400.0)
+        assert retrieved.critical_bounds == (50.0, 1000.0)
 
     def test_get_by_test_code_nonexistent(self, auto_verification_settings_repository):
         """Test retrieving nonexistent test code returns None."""
@@ -155,6 +191,24 @@ class TestAutoVerificationSettingsRepository:
 
         assert retrieved is None
 
+    def test_get_by_test_codes(self, auto_verification_settings_repository):
+        """Test retrieving settings for several test codes at once."""
+        repo = auto_verification_settings_repository
+        for tenant_id, test_code in [
+            (TEST_TENANT_ID, "WBC"),
+            (TEST_TENANT_ID, "GLU"),
+            (TEST_TENANT_ID, "PLT"),
+            ("other-tenant", "HGB"),
+        ]:
+            repo.create(AutoVerificationSettings(
+                tenant_id=tenant_id, test_code=test_code, test_name=test_code
+            ))
+
+        retrieved = repo.get_by_test_codes(["WBC", "HGB", "GLU", "MISSING", "GLU"], TEST_TENANT_ID)
+
+        assert [s.test_code for s in retrieved] == ["GLU", "WBC"]
+        assert repo.get_by_test_codes([], TEST_TENANT_ID) == []
+
     def test_update_settings(self, auto_verification_settings_repository):
         """Test updating verification settings."""
         repo = auto_verification_settings_repository
@@ -167,7 +221,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=145.0,
             critical_range_low=120.0,
             critical_range_high=160.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=5.0,
             delta_check_lookback_days=30,
         )
@@ -196,7 +250,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=5.0,
             critical_range_low=2.5,
             critical_range_high=6.5,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=15.0,
             delta_check_lookback_days=30,
         )
@@ -207,6 +261,48 @@ class TestAutoVerificationSettingsRepository:
         retrieved = repo.get_by_id(created.id, TEST_TENANT_ID)
         assert retrieved is None
 
+    def test_update_by_test_code(self, auto_verification_settings_repository):
+        """Test a partial update by test code keeps the fields not in the patch."""
+        repo = auto_verification_settings_repository
+        created = repo.create(AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID,
+            test_code="NA",
+            test_name="Sodium",
+            reference_range_low=135.0,
+            reference_range_high=145.0,
+            instrument_flags_to_block=["H"],
+        ))
+
+        updated = repo.update_by_test_code("NA", TEST_TENANT_ID, {
+            "reference_range_high": 148.0,
+            "instrument_flags_to_block": ["H", "L"],
+        })
+
+        assert updated.id == created.id
+        assert updated.test_name == "Sodium"
+        assert updated.reference_range_low == 135.0
+        assert updated.reference_range_high == 148.0
+        assert updated.instrument_flags_to_block == ["H", "L"]
+        assert repo.get_by_test_code("NA", TEST_TENANT_ID).reference_range_high == 148.0
+        assert repo.update_by_test_code("NA", "other-tenant", {"test_name": "X"}) is None
+
+    def test_delete_by_test_code(self, auto_verification_settings_repository):
+        """Test deleting settings by test code only affects the given tenant."""
+        repo = auto_verification_settings_repository
+        for tenant_id in (TEST_TENANT_ID, "other-tenant"):
+            repo.create(AutoVerificationSettings(
+                tenant_id=tenant_id,
+                test_code="K",
+                test_name="Potassium",
+                instrument_flags_to_block=[],
+            ))
+
+        assert repo.delete_by_test_code("K", TEST_TENANT_ID) is True
+        assert repo.delete_by_test_code("K", TEST_TENANT_ID) is False
+
+        assert repo.get_by_test_code("K", TEST_TENANT_ID) is None
+        assert repo.get_by_test_code("K", "other-tenant") is not None
+
     def test_list_all_by_tenant(self, auto_verification_settings_repository):
         """Test listing all settings for a tenant."""
         repo = auto_verification_settings_repository
@@ -222,7 +318,7 @@ class TestAutoVerificationSettingsRepository:
                 reference_range_high=100.0,
                 critical_range_low=40.0,
                 critical_range_high=400.0,
-                instrument_flags_to_block='[]',
+                instrument_flags_to_block=[],
                 delta_check_threshold_percent=10.0,
                 delta_check_lookback_days=30,
             ),
@@ -235,7 +331,7 @@ class TestAutoVerificationSettingsRepository:
                 reference_range_high=11.0,
                 critical_range_low=2.0,
                 critical_range_high=30.0,
-                instrument_flags_to_block='[]',
+                instrument_flags_to_block=[],
                 delta_check_threshold_percent=15.0,
                 delta_check_lookback_days=45,
             ),
@@ -251,6 +347,100 @@ class TestAutoVerificationSettingsRepository:
         test_codes = {s.test_code for s in all_settings}
         assert test_codes == {"GLU", "WBC"}
 
+    def test_list_all_pagination(self, auto_verification_settings_repository):
+        """Test paginated listing returns sorted pages and the tenant total."""
+        repo = auto_verification_settings_repository
+
+        for test_code in ["WBC", "GLU", "HGB"]:
+            repo.create(AutoVerificationSettings(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                test_code=test_code,
+                test_name=test_code,
+                instrument_flags_to_block=[],
+            ))
+        repo.create(AutoVerificationSettings(
+            id=str(uuid.uuid4()),
+            tenant_id="other-tenant",
+            test_code="GLU",
+            test_name="Glucose",
+            instrument_flags_to_block=[],
+        ))
+
+        page1, total1 = repo.list_all(TEST_TENANT_ID, skip=0, limit=2)
+        assert [s.test_code for s in page1] == ["GLU", "HGB"]
+        assert total1 == 3
+
+        page2, total2 = repo.list_all(TEST_TENANT_ID, skip=2, limit=2)
+        assert [s.test_code for s in page2] == ["WBC"]
+        assert total2 == 3
+
+        page3, total3 = repo.list_all(TEST_TENANT_ID, skip=4, limit=2)
+        assert page3 == []
+        assert total3 == 3
+
+        empty, empty_total = repo.list_all("unknown-tenant")
+        assert empty == []
+        assert empty_total == 0
+
+    def test_list_all_projected_matches_list_all(self, auto_verification_settings_repository):
+        """Test that projected rows hold the same values as the listed entities."""
+        repo = auto_verification_settings_repository
+        repo.create_many([
+            AutoVerificationSettings(tenant_id=TEST_TENANT_ID, test_code=code, test_name=code,
+                                     instrument_flags_to_block=["H"])
+            for code in ("WBC", "GLU", "HGB")
+        ])
+
+        rows, total = repo.list_all_projected(TEST_TENANT_ID, skip=1, limit=5)
+        settings, _ = repo.list_all(TEST_TENANT_ID, skip=1, limit=5)
+
+        assert total == 3
+        assert rows == [s.model_dump() for s in settings]
+        assert rows[0]["id"] == settings[0].id
+        assert rows[0]["test_code"] == "HGB"
+        assert rows[0]["instrument_flags_to_block"] == ["H"]
+        assert "total" not in rows[0]
+        assert repo.list_all_projected(TEST_TENANT_ID, skip=5) == ([], 3)
+
+    def test_create_many_skips_existing_test_codes(self, auto_verification_settings_repository):
+        """Test batch creation skips test codes that already exist or repeat."""
+        repo = auto_verification_settings_repository
+
+        repo.create(AutoVerificationSettings(
+            id=str(uuid.uuid4()),
+            tenant_id=TEST_TENANT_ID,
+            test_code="GLU",
+            test_name="Glucose",
+            instrument_flags_to_block=[],
+        ))
+
+        created = repo.create_many([
+            AutoVerificationSettings(tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"),
+            AutoVerificationSettings(tenant_id=TEST_TENANT_ID, test_code="WBC", test_name="White Blood Count"),
+            AutoVerificationSettings(tenant_id=TEST_TENANT_ID, test_code="WBC", test_name="Duplicate"),
+            AutoVerificationSettings(tenant_id="other-tenant", test_code="GLU", test_name="Glucose"),
+        ])
+
+        assert [(s.tenant_id, s.test_code) for s in created] == [
+            (TEST_TENANT_ID, "WBC"),
+            ("other-tenant", "GLU"),
+        ]
+        assert all(s.id for s in created)
+        assert all(s.created_at is not None and s.updated_at is not None for s in created)
+
+        wbc = repo.get_by_test_code("WBC", TEST_TENANT_ID)
+        assert wbc is not None
+        assert wbc.test_name == "White Blood Count"
+        assert len(repo.get_by_tenant(TEST_TENANT_ID)) == 2
+        assert repo.get_by_test_code("GLU", "other-tenant") is not None
+
+    def test_create_many_empty_batch(self, auto_verification_settings_repository):
+        """Test batch creation with no entries creates nothing."""
+        repo = auto_verification_settings_repository
+
+        assert repo.create_many([]) == []
+
     def test_tenant_isolation_in_list(self, auto_verification_settings_repository):
         """Test that list operations are isolated per tenant."""
         repo = auto_verification_settings_repository
@@ -267,7 +457,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=100.0,
             critical_range_low=40.0,
             critical_range_high=400.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=10.0,
             delta_check_lookback_days=30,
         )
@@ -280,7 +470,7 @@ class TestAutoVerificationSettingsRepository:
             reference_range_high=11.0,
             critical_range_low=2.0,
             critical_range_high=30.0,
-            instrument_flags_to_block='[]',
+            instrument_flags_to_block=[],
             delta_check_threshold_percent=15.0,
             delta_check_lookback_days=45,
         )
@@ -35,6 +35,40 @@ class TestResultDecisionRepository:
         assert created.tenant_id == TEST_TENANT_ID
         assert created.decision == "approved"
 
+    def test_create_many(self, result_decision_repository):
+        """Test creating several result decisions at once."""
+        repo = result_decision_repository
+        review_id = str(uuid.uuid4())
+        decisions = [
+            ResultDecision(
+                tenant_id=TEST_TENANT_ID,
+                review_id=review_id,
+                result_id=str(uuid.uuid4()),
+                decision=decision,
+            )
+            for decision in ["approved", "rejected", "approved"]
+        ]
+
+        created = repo.create_many(decisions, TEST_TENANT_ID)
+
+        assert [d.result_id for d in created] == [d.result_id for d in decisions]
+        assert all(d.id and d.decided_at for d in created)
+        assert len(repo.get_by_review(review_id, TEST_TENANT_ID)) == 3
+        assert repo.create_many([], TEST_TENANT_ID) == []
+
+    def test_create_many_rejects_other_tenant(self, result_decision_repository):
+        """Test that a batch containing another tenant's decision is refused."""
+        repo = result_decision_repository
+        decision = ResultDecision(
+            tenant_id="other-tenant",
+            review_id=str(uuid.uuid4()),
+            result_id=str(uuid.uuid4()),
+            decision="approved",
+        )
+
+        with pytest.raises(ValueError):
+            repo.create_many([decision], TEST_TENANT_ID)
+
     def test_get_by_id(self, result_decision_repository):
         """Test retrieving result decision by ID."""
         repo = result_decision_repository
@@ -76,6 +110,28 @@ class TestResultDecisionRepository:
 
         assert retrieved is None
 
+    def test_get_by_ids(self, result_decision_repository):
+        """Test retrieving several decisions at once, in request order and tenant-isolated."""
+        repo = result_decision_repository
+        review_id = str(uuid.uuid4())
+
+        created = [
+            repo.create(ResultDecision(
+                id=str(uuid.uuid4()),
+                tenant_id=tenant_id,
+                review_id=review_id,
+                result_id=str(uuid.uuid4()),
+                decision="approved",
+            ))
+            for tenant_id in (TEST_TENANT_ID, TEST_TENANT_ID, "other-tenant")
+        ]
+        ids = [created[1].id, "missing-id", created[2].id, created[0].id]
+
+        retrieved = repo.get_by_ids(ids, TEST_TENANT_ID)
+
+        assert [d.id for d in retrieved] == [created[1].id, created[0].id]
+        assert repo.get_by_ids([], TEST_TENANT_ID) == []
+
     def test_get_by_review(self, result_decision_repository):
         """Test retrieving all decisions for a review."""
         repo = result_decision_repository
@@ -117,6 +173,30 @@ class TestResultDecisionRepository:
 
         assert len(decisions) == 0
 
+    def test_count_by_review_grouped(self, result_decision_repository):
+        """Test counting a review's decisions by decision value."""
+        repo = result_decision_repository
+        review_id = str(uuid.uuid4())
+        repo.create_many(
+            [
+                ResultDecision(
+                    tenant_id=TEST_TENANT_ID,
+                    review_id=review_id,
+                    result_id=str(uuid.uuid4()),
+                    decision=decision,
+                )
+                for decision in ["approved", "rejected", "approved"]
+            ],
+            TEST_TENANT_ID,
+        )
+
+        assert repo.count_by_review_grouped(review_id, TEST_TENANT_ID) == {
+            "approved": 2,
+            "rejected": 1,
+        }
+        assert repo.count_by_review_grouped(review_id, "other-tenant") == {}
+        assert repo.count_by_review_grouped(str(uuid.uuid4()), TEST_TENANT_ID) == {}
+
     def test_list_by_review_pagination(self, result_decision_repository):
         """Test paginated listing of decisions for a review."""
         repo = result_decision_repository
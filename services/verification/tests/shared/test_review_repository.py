@@ -116,6 +116,109 @@ class TestReviewRepository:
         assert updated.state == ReviewState.IN_PROGRESS
         assert updated.reviewer_user_id == "user-123"
 
+    def test_update_if_state_applies_once(self, review_repository):
+        """Test that a conditional update is refused once the state has moved on."""
+        repo = review_repository
+        created = repo.create(Review(
+            id=str(uuid.uuid4()),
+            tenant_id=TEST_TENANT_ID,
+            sample_id=str(uuid.uuid4()),
+            state=ReviewState.PENDING,
+        ))
+
+        created.state = ReviewState.APPROVED
+        updated = repo.update_if_state(created, ReviewState.PENDING)
+        assert updated.state == ReviewState.APPROVED
+
+        updated.state = ReviewState.REJECTED
+        assert repo.update_if_state(updated, ReviewState.PENDING) is None
+
+        assert repo.get_by_id(created.id, TEST_TENANT_ID).state == ReviewState.APPROVED
+        assert repo.list_by_tenant(TEST_TENANT_ID, state=ReviewState.APPROVED)[1] == 1
+        assert repo.list_by_tenant(TEST_TENANT_ID, state=ReviewState.PENDING)[1] == 0
+
+    def test_decrement_pending_results(self, review_repository):
+        """Test that the pending results counter counts down to zero and stops."""
+        repo = review_repository
+        created = repo.create(Review(
+            id=str(uuid.uuid4()),
+            tenant_id=TEST_TENANT_ID,
+            sample_id=str(uuid.uuid4()),
+            pending_results_count=2,
+        ))
+
+        assert repo.decrement_pending_results(created.id, TEST_TENANT_ID) == 1
+        assert repo.decrement_pending_results(created.id, TEST_TENANT_ID) == 0
+        assert repo.decrement_pending_results(created.id, TEST_TENANT_ID) == 0
+        assert repo.get_by_id(created.id, TEST_TENANT_ID).pending_results_count == 0
+        assert repo.decrement_pending_results(created.id, "other-tenant") is None
+
+    def test_set_pending_results(self, review_repository):
+        """Test that the pending results counter can be overwritten within the tenant."""
+        repo = review_repository
+        created = repo.create(Review(
+            id=str(uuid.uuid4()),
+            tenant_id=TEST_TENANT_ID,
+            sample_id=str(uuid.uuid4()),
+        ))
+
+        assert repo.set_pending_results(created.id, TEST_TENANT_ID, 4) is True
+        assert repo.set_pending_results(created.id, "other-tenant", 1) is False
+        assert repo.get_by_id(created.id, TEST_TENANT_ID).pending_results_count == 4
+
+    def test_list_awaiting_decisions_across_tenants(self, review_repository):
+        """Test that open, unescalated reviews of every tenant are listed by ID in pages."""
+        repo = review_repository
+        expected = []
+        for tenant_id, state in (
+            (TEST_TENANT_ID, ReviewState.PENDING),
+            ("other-tenant", ReviewState.IN_PROGRESS),
+            (TEST_TENANT_ID, ReviewState.ESCALATED),
+            (TEST_TENANT_ID, ReviewState.APPROVED),
+            ("other-tenant", ReviewState.PENDING),
+        ):
+            review = repo.create(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=tenant_id,
+                sample_id=str(uuid.uuid4()),
+                state=state,
+            ))
+            if state in (ReviewState.PENDING, ReviewState.IN_PROGRESS):
+                expected.append(review.id)
+        expected.sort()
+
+        first_page = repo.list_awaiting_decisions(limit=2)
+        rest = repo.list_awaiting_decisions(after_id=first_page[-1].id, limit=2)
+
+        assert [r.id for r in first_page + rest] == expected
+
+    def test_state_totals_follow_state_transitions(self, review_repository):
+        """Test that per-state totals stay correct as reviews change state."""
+        repo = review_repository
+        reviews = [
+            repo.create(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                sample_id=str(uuid.uuid4()),
+                state=ReviewState.PENDING,
+            ))
+            for _ in range(3)
+        ]
+
+        reviews[0].state = ReviewState.IN_PROGRESS
+        repo.update(reviews[0])
+        reviews[0].state = ReviewState.APPROVED
+        repo.update(reviews[0])
+        reviews[1].state = ReviewState.IN_PROGRESS
+        repo.update(reviews[1])
+
+        assert repo.list_by_tenant(TEST_TENANT_ID)[1] == 3
+        assert repo.list_by_tenant(TEST_TENANT_ID, state=ReviewState.PENDING)[1] == 1
+        assert repo.list_by_tenant(TEST_TENANT_ID, state=ReviewState.IN_PROGRESS)[1] == 1
+        assert repo.list_by_tenant(TEST_TENANT_ID, state=ReviewState.APPROVED)[1] == 1
+        assert repo.search(TEST_TENANT_ID, state=ReviewState.APPROVED)[1] == 1
+        assert repo.list_by_tenant("other-tenant")[1] == 0
+
     def test_list_by_tenant_with_state_filter(self, review_repository):
         """Test listing reviews by state filter."""
         repo = review_repository
@@ -206,6 +309,37 @@ class TestReviewRepository:
         assert reviewer_reviews[0].reviewer_user_id == reviewer_id
         assert count == 1
 
+    def test_list_by_tenant_with_date_range_filter(self, review_repository):
+        """Test listing reviews created within a date range, combined with a state filter."""
+        repo = review_repository
+        now = datetime.utcnow()
+
+        for days_ago, state in [(10, ReviewState.PENDING), (5, ReviewState.PENDING),
+                                (5, ReviewState.ESCALATED), (1, ReviewState.PENDING)]:
+            repo.create(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                sample_id=str(uuid.uuid4()),
+                state=state,
+                created_at=now - timedelta(days=days_ago),
+            ))
+
+        in_range, count = repo.list_by_tenant(
+            TEST_TENANT_ID,
+            start_date=now - timedelta(days=7),
+            end_date=now - timedelta(days=2),
+        )
+        assert len(in_range) == 2
+        assert count == 2
+
+        pending_in_range, count = repo.list_by_tenant(
+            TEST_TENANT_ID,
+            state=ReviewState.PENDING,
+            start_date=now - timedelta(days=7),
+        )
+        assert len(pending_in_range) == 2
+        assert count == 2
+
     def test_list_by_tenant_pagination(self, review_repository):
         """Test pagination when listing reviews."""
         repo = review_repository
@@ -238,6 +372,50 @@ class TestReviewRepository:
         assert len(page3) == 1
         assert count3 == 5
 
+    def test_list_reviews_total_is_optional(self, review_repository):
+        """Test that filtered pages carry the total, and that it can be skipped."""
+        repo = review_repository
+
+        for _ in range(3):
+            repo.create(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                sample_id=str(uuid.uuid4()),
+                reviewer_user_id="reviewer-1",
+                state=ReviewState.PENDING,
+            ))
+
+        page, count = repo.list_by_tenant(TEST_TENANT_ID, reviewer_user_id="reviewer-1", limit=2)
+        assert len(page) == 2
+        assert count == 3
+
+        page, count = repo.list_by_tenant(TEST_TENANT_ID, reviewer_user_id="reviewer-1", skip=5)
+        assert page == []
+        assert count == 3
+
+        page, count = repo.list_by_tenant(TEST_TENANT_ID, limit=2, include_total=False)
+        assert len(page) == 2
+        assert count is None
+
+    def test_count_by_tenant(self, review_repository):
+        """Test counting reviews with the same filters as listing them."""
+        repo = review_repository
+
+        for reviewer in ("reviewer-1", "reviewer-1", None):
+            repo.create(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                sample_id=str(uuid.uuid4()),
+                reviewer_user_id=reviewer,
+                state=ReviewState.PENDING,
+            ))
+
+        assert repo.count_by_tenant(TEST_TENANT_ID) == 3
+        assert repo.count_by_tenant(TEST_TENANT_ID, state=ReviewState.PENDING) == 3
+        assert repo.count_by_tenant(TEST_TENANT_ID, reviewer_user_id="reviewer-1") == 2
+        assert repo.count_by_tenant(TEST_TENANT_ID, state=ReviewState.APPROVED) == 0
+        assert repo.count_by_tenant("other-tenant") == 0
+
     def test_search_reviews_by_sample_id(self, review_repository):
         """Test searching reviews by sample ID."""
         repo = review_repository
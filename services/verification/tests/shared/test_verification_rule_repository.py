@@ -81,6 +81,45 @@ class TestVerificationRuleRepository:
         priorities = [r.priority for r in rules]
         assert priorities == sorted(priorities)
 
+    def test_create_many(self, verification_rule_repository):
+        """Test creating several rules in one call, returned in input order."""
+        repo = verification_rule_repository
+        rules = [
+            VerificationRule(tenant_id=TEST_TENANT_ID, rule_type=rule_type, priority=priority)
+            for priority, rule_type in enumerate([RuleType.DELTA_CHECK, RuleType.REFERENCE_RANGE])
+        ]
+
+        created = repo.create_many(rules, TEST_TENANT_ID)
+
+        assert [r.rule_type for r in created] == [RuleType.DELTA_CHECK, RuleType.REFERENCE_RANGE]
+        assert all(r.id and r.created_at for r in created)
+        assert [r.rule_type for r in repo.get_by_tenant(TEST_TENANT_ID)] == [
+            RuleType.DELTA_CHECK, RuleType.REFERENCE_RANGE
+        ]
+        with pytest.raises(ValueError):
+            repo.create_many(
+                [VerificationRule(tenant_id="other-tenant", rule_type=RuleType.DELTA_CHECK)],
+                TEST_TENANT_ID,
+            )
+
+    def test_get_by_tenant_and_type(self, verification_rule_repository):
+        """Test retrieving a single rule by tenant and rule type."""
+        repo = verification_rule_repository
+        for tenant_id in (TEST_TENANT_ID, "other-tenant"):
+            repo.create(VerificationRule(
+                id=str(uuid.uuid4()),
+                tenant_id=tenant_id,
+                rule_type=RuleType.DELTA_CHECK,
+                enabled=tenant_id == TEST_TENANT_ID,
+                priority=4,
+            ))
+
+        rule = repo.get_by_tenant_and_type(TEST_TENANT_ID, RuleType.DELTA_CHECK)
+
+        assert rule.tenant_id == TEST_TENANT_ID
+        assert rule.enabled is True
+        assert repo.get_by_tenant_and_type(TEST_TENANT_ID, RuleType.CRITICAL_RANGE) is None
+
     def test_update_rule_enabled_status(self, verification_rule_repository):
         """Test enabling/disabling a rule."""
         repo = verification_rule_repository
@@ -215,6 +254,11 @@ class TestVerificationRuleRepository:
         assert len(page3) == 1
         assert count3 == 5
 
+        # Page past the end still reports the total
+        page4, count4 = repo.list_all(TEST_TENANT_ID, skip=6, limit=2)
+        assert page4 == []
+        assert count4 == 5
+
     def test_tenant_isolation(self, verification_rule_repository):
         """Test that rules are isolated per tenant."""
         repo = verification_rule_repository
@@ -0,0 +1,87 @@
+"""Unit tests for the in-process TTL cache."""
+
+import time
+from datetime import datetime, timezone
+
+from app.cache import TTLCache, etag_matches, make_etag
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+class TestTTLCache:
+    """Tests for TTLCache expiry, eviction and tenant invalidation."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned until it expires."""
+        cache = TTLCache(ttl=60)
+        cache.set((TEST_TENANT_ID,), "rules")
+
+        assert cache.get((TEST_TENANT_ID,)) == "rules"
+        assert cache.get(("other-tenant",)) is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_expired_entry_is_dropped(self):
+        """Test that entries past their TTL are treated as missing."""
+        cache = TTLCache(ttl=0.01)
+        cache.set((TEST_TENANT_ID,), "rules")
+
+        time.sleep(0.02)
+
+        assert cache.get((TEST_TENANT_ID,)) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the oldest unused entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set((TEST_TENANT_ID, "GLU"), 1)
+        cache.set((TEST_TENANT_ID, "WBC"), 2)
+        cache.get((TEST_TENANT_ID, "GLU"))
+        cache.set((TEST_TENANT_ID, "HGB"), 3)
+
+        assert cache.get((TEST_TENANT_ID, "GLU")) == 1
+        assert cache.get((TEST_TENANT_ID, "WBC")) is None
+        assert cache.get((TEST_TENANT_ID, "HGB")) == 3
+
+    def test_invalidate_tenant_only_drops_that_tenant(self):
+        """Test that tenant invalidation leaves other tenants' entries intact."""
+        cache = TTLCache(ttl=60)
+        cache.set((TEST_TENANT_ID, 0, 100), "page")
+        cache.set((TEST_TENANT_ID, "GLU"), "settings")
+        cache.set(("other-tenant", "GLU"), "other")
+
+        cache.invalidate_tenant(TEST_TENANT_ID)
+
+        assert cache.get((TEST_TENANT_ID, 0, 100)) is None
+        assert cache.get((TEST_TENANT_ID, "GLU")) is None
+        assert cache.get(("other-tenant", "GLU")) == "other"
+
+
+class TestETag:
+    """Tests for list response ETag helpers."""
+
+    def test_etag_changes_with_newest_update_and_total(self):
+        """Test that edits and deletes both produce a new ETag."""
+        base = make_etag(["2024-01-01T00:00:00", "2024-01-02T00:00:00"], 2)
+
+        assert make_etag(["2024-01-02T00:00:00", "2024-01-01T00:00:00"], 2) == base
+        assert make_etag(["2024-01-01T00:00:00", "2024-01-03T00:00:00"], 2) != base
+        assert make_etag(["2024-01-02T00:00:00"], 1) != base
+
+    def test_etag_accepts_datetimes(self):
+        """Test that updated_at datetimes are compared and tagged like ISO strings."""
+        older = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        newer = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        assert make_etag([newer, older], 2) == make_etag([older, newer], 2)
+        assert make_etag([older], 1) != make_etag([newer], 1)
+
+    def test_etag_matches_if_none_match_header(self):
+        """Test If-None-Match parsing including lists, weak tags and wildcard."""
+        etag = make_etag([], 0)
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
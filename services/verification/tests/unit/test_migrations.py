@@ -0,0 +1,33 @@
+"""Unit tests for the SQL migration scripts."""
+
+import re
+from pathlib import Path
+
+from app.models import ReviewDecision, ReviewState, RuleType
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+
+def _case_codes(script: str, column: str) -> list[dict[str, int]]:
+    """The name-to-code mapping of every CASE over the column in the script."""
+    blocks = re.findall(rf"CASE {column}::text(.*?)\bEND\b", script, re.DOTALL)
+    return [
+        {name: int(code) for name, code in re.findall(r"WHEN '(\w+)' THEN (\d+)", block)}
+        for block in blocks
+    ]
+
+
+class TestEnumColumnsToSmallint:
+    """Tests for 0001_enum_columns_to_smallint.sql."""
+
+    def test_backfill_codes_match_small_int_enum(self):
+        """Test that every CASE maps enum names to the codes SmallIntEnum reads back."""
+        script = (MIGRATIONS_DIR / "0001_enum_columns_to_smallint.sql").read_text()
+
+        for column, enum_class, occurrences in (
+            ("state", ReviewState, 2),
+            ("decision", ReviewDecision, 1),
+            ("rule_type", RuleType, 1),
+        ):
+            expected = {member.name: code for code, member in enumerate(enum_class)}
+            assert _case_codes(script, column) == [expected] * occurrences
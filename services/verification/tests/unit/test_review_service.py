@@ -2,8 +2,19 @@
 
 import pytest
 import uuid
+from contextlib import contextmanager
+from functools import partial
+from types import SimpleNamespace
+from sqlalchemy import event
+from app.adapters import PostgresResultDecisionRepository, PostgresReviewRepository, single_commit
 from app.services import ReviewService
-from app.models import Review, ReviewState, ResultDecision
+from app.services.review_service import ResultStatus, SampleStatus
+from app.exceptions import (
+    InvalidReviewDecisionError,
+    ResultNotFoundError,
+    ReviewStateTransitionError,
+)
+from app.models import Review, ReviewDecision, ReviewState, ResultDecision
 from app.ports import (
     IReviewRepository,
     IResultDecisionRepository,
@@ -12,6 +23,73 @@ from app.ports import (
 TEST_TENANT_ID = "test-tenant-123"
 
 
+class FakeResultRepository:
+    """Result repository stand-in that records the calls made to it."""
+
+    def __init__(self, results):
+        self.results = {r.id: r for r in results}
+        self.calls = []
+
+    def get_by_id(self, result_id, tenant_id):
+        self.calls.append("get_by_id")
+        return self.results.get(result_id)
+
+    def list_by_sample(self, sample_id, tenant_id):
+        self.calls.append("list_by_sample")
+        return [r for r in self.results.values() if r.sample_id == sample_id]
+
+    def list_by_sample_and_status(self, sample_id, tenant_id, statuses):
+        self.calls.append("list_by_sample_and_status")
+        return [
+            r for r in self.results.values()
+            if r.sample_id == sample_id and r.verification_status in statuses
+        ]
+
+    def count_by_sample_and_status(self, sample_id, tenant_id, status):
+        self.calls.append("count_by_sample_and_status")
+        return sum(
+            1 for r in self.results.values()
+            if r.sample_id == sample_id and r.verification_status == status
+        )
+
+    def exists_in_sample(self, result_id, sample_id, tenant_id):
+        self.calls.append("exists_in_sample")
+        result = self.results.get(result_id)
+        return result is not None and result.sample_id == sample_id
+
+    def update_verification_status(self, result_id, tenant_id, status, method=None):
+        self.calls.append("update_verification_status")
+        self.results[result_id].verification_status = status
+        return self.results[result_id]
+
+    def update_verification_status_bulk(self, result_ids, tenant_id, status, method=None):
+        self.calls.append("update_verification_status_bulk")
+        for result_id in result_ids:
+            self.results[result_id].verification_status = status
+        return len(result_ids)
+
+
+class FakeSampleRepository:
+    """Sample repository stand-in holding sample statuses."""
+
+    def __init__(self, sample_ids):
+        self.statuses = dict.fromkeys(sample_ids, SampleStatus.NEEDS_REVIEW)
+        self.calls = []
+
+    def get_by_id(self, sample_id, tenant_id):
+        self.calls.append("get_by_id")
+        if sample_id not in self.statuses:
+            return None
+        return SimpleNamespace(id=sample_id, status=self.statuses[sample_id])
+
+    def update_status(self, sample_id, tenant_id, status):
+        self.calls.append("update_status")
+        if sample_id not in self.statuses:
+            return False
+        self.statuses[sample_id] = status
+        return True
+
+
 class TestReviewService:
     """Tests for ReviewService review workflow."""
 
@@ -389,3 +467,302 @@ class TestReviewService:
         assert r1.id not in tenant2_ids
         assert r2.id in tenant2_ids
         assert r2.id not in tenant1_ids
+
+
+class TestReviewServiceSampleDecisions:
+    """Tests for sample-level and result-level review decisions."""
+
+    SAMPLE_ID = "sample-1"
+
+    @pytest.fixture
+    def results(self):
+        return FakeResultRepository([
+            SimpleNamespace(
+                id=f"result-{i}", sample_id=self.SAMPLE_ID, verification_status=status
+            )
+            for i, status in enumerate([
+                ResultStatus.NEEDS_REVIEW,
+                ResultStatus.NEEDS_REVIEW,
+                ResultStatus.NEEDS_REVIEW,
+                ResultStatus.VERIFIED,
+            ])
+        ])
+
+    @pytest.fixture
+    def samples(self):
+        return FakeSampleRepository([self.SAMPLE_ID])
+
+    @pytest.fixture
+    def service(
+        self,
+        review_repository: IReviewRepository,
+        result_decision_repository: IResultDecisionRepository,
+        results,
+        samples,
+    ):
+        """Create a ReviewService over the fake LIS repositories."""
+        return ReviewService(
+            review_repository=review_repository,
+            result_decision_repository=result_decision_repository,
+            result_repository=results,
+            sample_repository=samples,
+        )
+
+    def test_approve_sample_updates_results_in_one_call(self, service, results, samples):
+        """Test that approving a sample records every decision with bulk writes."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        service.approve_sample(review.id, TEST_TENANT_ID, user_id="user-1")
+
+        decisions = service.result_decision_repository.get_by_review(review.id, TEST_TENANT_ID)
+        assert sorted(d.result_id for d in decisions) == ["result-0", "result-1", "result-2"]
+        assert results.calls.count("update_verification_status_bulk") == 1
+        assert "update_verification_status" not in results.calls
+        assert "list_by_sample" not in results.calls
+        assert all(r.verification_status == ResultStatus.VERIFIED for r in results.results.values())
+        assert samples.statuses[self.SAMPLE_ID] == SampleStatus.VERIFIED
+        assert samples.calls == ["get_by_id", "update_status"]
+
+    def test_last_result_decision_completes_review(self, service, results, samples):
+        """Test that deciding the last pending result completes the review from counts."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        service.approve_result(review.id, "result-0", TEST_TENANT_ID, user_id="user-1")
+        service.reject_result(review.id, "result-1", TEST_TENANT_ID, user_id="user-1")
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.PENDING
+
+        service.approve_result(review.id, "result-2", TEST_TENANT_ID, user_id="user-1")
+
+        completed = service.review_repository.get_by_id(review.id, TEST_TENANT_ID)
+        assert completed.state == ReviewState.APPROVED
+        assert completed.decision == ReviewDecision.PARTIAL
+        assert samples.statuses[self.SAMPLE_ID] == SampleStatus.VERIFIED
+        assert "list_by_sample" not in results.calls
+        assert "get_by_id" not in results.calls
+
+    def test_result_decision_checks_result_sample(self, service, results):
+        """Test that deciding a missing or foreign result raises the matching error."""
+        results.results["other"] = SimpleNamespace(
+            id="other", sample_id="sample-2", verification_status=ResultStatus.NEEDS_REVIEW
+        )
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        with pytest.raises(ResultNotFoundError):
+            service.approve_result(review.id, "missing", TEST_TENANT_ID, user_id="user-1")
+        with pytest.raises(InvalidReviewDecisionError):
+            service.reject_result(review.id, "other", TEST_TENANT_ID, user_id="user-1")
+
+    def test_completion_check_can_run_after_the_decision(self, service):
+        """Test that a deferred completion check completes the review once run."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        scheduled = []
+
+        for result_id in ("result-0", "result-1", "result-2"):
+            service.approve_result(
+                review.id, result_id, TEST_TENANT_ID, user_id="user-1",
+                schedule=lambda *task: scheduled.append(task),
+            )
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.PENDING
+
+        for func, *args in scheduled:
+            func(*args)
+
+        completed = service.review_repository.get_by_id(review.id, TEST_TENANT_ID)
+        assert completed.state == ReviewState.APPROVED
+        assert completed.decision == ReviewDecision.APPROVE_ALL
+
+    def test_deferred_completion_check_runs_on_its_own_service(self, service, results, samples):
+        """Test that a deferred completion check uses a service from the factory, not the request's."""
+        opened = []
+
+        @contextmanager
+        def open_service():
+            completion_service = ReviewService(
+                review_repository=service.review_repository,
+                result_decision_repository=service.result_decision_repository,
+                result_repository=results,
+                sample_repository=samples,
+            )
+            opened.append(completion_service)
+            yield completion_service
+
+        service.completion_service_factory = open_service
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        scheduled = []
+        for result_id in ("result-0", "result-1", "result-2"):
+            service.approve_result(
+                review.id, result_id, TEST_TENANT_ID, user_id="user-1",
+                schedule=lambda *task: scheduled.append(task),
+            )
+
+        for func, *args in scheduled:
+            func(*args)
+
+        assert len(opened) == 1
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.APPROVED
+
+    def test_sweep_completes_review_whose_completion_check_was_lost(self, service):
+        """Test that the stalled review sweep completes a decided review left open."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        for result_id in ("result-0", "result-1", "result-2"):
+            service.approve_result(
+                review.id, result_id, TEST_TENANT_ID, user_id="user-1",
+                schedule=lambda *args: None,  # Never run
+            )
+        page = service.list_review_queue(TEST_TENANT_ID)
+        assert [r.state for r in page.reviews] == [ReviewState.PENDING.value]
+
+        assert service.complete_stalled_reviews() == 1
+
+        completed = service.review_repository.get_by_id(review.id, TEST_TENANT_ID)
+        assert completed.state == ReviewState.APPROVED
+        assert completed.decision == ReviewDecision.APPROVE_ALL
+
+    def test_sweep_leaves_undecided_and_escalated_reviews_open(self, service, results, samples):
+        """Test that the sweep never completes a review without decisions or an escalated one."""
+        for result in results.results.values():
+            result.verification_status = ResultStatus.VERIFIED
+        samples.statuses["sample-2"] = SampleStatus.NEEDS_REVIEW
+        undecided = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        escalated = service.create_review(TEST_TENANT_ID, "sample-2")
+        service.escalate_review(escalated.id, TEST_TENANT_ID, user_id="user-1", reason="Check")
+
+        assert service.complete_stalled_reviews(batch_size=1) == 0
+
+        assert service.review_repository.get_by_id(undecided.id, TEST_TENANT_ID).state == ReviewState.PENDING
+        assert service.review_repository.get_by_id(escalated.id, TEST_TENANT_ID).state == ReviewState.ESCALATED
+        assert samples.statuses == {
+            self.SAMPLE_ID: SampleStatus.NEEDS_REVIEW, "sample-2": SampleStatus.NEEDS_REVIEW
+        }
+
+    def test_sweep_resyncs_pending_counter(self, service):
+        """Test that the sweep resyncs a counter that ran out while results still need review."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        service.review_repository.set_pending_results(review.id, TEST_TENANT_ID, 0)
+
+        assert service.complete_stalled_reviews() == 0
+
+        stored = service.review_repository.get_by_id(review.id, TEST_TENANT_ID)
+        assert stored.state == ReviewState.PENDING
+        assert stored.pending_results_count == 3
+
+    def test_sweep_completes_review_whose_result_left_review_undecided(self, service, results):
+        """Test that a review is completed once its last pending result leaves review without a decision."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        service.approve_result(review.id, "result-0", TEST_TENANT_ID, user_id="user-1")
+        service.approve_result(review.id, "result-1", TEST_TENANT_ID, user_id="user-1")
+        results.results["result-2"].verification_status = ResultStatus.VERIFIED  # LIS correction
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).pending_results_count == 1
+
+        assert service.complete_stalled_reviews() == 1
+
+        completed = service.review_repository.get_by_id(review.id, TEST_TENANT_ID)
+        assert completed.state == ReviewState.APPROVED
+        assert completed.pending_results_count == 0
+
+    def test_empty_queue_page_only_counts(self, service, monkeypatch):
+        """Test that a zero-size queue page returns the total without listing reviews."""
+        service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("reviews listed for an empty page")
+
+        monkeypatch.setattr(service.review_repository, "list_by_tenant", fail)
+        page = service.list_review_queue(TEST_TENANT_ID, limit=0)
+
+        assert page.reviews == []
+        assert page.total == 1
+        with pytest.raises(ValueError):
+            service.list_review_queue(TEST_TENANT_ID, skip=-1)
+
+    def test_pending_results_skip_decision_counts(self, service, monkeypatch):
+        """Test that a decision leaving results pending doesn't count the decisions."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        def fail(*args):
+            raise AssertionError("decisions counted while results are pending")
+
+        monkeypatch.setattr(service.result_decision_repository, "count_by_review_grouped", fail)
+        service.approve_result(review.id, "result-0", TEST_TENANT_ID, user_id="user-1")
+
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.PENDING
+
+    def test_pending_counter_skips_result_counts(self, service, results):
+        """Test that results are only counted again once the review's counter runs out."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        assert review.pending_results_count == 3
+
+        service.approve_result(review.id, "result-0", TEST_TENANT_ID, user_id="user-1")
+        service.approve_result(review.id, "result-1", TEST_TENANT_ID, user_id="user-1")
+        assert results.calls.count("count_by_sample_and_status") == 1
+
+        service.approve_result(review.id, "result-2", TEST_TENANT_ID, user_id="user-1")
+        assert results.calls.count("count_by_sample_and_status") == 2
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.APPROVED
+
+    def test_entities_loaded_once_per_request(self, service, samples):
+        """Test that a review loaded earlier in the request is reused."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        service.approve_sample(review.id, TEST_TENANT_ID, user_id="user-1")
+
+        assert service.request_cache.hits == 1
+        assert service.get_review(review.id, TEST_TENANT_ID).state == ReviewState.APPROVED.value
+
+    def test_sample_decision_commits_once(self, db_session, results, samples):
+        """Test that a sample-level decision is written in a single transaction."""
+        service = ReviewService(
+            review_repository=PostgresReviewRepository(db_session),
+            result_decision_repository=PostgresResultDecisionRepository(db_session),
+            result_repository=results,
+            sample_repository=samples,
+            unit_of_work=partial(single_commit, db_session),
+        )
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        commits = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+
+        service.reject_sample(review.id, TEST_TENANT_ID, user_id="user-1")
+
+        assert len(commits) == 1
+        assert service.review_repository.get_by_id(review.id, TEST_TENANT_ID).state == ReviewState.REJECTED
+
+    def test_failed_sample_decision_rolls_back(self, db_session, results, samples):
+        """Test that no decision is kept when a later write of the workflow fails."""
+        service = ReviewService(
+            review_repository=PostgresReviewRepository(db_session),
+            result_decision_repository=PostgresResultDecisionRepository(db_session),
+            result_repository=results,
+            sample_repository=samples,
+            unit_of_work=partial(single_commit, db_session),
+        )
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        def fail(*args):
+            raise RuntimeError("LIS unavailable")
+
+        samples.update_status = fail
+        with pytest.raises(RuntimeError):
+            service.approve_sample(review.id, TEST_TENANT_ID, user_id="user-1")
+
+        assert service.result_decision_repository.get_by_review(review.id, TEST_TENANT_ID) == []
+        stored = PostgresReviewRepository(db_session).get_by_id(review.id, TEST_TENANT_ID)
+        assert stored.state == ReviewState.PENDING
+
+
+    def test_escalated_review_cannot_be_escalated_again(self, service):
+        """Test that state transitions outside the transition table are refused."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+        service.escalate_review(review.id, TEST_TENANT_ID, user_id="user-1", reason="Unusual")
+
+        with pytest.raises(ReviewStateTransitionError):
+            service.escalate_review(review.id, TEST_TENANT_ID, user_id="user-1", reason="Again")
+
+    def test_terminal_transition_stamps_one_time(self, service):
+        """Test that completing a review submits and completes it at the same instant."""
+        review = service.create_review(TEST_TENANT_ID, self.SAMPLE_ID)
+
+        approved = service.approve_sample(review.id, TEST_TENANT_ID, user_id="user-1")
+
+        assert approved.completed_at is not None
+        assert approved.submitted_at == approved.completed_at
@@ -0,0 +1,73 @@
+"""Unit tests for startup schema creation."""
+
+import uuid
+
+from sqlmodel import Session, SQLModel
+
+from app import dependencies
+from app.adapters import PostgresReviewRepository
+from app.config import AppSettings
+from app.models import Review, ReviewState, ReviewStateCounter
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+class TestEnsureSchema:
+    """Tests for ensure_schema."""
+
+    def test_new_counter_table_is_backfilled_from_existing_reviews(self, tmp_path, monkeypatch):
+        """Test that creating the counter table counts the reviews already stored."""
+        monkeypatch.setattr(dependencies, "_schema_ready", False)
+        settings = AppSettings(
+            environment="test",
+            database_url=f"sqlite:///{tmp_path / 'verification.db'}",
+            use_real_database=True,
+        )
+        engine = dependencies.get_engine(settings)
+        SQLModel.metadata.create_all(engine, tables=[Review.__table__])
+        with Session(engine) as session:
+            for state in (ReviewState.PENDING, ReviewState.PENDING, ReviewState.APPROVED):
+                session.add(Review(
+                    id=str(uuid.uuid4()),
+                    tenant_id=TEST_TENANT_ID,
+                    sample_id=str(uuid.uuid4()),
+                    state=state,
+                ))
+            session.commit()
+
+        dependencies.ensure_schema(settings)
+
+        with Session(engine) as session:
+            repo = PostgresReviewRepository(session)
+            assert repo.count_by_tenant(TEST_TENANT_ID) == 3
+            assert repo.count_by_tenant(TEST_TENANT_ID, state=ReviewState.PENDING) == 2
+            assert session.get(ReviewStateCounter, (TEST_TENANT_ID, ReviewState.APPROVED)).count == 1
+
+    def test_counters_not_rebuilt_without_admin_role_under_row_level_security(
+        self, tmp_path, monkeypatch, caplog
+    ):
+        """Test that a rebuild which could only see the bound tenant's rows is skipped loudly."""
+        monkeypatch.setattr(dependencies, "_schema_ready", False)
+        settings = AppSettings(
+            environment="test",
+            database_url=f"sqlite:///{tmp_path / 'verification.db'}",
+            use_real_database=True,
+            db_row_level_security=True,
+        )
+        engine = dependencies.get_engine(settings)
+        SQLModel.metadata.create_all(engine, tables=[Review.__table__])
+        with Session(engine) as session:
+            session.add(Review(
+                id=str(uuid.uuid4()),
+                tenant_id=TEST_TENANT_ID,
+                sample_id=str(uuid.uuid4()),
+                state=ReviewState.PENDING,
+            ))
+            session.commit()
+
+        dependencies.ensure_schema(settings)
+
+        with Session(engine) as session:
+            assert session.get(ReviewStateCounter, (TEST_TENANT_ID, ReviewState.PENDING)) is None
+        assert "database_admin_url is not set" in caplog.text
+        assert dependencies.complete_stalled_reviews(settings) == 0
@@ -2,8 +2,14 @@
 
 import pytest
 import uuid
+from app.cache import TTLCache
 from app.services import SettingsService
 from app.models import AutoVerificationSettings, VerificationRule, RuleType
+from app.exceptions import (
+    SettingsAlreadyExistsError,
+    SettingsNotFoundError,
+    InvalidConfigurationError,
+)
 from app.ports import (
     IAutoVerificationSettingsRepository,
     IVerificationRuleRepository,
@@ -367,3 +373,230 @@ class TestSettingsService:
         assert any(s.test_code == "GLU" for s in tenant1_settings)
         assert any(s.test_code == "WBC" for s in tenant2_settings)
         assert not any(s.test_code == "WBC" for s in tenant1_settings)
+
+
+class TestSettingsServiceCache:
+    """Tests for SettingsService get_settings caching."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an empty settings lookup cache."""
+        return TTLCache(ttl=60)
+
+    @pytest.fixture
+    def service(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+        cache: TTLCache,
+    ):
+        """Create a SettingsService with a settings lookup cache."""
+        return SettingsService(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+            settings_cache=cache,
+        )
+
+    def test_repeated_get_is_served_from_cache(self, service, cache):
+        """Test that a second lookup does not hit the repository."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+        )
+
+        first = service.get_settings(TEST_TENANT_ID, "GLU")
+        second = service.get_settings(TEST_TENANT_ID, "GLU")
+
+        assert second.id == first.id
+        assert cache.hits == 1
+
+    def test_duplicate_create_keeps_cached_settings(self, service, cache):
+        """Test that a rejected duplicate create leaves the cached settings in place."""
+        created = service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+        )
+        service.get_settings(TEST_TENANT_ID, "GLU")
+
+        with pytest.raises(SettingsAlreadyExistsError):
+            service.create_settings(
+                tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose 2"
+            )
+
+        assert service.get_settings(TEST_TENANT_ID, "GLU").id == created.id
+        assert cache.hits == 1
+
+    def test_update_invalidates_cached_settings(self, service):
+        """Test that updates are visible to the next lookup."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+        )
+        service.get_settings(TEST_TENANT_ID, "GLU")
+
+        service.update_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Blood Glucose"
+        )
+
+        assert service.get_settings(TEST_TENANT_ID, "GLU").test_name == "Blood Glucose"
+
+    def test_delete_invalidates_cached_settings(self, service):
+        """Test that deleted settings are no longer returned."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+        )
+        service.get_settings(TEST_TENANT_ID, "GLU")
+
+        service.delete_settings(TEST_TENANT_ID, "GLU")
+
+        with pytest.raises(SettingsNotFoundError):
+            service.get_settings(TEST_TENANT_ID, "GLU")
+
+
+class TestSettingsServiceUpdate:
+    """Tests for SettingsService partial settings updates."""
+
+    @pytest.fixture
+    def service(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+    ):
+        """Create a SettingsService with parametrized repositories."""
+        return SettingsService(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+        )
+
+    def test_partial_range_update_is_validated_against_stored_values(self, service):
+        """Test that one range bound is checked against the stored other bound."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose",
+            reference_range_low=70.0, reference_range_high=100.0,
+        )
+
+        with pytest.raises(InvalidConfigurationError):
+            service.update_settings(
+                tenant_id=TEST_TENANT_ID, test_code="GLU", reference_range_low=120.0
+            )
+
+        updated = service.update_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", reference_range_low=60.0
+        )
+        assert (updated.reference_range_low, updated.reference_range_high) == (60.0, 100.0)
+
+    def test_critical_range_bounds_are_checked(self, service):
+        """Test that an inverted critical range is rejected on update."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose",
+            critical_range_low=40.0, critical_range_high=400.0,
+        )
+
+        with pytest.raises(InvalidConfigurationError, match="Critical range low"):
+            service.update_settings(
+                tenant_id=TEST_TENANT_ID, test_code="GLU", critical_range_high=30.0
+            )
+
+    def test_update_unknown_test_code(self, service):
+        """Test that updating missing settings raises, with or without range changes."""
+        with pytest.raises(SettingsNotFoundError):
+            service.update_settings(
+                tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+            )
+        with pytest.raises(SettingsNotFoundError):
+            service.update_settings(
+                tenant_id=TEST_TENANT_ID, test_code="GLU", reference_range_low=60.0
+            )
+
+
+class TestSettingsServiceBatchCreate:
+    """Tests for SettingsService batch settings creation."""
+
+    @pytest.fixture
+    def service(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+    ):
+        """Create a SettingsService with parametrized repositories."""
+        return SettingsService(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+        )
+
+    def test_batch_create_skips_existing(self, service):
+        """Test that existing test codes are skipped and new ones created."""
+        service.create_settings(
+            tenant_id=TEST_TENANT_ID, test_code="GLU", test_name="Glucose"
+        )
+
+        created = service.batch_create_settings(TEST_TENANT_ID, [
+            {"test_code": "GLU", "test_name": "Glucose"},
+            {"test_code": "WBC", "test_name": "White Blood Count",
+             "instrument_flags_to_block": ["H", "L"]},
+        ])
+
+        assert [s.test_code for s in created] == ["WBC"]
+        wbc = service.get_settings(TEST_TENANT_ID, "WBC")
+        assert wbc.instrument_flags_to_block == ["H", "L"]
+
+    def test_batch_create_is_all_or_nothing_on_invalid_entry(self, service):
+        """Test that one invalid entry prevents the whole batch from being written."""
+        with pytest.raises(InvalidConfigurationError):
+            service.batch_create_settings(TEST_TENANT_ID, [
+                {"test_code": "GLU", "test_name": "Glucose"},
+                {"test_code": "WBC", "test_name": "White Blood Count",
+                 "reference_range_low": 10.0, "reference_range_high": 5.0},
+            ])
+
+        with pytest.raises(SettingsNotFoundError):
+            service.get_settings(TEST_TENANT_ID, "GLU")
+
+
+class TestSettingsServiceRules:
+    """Tests for SettingsService rule toggling."""
+
+    @pytest.fixture
+    def service(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+    ):
+        """Create a SettingsService with one rule of each type for the tenant."""
+        for priority, rule_type in enumerate(RuleType, start=1):
+            verification_rule_repository.create(VerificationRule(
+                tenant_id=TEST_TENANT_ID, rule_type=rule_type, priority=priority
+            ))
+        return SettingsService(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+        )
+
+    def test_toggle_rule_looks_up_only_that_rule(self, service, monkeypatch):
+        """Test that enabling and disabling a rule don't load the tenant's other rules."""
+        def fail(*args):
+            raise AssertionError("all tenant rules loaded")
+
+        monkeypatch.setattr(service.rules_repository, "get_by_tenant", fail)
+
+        assert service.disable_rule(TEST_TENANT_ID, "delta_check").enabled is False
+        assert service.enable_rule(TEST_TENANT_ID, "delta_check").enabled is True
+
+    def test_toggle_unknown_rule_type(self, service):
+        """Test that an unknown rule type is rejected with the valid types listed."""
+        with pytest.raises(InvalidConfigurationError, match="reference_range, critical_range"):
+            service.enable_rule(TEST_TENANT_ID, "no_such_rule")
+
+    def test_initialize_default_rules_creates_them_once(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+    ):
+        """Test that default rules are created in one batch and not created again."""
+        service = SettingsService(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+        )
+
+        created = service.initialize_default_rules(TEST_TENANT_ID)
+        again = service.initialize_default_rules(TEST_TENANT_ID)
+
+        assert [r.rule_type for r in created] == [r["rule_type"] for r in SettingsService.DEFAULT_RULES]
+        assert [r.id for r in again] == [r.id for r in created]
@@ -0,0 +1,38 @@
+"""Unit tests for per-tenant compiled statement caches."""
+
+from app.adapters import PostgresVerificationRuleRepository, TenantCompiledCaches
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+class TestTenantCompiledCaches:
+    """Tests for TenantCompiledCaches partitioning and bounds."""
+
+    def test_same_tenant_reuses_its_cache(self):
+        """Test that a tenant always gets the same compiled cache."""
+        caches = TenantCompiledCaches()
+
+        first = caches.execution_options(TEST_TENANT_ID)["compiled_cache"]
+        second = caches.execution_options(TEST_TENANT_ID)["compiled_cache"]
+
+        assert first is second
+        assert caches.execution_options("other-tenant")["compiled_cache"] is not first
+
+    def test_least_recently_used_tenants_are_dropped(self):
+        """Test that the number of tenant caches kept stays bounded."""
+        caches = TenantCompiledCaches(max_tenants=4)
+
+        for i in range(50):
+            caches.execution_options(f"tenant-{i}")
+
+        assert len(caches._tenants) <= 6  # LRUCache prunes at capacity * 1.5
+
+    def test_repository_statements_are_compiled_into_tenant_cache(self, db_session):
+        """Test that repository queries populate only the calling tenant's cache."""
+        caches = TenantCompiledCaches()
+        repo = PostgresVerificationRuleRepository(db_session, compiled_caches=caches)
+
+        repo.get_by_tenant(TEST_TENANT_ID)
+
+        assert len(caches.execution_options(TEST_TENANT_ID)["compiled_cache"]) > 0
+        assert len(caches.execution_options("other-tenant")["compiled_cache"]) == 0
@@ -0,0 +1,73 @@
+"""Unit tests for per-tenant connection leases."""
+
+import asyncio
+
+import pytest
+
+from app.adapters import TenantConnectionLeases, TenantPoolStats
+from app.exceptions import TenantConnectionLimitError
+from app.main import verification_exception_handler
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+class TestTenantConnectionLeases:
+    """Tests for TenantConnectionLeases limits and queueing."""
+
+    @pytest.mark.asyncio
+    async def test_tenant_at_limit_times_out_without_blocking_others(self):
+        """Test that one tenant's exhausted slots don't affect other tenants."""
+        leases = TenantConnectionLeases(max_per_tenant=2, timeout=0.05)
+        await leases.acquire(TEST_TENANT_ID)
+        await leases.acquire(TEST_TENANT_ID)
+
+        with pytest.raises(TenantConnectionLimitError):
+            await leases.acquire(TEST_TENANT_ID)
+        await leases.acquire("other-tenant")
+
+        assert leases.stats() == [
+            TenantPoolStats("other-tenant", leased=1, waiting=0, max_leases=2),
+            TenantPoolStats(TEST_TENANT_ID, leased=2, waiting=0, max_leases=2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_released_slot_goes_to_waiting_request(self):
+        """Test that a queued request gets the slot as soon as one is released."""
+        leases = TenantConnectionLeases(max_per_tenant=1, timeout=5)
+        await leases.acquire(TEST_TENANT_ID)
+        waiter = asyncio.create_task(leases.acquire(TEST_TENANT_ID))
+        await asyncio.sleep(0)
+        assert leases.stats()[0].waiting == 1
+
+        leases.release(TEST_TENANT_ID)
+        await asyncio.wait_for(waiter, timeout=5)
+
+        assert leases.stats() == [TenantPoolStats(TEST_TENANT_ID, leased=1, waiting=0, max_leases=1)]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_keep_a_slot(self):
+        """Test that a request cancelled while queued leaves no lease behind."""
+        leases = TenantConnectionLeases(max_per_tenant=1, timeout=5)
+        await leases.acquire(TEST_TENANT_ID)
+        waiter = asyncio.create_task(leases.acquire(TEST_TENANT_ID))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        leases.release(TEST_TENANT_ID)
+
+        assert leases.stats() == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_answered_with_retryable_503(self):
+        """Test that running out of leases maps to 503 Service Unavailable with Retry-After."""
+        leases = TenantConnectionLeases(max_per_tenant=1, timeout=0.01)
+        await leases.acquire(TEST_TENANT_ID)
+
+        with pytest.raises(TenantConnectionLimitError) as exc_info:
+            await leases.acquire(TEST_TENANT_ID)
+        response = await verification_exception_handler(None, exc_info.value)
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
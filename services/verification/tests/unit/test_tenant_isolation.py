@@ -0,0 +1,28 @@
+"""Unit tests for row-level security tenant scoping."""
+
+from app.adapters import PostgresReviewRepository, bind_session_tenant
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+class TestTenantIsolation:
+    """Tests for session tenant binding."""
+
+    def test_repository_calls_scope_session_to_tenant(self, db_session):
+        """Test that a repository query binds the session to the queried tenant."""
+        repo = PostgresReviewRepository(db_session)
+
+        repo.list_by_tenant(TEST_TENANT_ID)
+        assert db_session.info["tenant_id"] == TEST_TENANT_ID
+
+        repo.get_by_id("missing", "other-tenant")
+        assert db_session.info["tenant_id"] == "other-tenant"
+
+    def test_binding_outside_postgres_issues_no_sql(self, db_session):
+        """Test that binding a tenant on SQLite only records it on the session."""
+        db_session.begin()
+
+        bind_session_tenant(db_session, TEST_TENANT_ID)
+
+        assert db_session.info["tenant_id"] == TEST_TENANT_ID
+        db_session.rollback()
@@ -0,0 +1,74 @@
+"""Unit tests for bearer token validation."""
+
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.dependencies import _decode_token, get_settings, get_token_claims
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+def _make_token(**overrides) -> str:
+    """Sign a token the way the Platform Service does."""
+    settings = get_settings()
+    claims = {
+        "sub": "user-1",
+        "tenant_id": TEST_TENANT_ID,
+        "role": "admin",
+        "exp": int(time.time()) + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+
+class TestTokenClaims:
+    """Tests for get_token_claims decoding, caching and expiry."""
+
+    def setup_method(self):
+        _decode_token.cache_clear()
+
+    def test_valid_token_returns_claims(self):
+        """Test that a valid token yields its tenant and user claims."""
+        claims = get_token_claims(_make_token())
+
+        assert claims["tenant_id"] == TEST_TENANT_ID
+        assert claims["sub"] == "user-1"
+
+    def test_same_token_is_decoded_once(self):
+        """Test that repeated lookups of one token hit the decode cache."""
+        token = _make_token()
+
+        get_token_claims(token)
+        get_token_claims(token)
+
+        assert _decode_token.cache_info().hits == 1
+
+    def test_cached_token_is_rejected_after_expiry(self):
+        """Test that a cached token stops being accepted once it expires."""
+        token = _make_token(exp=int(time.time()) + 1)
+        get_token_claims(token)
+
+        time.sleep(1.1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_token_claims(token)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.parametrize("token", [
+        "",
+        "not-a-jwt",
+        jwt.encode({"tenant_id": TEST_TENANT_ID}, "wrong-secret", algorithm="HS256"),
+    ])
+    def test_invalid_token_is_rejected(self, token):
+        """Test that missing, malformed and wrongly signed tokens are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            get_token_claims(token)
+        assert exc_info.value.status_code == 401
+
+    def test_token_without_tenant_is_rejected(self):
+        """Test that a token lacking the tenant_id claim is rejected."""
+        with pytest.raises(HTTPException):
+            get_token_claims(_make_token(tenant_id=None))
@@ -0,0 +1,55 @@
+"""Unit tests for grouping repository writes into one transaction."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.adapters import PostgresReviewRepository, single_commit
+from app.models import Review, ReviewState
+
+TEST_TENANT_ID = "test-tenant-123"
+
+
+def _review() -> Review:
+    return Review(
+        id=str(uuid.uuid4()),
+        tenant_id=TEST_TENANT_ID,
+        sample_id=str(uuid.uuid4()),
+        state=ReviewState.PENDING,
+    )
+
+
+class TestSingleCommit:
+    """Tests for single_commit."""
+
+    def test_nested_block_joins_outer_transaction(self, db_session):
+        """Test that writes in a nested block are committed once, by the outer block."""
+        repo = PostgresReviewRepository(db_session)
+        commits = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+
+        with single_commit(db_session):
+            repo.create(_review())
+            with single_commit(db_session):
+                repo.create(_review())
+            assert commits == []
+
+        assert len(commits) == 1
+        assert repo.count_by_tenant(TEST_TENANT_ID) == 2
+
+    def test_repositories_commit_again_after_rollback(self, db_session):
+        """Test that a rolled-back block leaves later repository writes committing on their own."""
+        repo = PostgresReviewRepository(db_session)
+
+        with pytest.raises(RuntimeError):
+            with single_commit(db_session):
+                repo.create(_review())
+                raise RuntimeError("LIS unavailable")
+
+        commits = []
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+        repo.create(_review())
+
+        assert len(commits) == 1
+        assert repo.count_by_tenant(TEST_TENANT_ID) == 1
@@ -1,12 +1,20 @@
 """Unit tests for VerificationEngine service."""
 
 import pytest
-from app.services import VerificationEngine
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from app.cache import TTLCache
+from app.adapters import (
+    InMemoryAutoVerificationSettingsRepository,
+    InMemoryVerificationRuleRepository,
+)
+from app.services import SettingsService, VerificationEngine
 from app.models import AutoVerificationSettings, VerificationRule, RuleType
 from app.ports import (
     IAutoVerificationSettingsRepository,
     IVerificationRuleRepository,
 )
+from app.ports.verification_engine import ResultData
 
 TEST_TENANT_ID = "test-tenant-123"
 TEST_TEST_CODE = "GLU"
@@ -42,7 +50,7 @@ class TestVerificationEngine:
             reference_range_high=100.0,
             critical_range_low=40.0,
             critical_range_high=400.0,
-            instrument_flags_to_block='["C", "H"]',
+            instrument_flags_to_block=["C", "H"],
             delta_check_threshold_percent=10.0,
             delta_check_lookback_days=30,
         )
@@ -369,3 +377,180 @@ class TestVerificationEngine:
         assert decisions[0].passed is True
         assert decisions[1].passed is False
         assert decisions[2].passed is False
+
+
+class TestVerificationEngineBatch:
+    """Tests for VerificationEngine.verify_batch."""
+
+    @pytest.fixture
+    def engine(
+        self,
+        auto_verification_settings_repository: IAutoVerificationSettingsRepository,
+        verification_rule_repository: IVerificationRuleRepository,
+    ):
+        """Create a VerificationEngine with range and flag rules configured."""
+        auto_verification_settings_repository.create(AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID,
+            test_code=TEST_TEST_CODE,
+            test_name="Glucose",
+            reference_range_low=70.0,
+            reference_range_high=100.0,
+            critical_range_low=40.0,
+            critical_range_high=400.0,
+            instrument_flags_to_block=["C"],
+        ))
+        for priority, rule_type in enumerate(
+            [RuleType.CRITICAL_RANGE, RuleType.REFERENCE_RANGE, RuleType.INSTRUMENT_FLAG]
+        ):
+            verification_rule_repository.create(VerificationRule(
+                tenant_id=TEST_TENANT_ID, rule_type=rule_type, priority=priority
+            ))
+        verification_rule_repository.create(VerificationRule(
+            tenant_id=TEST_TENANT_ID, rule_type=RuleType.DELTA_CHECK, enabled=False
+        ))
+        return VerificationEngine(
+            settings_repository=auto_verification_settings_repository,
+            rules_repository=verification_rule_repository,
+        )
+
+    @staticmethod
+    def _result(result_id, value, test_code=TEST_TEST_CODE, lis_flags=None):
+        return ResultData(
+            test_code=test_code,
+            value=value,
+            unit="mg/dL",
+            lis_flags=lis_flags,
+            sample_id="sample-1",
+            result_id=result_id,
+        )
+
+    def test_batch_decisions_match_single_verification(self, engine):
+        """Test that each batch decision matches verifying the result on its own."""
+        results = [
+            self._result("normal", "85"),
+            self._result("high", "150"),
+            self._result("critical", "450"),
+            self._result("flagged", "85", lis_flags="C"),
+            self._result("text", "hemolyzed"),
+        ]
+
+        decisions = engine.verify_batch(results, TEST_TENANT_ID)
+
+        assert decisions["normal"].can_auto_verify
+        assert decisions["high"].failed_rules == (RuleType.REFERENCE_RANGE.value,)
+        assert decisions["critical"].failed_rules == (RuleType.CRITICAL_RANGE.value,)
+        assert decisions["flagged"].failed_rules == (RuleType.INSTRUMENT_FLAG.value,)
+        assert decisions["text"].failed_rules == (RuleType.CRITICAL_RANGE.value,)
+        for result in results:
+            assert decisions[result.result_id] == engine.verify_result(result, TEST_TENANT_ID)
+
+    def test_batch_marks_results_without_settings(self, engine):
+        """Test that results for unconfigured tests cannot be auto-verified."""
+        decisions = engine.verify_batch([self._result("wbc", "5", test_code="WBC")], TEST_TENANT_ID)
+
+        assert not decisions["wbc"].can_auto_verify
+        assert decisions["wbc"].failed_rules == ("settings_missing",)
+
+    def test_cached_lookups_skip_repositories(self, engine):
+        """Test that settings and rules are read once and then served from the caches."""
+        cached_engine = VerificationEngine(
+            settings_repository=engine.settings_repository,
+            rules_repository=engine.rules_repository,
+            settings_cache=TTLCache(),
+            rules_cache=TTLCache(),
+        )
+
+        for _ in range(3):
+            decision = cached_engine.verify_result(self._result("high", "150"), TEST_TENANT_ID)
+            assert decision.failed_rules == (RuleType.REFERENCE_RANGE.value,)
+
+        assert cached_engine.settings_cache.misses == 1
+        assert cached_engine.settings_cache.hits == 2
+        assert cached_engine.rules_cache.misses == 1
+        assert cached_engine.rules_cache.hits == 2
+
+    def test_rule_change_invalidates_cached_rules(self, engine):
+        """Test that disabling a rule through SettingsService reaches the cached engine."""
+        rules_cache = TTLCache()
+        cached_engine = VerificationEngine(
+            settings_repository=engine.settings_repository,
+            rules_repository=engine.rules_repository,
+            rules_cache=rules_cache,
+        )
+        settings_service = SettingsService(
+            settings_repository=engine.settings_repository,
+            rules_repository=engine.rules_repository,
+            rules_cache=rules_cache,
+        )
+        result = self._result("high", "150")
+        assert not cached_engine.verify_result(result, TEST_TENANT_ID).can_auto_verify
+
+        settings_service.disable_rule(TEST_TENANT_ID, RuleType.REFERENCE_RANGE.value)
+
+        assert cached_engine.verify_result(result, TEST_TENANT_ID).can_auto_verify
+
+    def test_batch_fetches_each_sample_history_once(self):
+        """Test that delta checks in a batch share one history lookup per sample."""
+        settings_repo = InMemoryAutoVerificationSettingsRepository()
+        rules_repo = InMemoryVerificationRuleRepository()
+        settings_repo.create(AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID,
+            test_code=TEST_TEST_CODE,
+            test_name="Glucose",
+            delta_check_threshold_percent=20.0,
+        ))
+        rules_repo.create(VerificationRule(tenant_id=TEST_TENANT_ID, rule_type=RuleType.DELTA_CHECK))
+
+        class CountingResultRepository:
+            calls = 0
+
+            def list_by_sample(self, sample_id, tenant_id):
+                CountingResultRepository.calls += 1
+                return [SimpleNamespace(
+                    id="previous",
+                    test_code=TEST_TEST_CODE,
+                    value="100",
+                    created_at=datetime.utcnow() - timedelta(days=1),
+                )]
+
+        engine = VerificationEngine(
+            settings_repository=settings_repo,
+            rules_repository=rules_repo,
+            result_repository=CountingResultRepository(),
+        )
+
+        decisions = engine.verify_batch(
+            [self._result("steady", "110"), self._result("jump", "150")], TEST_TENANT_ID
+        )
+
+        assert decisions["steady"].can_auto_verify
+        assert decisions["jump"].failed_rules == (RuleType.DELTA_CHECK.value,)
+        assert CountingResultRepository.calls == 1
+
+    def test_range_changes_reach_precomputed_bounds(self, engine):
+        """Test that reassigning a range limit refreshes the cached float bounds."""
+        settings = AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID, test_code=TEST_TEST_CODE, test_name="Glucose",
+            reference_range_high=100.0,
+        )
+        assert engine.check_reference_range(150.0, settings)[0] is False
+        assert engine.check_reference_range(-5.0, settings)[0] is True
+
+        settings.reference_range_high = 200.0
+
+        assert settings.reference_bounds == (float("-inf"), 200.0)
+        assert engine.check_reference_range(150.0, settings) == (True, None)
+
+    def test_flags_split_on_any_separator(self, engine):
+        """Test that blocked flags are found whatever separators the LIS uses."""
+        settings = AutoVerificationSettings(
+            tenant_id=TEST_TENANT_ID, test_code=TEST_TEST_CODE, test_name="Glucose",
+            instrument_flags_to_block=["C", "HH"],
+        )
+
+        assert engine.check_instrument_flags("h; c ,N", settings) == (
+            False, "Result has blocked instrument flags: C"
+        )
+        assert engine.check_instrument_flags("H,CC;  L", settings) == (True, None)
+        assert engine.check_instrument_flags(" hh\tC", settings)[1].endswith("HH, C")
+        assert engine.check_instrument_flags(" ,; ", settings) == (True, None)